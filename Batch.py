@@ -0,0 +1,94 @@
+"""Vectorized poker hand evaluation over NumPy arrays of card ids (Card.id). Gives the same strengths as Evaluator. Requires numpy."""
+
+import numpy as np
+
+from . import Evaluator
+
+
+_tables = None
+
+def _get_tables():
+    """Convert Evaluator's tables to arrays the first time they are needed."""
+    global _tables
+    if _tables is None:
+        rank_table = Evaluator.build_rank_table()
+        keys = np.array(sorted(rank_table), dtype=np.int64)
+        strengths = np.array([rank_table[key] for key in keys.tolist()], dtype=np.int32)
+        flush = np.array(Evaluator.flush_table, dtype=np.int32)
+
+        # Ids past 51 (such as Card.NO_CARD) add nothing
+        ids = np.arange(52)
+        card_key = np.zeros(256, dtype=np.int64)
+        card_key[:52] = 5 ** (ids % 13)
+        card_bit = np.zeros(256, dtype=np.int64)
+        card_bit[:52] = np.left_shift(1, ids, dtype=np.int64)
+        _tables = (keys, strengths, flush, card_key, card_bit)
+    return _tables
+
+
+def state(ids):
+    """Base 5 value keys (N,) and CardSet masks (N,) for an (N, k) array of card ids. Ids from 52 to 255 stand for no card."""
+    _, _, _, card_key, card_bit = _get_tables()
+    ids = np.asarray(ids)
+    return card_key[ids].sum(axis=1), np.bitwise_or.reduce(card_bit[ids], axis=1)
+
+def evaluate_state(keys, masks):
+    """Strengths (N,) from value keys (N,) and CardSet masks (N,), as returned by state. The keys and masks of disjoint groups of cards may be added together first."""
+    rank_keys, rank_strengths, flush, _, _ = _get_tables()
+    best = rank_strengths[np.searchsorted(rank_keys, keys)]
+    for suit in range(4):
+        suit_masks = (masks >> (13 * suit)) & 0x1FFF
+        np.maximum(best, flush[suit_masks], out=best)
+    return best
+
+
+def combination_states(ids, k: int):
+    """Value keys and CardSet masks of every k-card combination of the given card ids, in itertools.combinations order."""
+    _, _, _, card_key, card_bit = _get_tables()
+    ids = np.asarray(ids, dtype=np.int64)
+    n = len(ids)
+    if k == 0:
+        return np.zeros(1, dtype=np.int64), np.zeros(1, dtype=np.int64)
+    if k > n:
+        return np.zeros(0, dtype=np.int64), np.zeros(0, dtype=np.int64)
+
+    # Grow combinations one card at a time, remembering the position of each one's last card
+    last = np.arange(n - k + 1)
+    keys = card_key[ids[last]]
+    masks = card_bit[ids[last]]
+    for step in range(1, k):
+        counts = (n - k + step) - last
+        parents = np.repeat(np.arange(len(last)), counts)
+        starts = np.cumsum(counts) - counts
+        last = last[parents] + 1 + np.arange(len(parents)) - starts[parents]
+        keys = keys[parents] + card_key[ids[last]]
+        masks = masks[parents] | card_bit[ids[last]]
+    return keys, masks
+
+def evaluate_batch(ids):
+    """Evaluate an (N, k) integer array of card ids, 5 <= k <= 7, with no card repeated within a row. Raises ValueError if one is.
+
+    Returns
+    -------
+    (numpy.ndarray, numpy.ndarray)
+        The (N,) int32 strengths (comparable with PokerHand.strength) and the (N,) int8 categories (indexes into PokerHands.hand_hierarchy).
+    """
+    ids = np.asarray(ids)
+    if ids.ndim != 2 or not 5 <= ids.shape[1] <= 7:
+        raise ValueError(f"Expected an (N, 5..7) array of card ids, got shape {ids.shape}.")
+    if not np.issubdtype(ids.dtype, np.integer):
+        raise TypeError(f"Card ids must be integers, not {ids.dtype}.")
+    if ids.size and (ids.min() < 0 or ids.max() > 51):
+        raise ValueError("Card ids must be between 0 and 51.")
+    ordered = np.sort(ids, axis=1)
+    repeated = (ordered[:, 1:] == ordered[:, :-1]).any(axis=1)
+    if repeated.any():
+        raise ValueError(f"A card id is repeated in row {int(np.argmax(repeated))}.")
+
+    strengths = evaluate_state(*state(ids))
+    categories = (strengths >> Evaluator.CATEGORY_SHIFT).astype(np.int8)
+    return strengths, categories
+
+def hands_to_ids(hands):
+    """An (N, k) array of card ids for N Hands (or lists of Cards) of k cards each."""
+    return np.array([[card.id for card in getattr(hand, 'cards', hand)] for hand in hands], dtype=np.int8)
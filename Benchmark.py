@@ -0,0 +1,214 @@
+"""Benchmarks for hand evaluation, comparison, and deck operations.
+
+Run as a module, e.g. python -m PlayingCards.Benchmark --output bench.json --baseline baseline.json
+Results are JSON: per benchmark, throughput (operations per second) and percentiles of the per-operation latency across samples.
+With --baseline, benchmarks whose throughput fell by more than --threshold are reported and the exit status is 1.
+"""
+
+import argparse
+import json
+import platform
+import random
+import sys
+import time
+
+from .Card import get_card_dict
+from .Deck import ArrayDeck, Deck
+from .Hand import Hand
+
+
+SEED = 1234
+benchmarks = dict()
+
+def benchmark(name: str):
+    """Register a benchmark setup function. The setup takes a random.Random and returns (function to time, operations per call)."""
+    def register(setup):
+        benchmarks[name] = setup
+        return setup
+    return register
+
+
+def _random_hands(rng, count: int, size: int) -> list:
+    return [Hand(Deck(rng=rng).deal(size)) for i in range(count)]
+
+def _evaluate_setup(size: int, method: str):
+    """Setup for timing a Hand evaluation method on 1000 hands of size cards."""
+    def setup(rng):
+        evaluations = [getattr(hand, method) for hand in _random_hands(rng, 1000, size)]
+        def run():
+            for evaluate in evaluations:
+                evaluate()
+        return run, len(evaluations)
+    return setup
+
+for size in (5, 6, 7):
+    benchmarks[f"evaluate_poker_{size}"] = _evaluate_setup(size, 'evaluate_poker')
+benchmarks["evaluate_poker_histogram_7"] = _evaluate_setup(7, 'evaluate_poker_histogram')
+
+@benchmark("pokerhand_compare")
+def _compare(rng):
+    results = [hand.evaluate_poker() for hand in _random_hands(rng, 1001, 7)]
+    pairs = list(zip(results, results[1:]))
+    def run():
+        for a, b in pairs:
+            a < b
+            a == b
+    return run, 2 * len(pairs)
+
+@benchmark("pokerhand_sort_1000")
+def _sort(rng):
+    results = [hand.evaluate_poker() for hand in _random_hands(rng, 1000, 7)]
+    def run():
+        sorted(results)
+    return run, 1
+
+@benchmark("deck_construct")
+def _deck_construct(rng):
+    def run():
+        for i in range(100):
+            Deck(shuffle=False)
+    return run, 100
+
+@benchmark("deck_shuffle")
+def _deck_shuffle(rng):
+    deck = Deck(rng=rng)
+    def run():
+        for i in range(100):
+            deck.shuffle()
+    return run, 100
+
+@benchmark("deck_draw_9_players")
+def _deck_draw(rng):
+    def run():
+        deck = Deck(rng=rng)
+        for i in range(9):
+            deck.draw(2)
+        deck.draw(5)
+    return run, 1
+
+@benchmark("array_deck_deal_9_players")
+def _array_deck_deal(rng):
+    deck = ArrayDeck(rng=rng)
+    def run():
+        deck.reset()
+        for i in range(9):
+            deck.deal(2)
+        deck.deal(5)
+    return run, 1
+
+@benchmark("get_card_dict")
+def _card_dict(rng):
+    def run():
+        for i in range(100):
+            get_card_dict()
+    return run, 100
+
+
+def percentile(values: list, fraction: float) -> float:
+    """Linearly interpolated percentile of values (0 <= fraction <= 1)."""
+    values = sorted(values)
+    position = (len(values) - 1) * fraction
+    low = int(position)
+    high = min(low + 1, len(values) - 1)
+    return values[low] + (values[high] - values[low]) * (position - low)
+
+def measure(run, operations: int, samples=30, sample_time=0.01) -> dict:
+    """Time run over samples, each long enough to take about sample_time seconds. Returns the result dictionary for one benchmark."""
+    calls = 1
+    while True:
+        start = time.perf_counter()
+        for i in range(calls):
+            run()
+        elapsed = time.perf_counter() - start
+        if elapsed >= sample_time / 2:
+            break
+        calls *= 2
+    calls = max(1, int(calls * sample_time / elapsed))
+
+    latencies = []
+    total = 0.0
+    for i in range(samples):
+        start = time.perf_counter()
+        for j in range(calls):
+            run()
+        elapsed = time.perf_counter() - start
+        total += elapsed
+        latencies.append(elapsed / (calls * operations))
+
+    return {
+        "ops_per_sec": samples * calls * operations / total,
+        "p50_us": percentile(latencies, 0.5) * 1e6,
+        "p90_us": percentile(latencies, 0.9) * 1e6,
+        "p99_us": percentile(latencies, 0.99) * 1e6,
+        "samples": samples,
+        "ops_per_sample": calls * operations
+    }
+
+def run_benchmarks(names=None, samples=30, sample_time=0.01, seed=SEED) -> dict:
+    """Run the named benchmarks (all by default). Every benchmark's inputs come from a random.Random seeded with seed."""
+    results = dict()
+    for name, setup in benchmarks.items():
+        if names and name not in names:
+            continue
+        run, operations = setup(random.Random(f"{seed}:{name}"))
+        results[name] = measure(run, operations, samples, sample_time)
+    return {
+        "meta": {
+            "python": platform.python_version(),
+            "implementation": platform.python_implementation(),
+            "machine": platform.machine(),
+            "seed": seed
+        },
+        "results": results
+    }
+
+
+def compare(current: dict, baseline: dict, threshold=0.1) -> list:
+    """Compare two run_benchmarks outputs. Returns (name, baseline ops/sec, current ops/sec, change) for each benchmark slower by more than threshold."""
+    regressions = []
+    for name, result in current["results"].items():
+        before = baseline["results"].get(name)
+        if before is None:
+            continue
+        change = result["ops_per_sec"] / before["ops_per_sec"] - 1
+        if change < -threshold:
+            regressions.append((name, before["ops_per_sec"], result["ops_per_sec"], change))
+    return regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark hand evaluation, comparison, and deck operations.")
+    parser.add_argument("names", nargs="*", help=f"Benchmarks to run (default all): {', '.join(benchmarks)}")
+    parser.add_argument("--output", help="Write the JSON results to this file instead of stdout.")
+    parser.add_argument("--baseline", help="JSON results of an earlier run to compare against.")
+    parser.add_argument("--threshold", type=float, default=0.1, help="Fractional throughput drop counted as a regression (default 0.1).")
+    parser.add_argument("--samples", type=int, default=30, help="Samples per benchmark (default 30).")
+    parser.add_argument("--sample-time", type=float, default=0.01, help="Approximate seconds per sample (default 0.01).")
+    parser.add_argument("--seed", type=int, default=SEED)
+    args = parser.parse_args(argv)
+
+    unknown = [name for name in args.names if name not in benchmarks]
+    if unknown:
+        parser.error(f"Unknown benchmarks: {', '.join(unknown)}")
+
+    results = run_benchmarks(args.names, args.samples, args.sample_time, args.seed)
+    text = json.dumps(results, indent=2)
+    if args.output:
+        with open(args.output, 'w') as file:
+            file.write(text + '\n')
+    else:
+        print(text)
+
+    if args.baseline:
+        with open(args.baseline) as file:
+            baseline = json.load(file)
+        regressions = compare(results, baseline, args.threshold)
+        for name, before, after, change in regressions:
+            print(f"REGRESSION {name}: {before:,.0f} -> {after:,.0f} ops/sec ({change:.1%})", file=sys.stderr)
+        if regressions:
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
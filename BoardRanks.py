@@ -0,0 +1,139 @@
+"""Every two card holding ranked on one board. Requires numpy.
+
+A BoardRanking evaluates all live holdings (the 1326 two card combos minus those using a board card) with Batch in one pass and sorts them by strength.
+Where a hand stands against everyone else then takes two binary searches, corrected for the combos its own cards block, which are looked up per card from the same precomputation.
+Rankings are cached per board, so all seats and all decisions on a board share one.
+"""
+
+import functools
+import itertools
+
+import numpy as np
+
+from . import Batch
+from .CardSet import CardSet
+
+
+BOARD_CACHE_SIZE = 1024
+
+# All 1326 combos as card id pairs, and the CardSet mask of each
+COMBOS = np.array(list(itertools.combinations(range(52), 2)), dtype=np.uint8)
+COMBO_MASKS = np.left_shift(1, COMBOS[:, 0], dtype=np.int64) | np.left_shift(1, COMBOS[:, 1], dtype=np.int64)
+
+
+class BoardRanking:
+    """The live holdings on a board, sorted from weakest to strongest.
+
+    Instance Variables
+    ------------------
+    board : list(Card)
+    board_mask : int
+        CardSet mask of the board.
+    combos : numpy.ndarray
+        (n, 2) card ids of each live holding, weakest first.
+    masks : numpy.ndarray
+        (n,) CardSet mask of each holding in combos.
+    strengths : numpy.ndarray
+        (n,) strength of each holding with the board, ascending.
+    """
+
+    def __init__(self, board: list):
+        if not 3 <= len(board) <= 5:
+            raise ValueError(f"The board has {len(board)} cards; 3 to 5 are needed.")
+        self.board = list(board)
+        self.board_mask = CardSet(board).mask
+        if len(CardSet(mask=self.board_mask)) != len(board):
+            raise ValueError("A card was used more than once.")
+
+        live = (COMBO_MASKS & self.board_mask) == 0
+        board_keys, board_masks = Batch.state(np.array([[card.id for card in board]]))
+        keys, masks = Batch.state(COMBOS[live])
+        strengths = Batch.evaluate_state(keys + board_keys[0], masks | board_masks[0])
+        order = np.argsort(strengths, kind='stable')
+        self.combos = COMBOS[live][order]
+        self.masks = COMBO_MASKS[live][order]
+        self.strengths = strengths[order]
+        self._positions = {mask: i for i, mask in enumerate(self.masks.tolist())}
+        # Positions of the holdings using each card: sort the flattened ids and split them by card
+        ids = self.combos.ravel()
+        order = np.argsort(ids, kind='stable')
+        self._card_positions = np.split(order // 2, np.cumsum(np.bincount(ids, minlength=52))[:-1])
+
+    def __len__(self):
+        return len(self.strengths)
+
+    def strength(self, hole_cards) -> int:
+        """Strength of two hole cards with the board. Raises ValueError if they are not a live holding."""
+        first, second = hole_cards
+        position = self._positions.get(1 << first.id | 1 << second.id)
+        if position is None:
+            raise ValueError(f"{first}, {second} is not a live holding on this board.")
+        return int(self.strengths[position])
+
+    def blocked(self, cards) -> np.ndarray:
+        """Positions (into combos, masks, and strengths) of the holdings using any of cards."""
+        positions = [self._card_positions[card.id] for card in cards]
+        return functools.reduce(np.union1d, positions, np.zeros(0, dtype=np.intp))
+
+    def rank(self, hole_cards, dead=()) -> tuple:
+        """Counts (wins, ties, losses) of hole_cards against every holding not using a hole card or dead card."""
+        strength = self.strength(hole_cards)
+        below = int(np.searchsorted(self.strengths, strength, 'left'))
+        through = int(np.searchsorted(self.strengths, strength, 'right'))
+        blocked = self.strengths[self.blocked(list(hole_cards) + list(dead))]
+        wins = below - int((blocked < strength).sum())
+        ties = through - below - int((blocked == strength).sum())
+        losses = len(self.strengths) - through - int((blocked > strength).sum())
+        return wins, ties, losses
+
+    def percentile(self, hole_cards, dead=()) -> float:
+        """Fraction of possible opponent holdings beaten, ties counting half."""
+        wins, ties, losses = self.rank(hole_cards, dead)
+        return (wins + ties / 2) / (wins + ties + losses)
+
+    def range_weights(self, hand_range) -> np.ndarray:
+        """(n,) weight of each holding in a Ranges.Range, in combos order. Holdings using a board card are left out."""
+        weights = np.zeros(len(self.strengths))
+        positions = self._positions
+        for mask, weight in hand_range.weights.items():
+            position = positions.get(mask)
+            if position is not None:
+                weights[position] = weight
+        return weights
+
+    def versus(self, hole_cards, hand_range, dead=()) -> tuple:
+        """Weighted fractions (win, tie, loss) of hole_cards against the holdings of hand_range (a Ranges.Range or weights from range_weights) not using a hole card or dead card."""
+        strength = self.strength(hole_cards)
+        weights = hand_range if isinstance(hand_range, np.ndarray) else self.range_weights(hand_range)
+        weights = weights.copy()
+        weights[self.blocked(list(hole_cards) + list(dead))] = 0
+        total = weights.sum()
+        if not total:
+            raise ValueError("Every holding in the range is blocked.")
+        below = int(np.searchsorted(self.strengths, strength, 'left'))
+        through = int(np.searchsorted(self.strengths, strength, 'right'))
+        win = weights[:below].sum() / total
+        tie = weights[below:through].sum() / total
+        return float(win), float(tie), float(1 - win - tie)
+
+    def equity(self, hole_cards, hand_range=None, dead=()) -> float:
+        """Share of the pot won against hand_range (all holdings by default) if the hands were shown down on the board as it stands, ties splitting it."""
+        if hand_range is None:
+            return self.percentile(hole_cards, dead)
+        win, tie, loss = self.versus(hole_cards, hand_range, dead)
+        return win + tie / 2
+
+
+@functools.lru_cache(maxsize=BOARD_CACHE_SIZE)
+def _ranking(board_mask: int) -> BoardRanking:
+    return BoardRanking(list(CardSet(mask=board_mask)))
+
+def ranking(board: list) -> BoardRanking:
+    """The BoardRanking of board, built once and cached for the BOARD_CACHE_SIZE most recently used boards. The order of the board cards doesn't matter."""
+    mask = CardSet(board).mask
+    if len(CardSet(mask=mask)) != len(board):
+        raise ValueError("A card was used more than once.")
+    return _ranking(mask)
+
+cache_info = _ranking.cache_info
+cache_clear = _ranking.cache_clear
@@ -0,0 +1,165 @@
+"""Least recently used cache of PokerHand results, keyed by the CardSet mask of the cards evaluated.
+
+The mask does not depend on the order cards were added, so the same five, six, or seven cards hit the same entry however they were dealt.
+A cache can be used directly through evaluate, or installed as the cache Hand.evaluate_poker looks results up in so existing code uses it unchanged.
+Cached PokerHands are shared between callers and must not be modified.
+"""
+
+import threading
+from collections import OrderedDict
+from contextlib import contextmanager
+
+from . import Evaluator
+from .Hand import Hand
+
+
+DEFAULT_MAXSIZE = 65536
+
+
+class EvaluationCache:
+    """Bounded cache of evaluation results with hit, miss, and eviction counts.
+
+    Instance Variables
+    ------------------
+    maxsize : int or None
+        Most entries kept; the least recently used entry is evicted past it. None never evicts.
+    hits : int
+    misses : int
+    evictions : int
+    """
+
+    def __init__(self, maxsize=DEFAULT_MAXSIZE, thread_safe=False):
+        """Create an empty cache. With thread_safe, lookups and inserts hold a lock so the cache can be shared by threads."""
+        if maxsize is not None and maxsize < 1:
+            raise ValueError(f"maxsize must be at least 1 or None, not {maxsize}.")
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._entries = OrderedDict()
+        self._lock = threading.Lock() if thread_safe else None
+
+    def _lookup(self, mask: int):
+        entries = self._entries
+        result = entries.get(mask)
+        if result is None:
+            self.misses += 1
+        else:
+            entries.move_to_end(mask)
+            self.hits += 1
+        return result
+
+    def _insert(self, mask: int, result):
+        self._entries[mask] = result
+        self._trim()
+
+    def _trim(self):
+        """Evict least recently used entries past maxsize."""
+        entries = self._entries
+        if self.maxsize is not None:
+            while len(entries) > self.maxsize:
+                entries.popitem(last=False)
+                self.evictions += 1
+
+    def _evaluate(self, cards: list, key: int, mask: int):
+        lock = self._lock
+        if lock is None:
+            result = self._lookup(mask)
+            if result is None:
+                result = Evaluator.to_pokerhand(cards, Evaluator.evaluate_state(key, mask))
+                self._insert(mask, result)
+            return result
+
+        with lock:
+            result = self._lookup(mask)
+        if result is None:
+            # Evaluate outside the lock; a thread racing on the same cards stores an equal result
+            result = Evaluator.to_pokerhand(cards, Evaluator.evaluate_state(key, mask))
+            with lock:
+                self._insert(mask, result)
+        return result
+
+    def evaluate(self, cards):
+        """The best PokerHand of a Hand or a collection of Cards, from the cache if the same cards were evaluated before."""
+        if isinstance(cards, Hand):
+            key, mask = cards.state()
+            return self._evaluate(cards.cards, key, mask)
+        cards = list(cards)
+        key, mask = Evaluator.state(cards)
+        return self._evaluate(cards, key, mask)
+
+
+    def resize(self, maxsize):
+        """Change maxsize, evicting least recently used entries if the cache is now too big."""
+        if maxsize is not None and maxsize < 1:
+            raise ValueError(f"maxsize must be at least 1 or None, not {maxsize}.")
+        if self._lock is None:
+            self.maxsize = maxsize
+            self._trim()
+        else:
+            with self._lock:
+                self.maxsize = maxsize
+                self._trim()
+
+    def clear(self, reset_counts=True):
+        """Drop every entry, and zero the counters if reset_counts is True."""
+        if self._lock is not None:
+            with self._lock:
+                self._clear(reset_counts)
+        else:
+            self._clear(reset_counts)
+
+    def _clear(self, reset_counts: bool):
+        self._entries.clear()
+        if reset_counts:
+            self.hits = self.misses = self.evictions = 0
+
+    def __len__(self):
+        return len(self._entries)
+
+    def __contains__(self, cards):
+        """Whether a Hand or collection of Cards has a cached result. Does not count as a lookup."""
+        mask = cards.state()[1] if isinstance(cards, Hand) else Evaluator.state(cards)[1]
+        return mask in self._entries
+
+    def stats(self) -> dict:
+        """The counters as a dictionary, with the current size and hit rate."""
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "size": len(self._entries),
+            "maxsize": self.maxsize,
+            "hit_rate": self.hits / lookups if lookups else 0.0
+        }
+
+    def __str__(self):
+        stats = self.stats()
+        return (f"{stats['size']}/{stats['maxsize']} entries, {stats['hits']} hits, {stats['misses']} misses "
+                f"({stats['hit_rate']:.1%} hit rate), {stats['evictions']} evictions")
+
+
+def install(cache: EvaluationCache):
+    """Make Hand.evaluate_poker go through cache. Replaces any cache installed earlier.
+    Hand.evaluate_poker itself is not replaced, so this works alongside Profiling in any order."""
+    Hand._cache = cache
+
+def uninstall():
+    """Stop Hand.evaluate_poker using a cache. Does nothing if no cache is installed."""
+    Hand._cache = None
+
+def installed():
+    """The installed EvaluationCache, or None."""
+    return Hand._cache
+
+@contextmanager
+def caching(maxsize=DEFAULT_MAXSIZE, thread_safe=False):
+    """Install a new EvaluationCache for a with block and yield it, putting back whatever cache was installed before afterwards."""
+    cache = EvaluationCache(maxsize, thread_safe)
+    previous = installed()
+    install(cache)
+    try:
+        yield cache
+    finally:
+        Hand._cache = previous
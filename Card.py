@@ -9,17 +9,18 @@ def sort_cards(cards: list):
 
 def get_card_dict():
     """Returns a dictionary of all possible cards. Keys are strings with the capitalized first letter of the suit followed by the value (2-10, Jack, Queen, King, Ace)."""
-    end = dict()
-    for suit in all_suits:
-        key = suit.name[0]
-        for value in range(14, 1, -1):
-            card = Card(value, suit)
-            end[key + card.value_str()] = card
-    return end
+    return dict(_card_dict)
+
+def card_from_id(i: int):
+    """The card with the given id (0-51)."""
+    return all_cards[i]
     
 
 class Card:
     """A singular playing card. Comparison operations are used for high card testing.
+    There is exactly one instance of each of the 52 cards; Card(value, suit) returns it, and it must not be modified.
+    == and the other comparisons look at the value only, so Card(10, Clubs) == Card(10, Hearts), and cards hash by value to match: as set members and dict keys, cards of the same value are the same.
+    To tell whether two cards are the same card, use is or &; to collect cards per card, use a CardSet or key on card.id.
     
     Instance Variables
     ------------------
@@ -27,13 +28,36 @@ class Card:
         A Suit object from .Suits.Suit.
     value : int
         Integer value of the card. Jack = 11, Queen = 12, King = 13, Ace = 14.
+    id : int
+        Stable index of the card, 13 * (index of suit in all_suits) + value - 2. all_cards[card.id] is card.
     """
 
-    def __init__(self, value: int, suit):
+    __slots__ = ('value', 'suit', 'id')
+
+    def __new__(cls, value: int, suit):
+        """Look up the card. Raises ValueError if there is no such card."""
         if value == 1:
             value = 14
-        self.value = value
-        self.suit = suit
+        try:
+            return _pool[(value, suit)]
+        except KeyError:
+            raise ValueError(f"There is no card with value {value} and suit {suit}.") from None
+
+    @classmethod
+    def _create(cls, value: int, suit, id: int):
+        card = object.__new__(cls)
+        card.value = value
+        card.suit = suit
+        card.id = id
+        return card
+
+    def __reduce__(self):
+        # Unpickle to the shared instance
+        return (card_from_id, (self.id,))
+
+    def __hash__(self):
+        # Consistent with __eq__, which ignores suit
+        return self.value
 
     def value_str(self):
         """The value of the card as a string."""
@@ -141,3 +165,22 @@ class Card:
         if isinstance(other, Card):
             return self.suit is other.suit
         return NotImplemented
+
+
+# Id standing for no card in arrays of card ids (hand history records, Batch and SharedPool rows)
+NO_CARD = 0xFF
+
+all_cards = tuple(Card._create(value, suit, 13 * i + value - 2) for i, suit in enumerate(all_suits) for value in range(2, 15))
+_pool = {(card.value, card.suit): card for card in all_cards}
+
+
+def _build_card_dict():
+    end = dict()
+    for suit in all_suits:
+        key = suit.name[0]
+        for value in range(14, 1, -1):
+            card = _pool[(value, suit)]
+            end[key + card.value_str()] = card
+    return end
+
+_card_dict = _build_card_dict()
@@ -0,0 +1,112 @@
+"""CardSet class, an unordered set of cards stored as a 52 bit mask. Bit card.id is set for each card in the set."""
+
+from .Card import Card, card_from_id
+
+
+def permute_suits(mask, perm):
+    """Move the cards of suit index s in mask to suit index perm[s]. Works on ints and on numpy integer arrays alike."""
+    result = 0
+    for suit in range(4):
+        result = result | ((mask >> (13 * suit)) & 0x1FFF) << (13 * perm[suit])
+    return result
+
+
+class CardSet:
+    """A set of distinct cards. Membership, adding, and removing are O(1); set operations work on the whole mask at once.
+
+    Instance Variables
+    ------------------
+    mask : int
+        Bit card.id is set for every card in the set.
+    """
+
+    FULL_MASK = (1 << 52) - 1
+
+    def __init__(self, cards=(), mask=0):
+        """Create a set from a collection of cards and/or an existing mask."""
+        for card in cards:
+            mask |= 1 << card.id
+        self.mask = mask
+
+    @classmethod
+    def full(cls):
+        """A set of all 52 cards."""
+        return cls(mask=cls.FULL_MASK)
+
+    def copy(self):
+        return CardSet(mask=self.mask)
+
+
+    def add(self, card: Card):
+        """Add card to the set."""
+        self.mask |= 1 << card.id
+
+    def discard(self, card: Card):
+        """Remove card from the set if present."""
+        self.mask &= ~(1 << card.id)
+
+    def permute_suits(self, perm):
+        """A new CardSet with each card of suit all_suits[s] replaced by the same value in all_suits[perm[s]]."""
+        return CardSet(mask=permute_suits(self.mask, perm))
+
+    def ids(self):
+        """Yield the ids of the cards in the set, lowest first."""
+        mask = self.mask
+        while mask:
+            low = mask & -mask
+            yield low.bit_length() - 1
+            mask ^= low
+
+    def __iter__(self):
+        for i in self.ids():
+            yield card_from_id(i)
+
+    def __contains__(self, card):
+        return bool(self.mask >> card.id & 1)
+
+    def __len__(self):
+        """Number of cards (popcount of the mask)."""
+        return self.mask.bit_count()
+
+    def __bool__(self):
+        return self.mask != 0
+
+
+    def __or__(self, other):
+        """Union."""
+        if isinstance(other, CardSet):
+            return CardSet(mask=self.mask | other.mask)
+        return NotImplemented
+
+    def __and__(self, other):
+        """Intersection."""
+        if isinstance(other, CardSet):
+            return CardSet(mask=self.mask & other.mask)
+        return NotImplemented
+
+    def __sub__(self, other):
+        """Difference."""
+        if isinstance(other, CardSet):
+            return CardSet(mask=self.mask & ~other.mask)
+        return NotImplemented
+
+    def __xor__(self, other):
+        """Symmetric difference."""
+        if isinstance(other, CardSet):
+            return CardSet(mask=self.mask ^ other.mask)
+        return NotImplemented
+
+    def __eq__(self, other):
+        if isinstance(other, CardSet):
+            return self.mask == other.mask
+        return NotImplemented
+
+    def __hash__(self):
+        return hash(self.mask)
+
+
+    def __str__(self):
+        strs = ""
+        for card in self:
+            strs += str(card) + ', '
+        return strs[:-2]
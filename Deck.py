@@ -1,75 +1,249 @@
 """Deck of cards."""
 
-from random import shuffle
+import random
+from array import array
+from collections import deque
+
+from .Card import Card, all_cards
+from .CardSet import CardSet
+
+
+def make_rng(seed=None, rng=None):
+    """The random number generator a deck shuffles with: rng if given, else a random.Random seeded with seed, else the global random module."""
+    if rng is not None:
+        return rng
+    if seed is not None:
+        return random.Random(seed)
+    return random
 
-from .Card import Card
-from .Suits import all_suits
 
 class Deck:
-        """A standard 52 card deck. No jokers.
-        
+        """A standard 52 card deck. No jokers. Holds at most one of each card.
+
         Instance Variables
         ------------------
-        _deck : list(Card)
-            The actual set of cards contained. _deck[-1] is considered the top of the deck.
+        _deck : deque(Card)
+            The actual order of the cards. _deck[-1] is considered the top of the deck. May still hold removed cards; those are skipped when drawn.
+        _cards : CardSet
+            The cards currently in the deck.
+        _dead : CardSet
+            Removed cards that are still physically in _deck.
+        rng : random.Random
+            Shuffles the deck. The global random module unless a seed or generator was given.
         size (property) : int
             Number of cards in deck.
         """
 
-        def __init__(self, shuffle=True):
-            """Create a normal 52 card deck a shuffle it."""
-            self._deck = []
-            for suit in all_suits:
-                for value in range(2, 15):
-                    self._deck.append(Card(value, suit))
+        def __init__(self, shuffle=True, seed=None, rng=None):
+            """Create a normal 52 card deck a shuffle it. Give seed or rng (anything with a shuffle method, such as a Streams.Stream) to make shuffles reproducible."""
+            self._deck = deque(all_cards)
+            self._cards = CardSet.full()
+            self._dead = CardSet()
+            self.rng = make_rng(seed, rng)
             if shuffle:
                 self.shuffle()
-        
+
         @property
         def size(self):
             """Get the current size of the deck."""
-            return len(self._deck)
+            return len(self._deck) - len(self._dead)
+
+        def remaining(self) -> CardSet:
+            """The set of cards currently in the deck."""
+            return self._cards.copy()
 
 
         def add(self, card: Card):
-            """Add card to the top of the deck."""
+            """Add card to the top of the deck. Returns True if it was added, False if it is already in the deck."""
+            if not self._revive(card):
+                return False
             self._deck.append(card)
+            return True
 
         def bury(self, card: Card):
-            """Add card to the bottom of the deck."""
-            self._deck.insert(0, card)
+            """Add card to the bottom of the deck. Returns True if it was added, False if it is already in the deck."""
+            if not self._revive(card):
+                return False
+            self._deck.appendleft(card)
+            return True
+
+        def _revive(self, card: Card) -> bool:
+            """Mark card as in the deck, first dropping any stale copy of it left behind by remove. Returns False if it is already in the deck."""
+            if card in self._cards:
+                return False
+            if card in self._dead:
+                self._compact()
+            self._cards.add(card)
+            return True
+
+        def _compact(self):
+            """Physically drop removed cards from _deck."""
+            if self._dead:
+                cards = self._cards
+                self._deck = deque(c for c in self._deck if c in cards)
+                self._dead = CardSet()
 
         def draw(self, n=1):
             """Draw the top n cards. Returns Card with default n=1, or list(Card) if n>1."""
             draws = []
             for x in range(n):
-                draws.append(self._deck.pop())
-            
+                card = self._deck.pop()
+                while card in self._dead:
+                    # Removed earlier; skip it
+                    self._dead.discard(card)
+                    card = self._deck.pop()
+                self._cards.discard(card)
+                draws.append(card)
+
             if len(draws) == 1:
                 return draws[0]
             return draws
 
+        def deal(self, n: int) -> list:
+            """Draw the top n cards. Always returns list(Card)."""
+            if n == 1:
+                return [self.draw()]
+            return self.draw(n) if n else []
+
         def contains(self, card: Card):
             """Returns True if Card is in deck, False otherwise."""
-            for c in self._deck:
-                if c & card:
-                    return True
-            return False
-        
+            return card in self._cards
+
         def remove(self, card: Card):
-            """Remove the first card that matches (suit & value). Returns True if card was found, False otherwise."""
-            for i, c in enumerate(self._deck):
-                if c & card:
-                    self._deck.pop(i)
-                    return True
+            """Remove the card that matches (suit & value). Returns True if card was found, False otherwise."""
+            if card in self._cards:
+                self._cards.discard(card)
+                self._dead.add(card)
+                return True
             return False
 
         def shuffle(self):
-            shuffle(self._deck)
+            self._compact()
+            cards = list(self._deck)
+            self.rng.shuffle(cards)
+            self._deck = deque(cards)
 
 
         def __str__(self):
             return f"{self.size} card deck"
 
         def __len__(self):
-            return self.size
\ No newline at end of file
+            return self.size
+
+        def __contains__(self, card: Card):
+            return card in self._cards
+
+
+class ArrayDeck:
+        """A 52 card deck dealt from a fixed array of card ids with a cursor. Dealing never pops or allocates Cards, and reset only moves the cursor back.
+
+        Instance Variables
+        ------------------
+        _ids : array('B')
+            Card ids (Card.id) in deck order. _ids[_cursor] is the top of the deck; everything before it has been dealt.
+        _cursor : int
+            Number of cards dealt.
+        _mask : int
+            CardSet mask of the cards in the deck. Bit card.id is cleared when the card is dealt or removed.
+        _removed : int
+            Removed cards that are still past the cursor; they are moved before it before the next deal or shuffle.
+        rng : random.Random
+            Shuffles the deck. The global random module unless a seed or generator was given.
+        size (property) : int
+            Number of cards left to deal.
+        """
+
+        def __init__(self, shuffle=True, seed=None, rng=None):
+            """Create a normal 52 card deck a shuffle it. Give seed or rng (anything with a shuffle method, such as a Streams.Stream) to make shuffles reproducible."""
+            self._ids = array('B', range(52))
+            self._cursor = 0
+            self._mask = CardSet.FULL_MASK
+            self._removed = 0
+            self.rng = make_rng(seed, rng)
+            if shuffle:
+                self.shuffle()
+
+        @property
+        def size(self):
+            """Get the number of cards left to deal."""
+            return 52 - self._cursor - self._removed
+
+        def remaining(self) -> CardSet:
+            """The set of cards left to deal."""
+            return CardSet(mask=self._mask)
+
+        def reset(self, shuffle=True):
+            """Return every dealt and removed card to the deck, keeping the order unless shuffle is True."""
+            self._cursor = 0
+            self._mask = CardSet.FULL_MASK
+            self._removed = 0
+            if shuffle:
+                self.shuffle()
+
+        def shuffle(self):
+            """Shuffle the cards that have not been dealt, in place."""
+            self._compact()
+            if self._cursor == 0:
+                self.rng.shuffle(self._ids)
+            else:
+                rest = self._ids[self._cursor:]
+                self.rng.shuffle(rest)
+                self._ids[self._cursor:] = rest
+
+        def _compact(self):
+            """Move removed cards from past the cursor to just before it, keeping the order of the rest."""
+            if self._removed:
+                mask = self._mask
+                rest = self._ids[self._cursor:]
+                kept = array('B', [i for i in rest if mask >> i & 1])
+                self._ids[self._cursor:] = array('B', [i for i in rest if not mask >> i & 1]) + kept
+                self._cursor = 52 - len(kept)
+                self._removed = 0
+
+
+        def deal_ids(self, n: int) -> array:
+            """Deal the top n cards as an array of card ids."""
+            if n > self.size:
+                raise IndexError(f"Cannot deal {n} cards from a {self.size} card deck.")
+            self._compact()
+            start = self._cursor
+            self._cursor += n
+            ids = self._ids[start:self._cursor]
+            mask = self._mask
+            for i in ids:
+                mask ^= 1 << i
+            self._mask = mask
+            return ids
+
+        def deal(self, n: int) -> list:
+            """Deal the top n cards. Always returns list(Card)."""
+            return [all_cards[i] for i in self.deal_ids(n)]
+
+        def draw(self, n=1):
+            """Draw the top n cards like Deck.draw. Returns Card with default n=1, or list(Card) if n>1."""
+            if n == 1:
+                return all_cards[self.deal_ids(1)[0]]
+            return self.deal(n)
+
+        def contains(self, card: Card):
+            """Returns True if Card has not been dealt or removed, False otherwise."""
+            return bool(self._mask >> card.id & 1)
+
+        def remove(self, card: Card):
+            """Take card out of the deck without changing the order of the others. Returns True if card was found, False otherwise."""
+            bit = 1 << card.id
+            if not self._mask & bit:
+                return False
+            self._mask ^= bit
+            self._removed += 1
+            return True
+
+
+        def __str__(self):
+            return f"{self.size} card deck"
+
+        def __len__(self):
+            return self.size
+
+        def __contains__(self, card: Card):
+            return self.contains(card)
@@ -0,0 +1,269 @@
+"""Exhaustive enumeration of every 5, 6, or 7 card hand, counting each category and each exact strength. Requires numpy.
+
+Hands are split into partitions by their two lowest cards. Every partition with the same second lowest card shares the same combinations of higher cards,
+so a worker builds their value keys and masks once (Batch.combination_states) and adds each lowest card's state to them.
+Partitions are evaluated in a process pool; finished partitions and the running totals are written to a checkpoint file, so an interrupted run picks up where it stopped.
+
+Run as a module to validate the evaluator, e.g. python -m PlayingCards.Enumerate --checkpoint enum.json
+With the full deck, the counts are compared against the known distribution and the exit status is 1 on any difference.
+"""
+
+import argparse
+import json
+import math
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, FIRST_COMPLETED, wait
+
+from .Evaluator import CATEGORY_SHIFT
+from . import PokerHands
+
+
+CHECKPOINT_VERSION = 2
+# Hands per partition to aim for
+PARTITION_HANDS = 2000000
+
+# Hands of each category (index into PokerHands.hand_hierarchy) and number of distinct strengths, over the full deck
+KNOWN_COUNTS = {
+    5: ([1302540, 1098240, 123552, 54912, 10200, 5108, 3744, 624, 36, 4], 7462),
+    6: ([6612900, 9730740, 2532816, 732160, 361620, 205792, 165984, 14664, 1656, 188], 6075),
+    7: ([23294460, 58627800, 31433400, 6461620, 6180020, 4047644, 3473184, 224848, 37260, 4324], 4824)
+}
+
+
+def partitions(cards: int, k: int, partition_hands=PARTITION_HANDS) -> list:
+    """Split the k-card hands of cards cards into (second, first_start, first_stop) partitions: hands whose lowest card is one of positions first_start to first_stop - 1 and second lowest is position second."""
+    parts = []
+    for second in range(1, cards - k + 2):
+        tails = math.comb(cards - second - 1, k - 2)
+        step = max(1, partition_hands // max(1, tails))
+        for start in range(0, second, step):
+            parts.append((second, start, min(start + step, second)))
+    return parts
+
+
+_tails = dict()
+
+def count_partition(ids: tuple, k: int, part: tuple) -> tuple:
+    """Evaluate one partition of the k-card hands of the card ids. Run in worker processes.
+
+    Returns
+    -------
+    (int, list(int), dict(int: int), float, int)
+        Hands evaluated, count per category, count per strength, seconds taken, and the worker's process id.
+    """
+    import numpy as np
+    from . import Batch
+
+    start = time.perf_counter()
+    second, first_start, first_stop = part
+    tail = _tails.get((ids, k, second))
+    if tail is None:
+        # Partitions sharing a second card usually go to the same worker one after another
+        _tails.clear()
+        tail = _tails[(ids, k, second)] = Batch.combination_states(ids[second + 1:], k - 2)
+    tail_keys, tail_masks = tail
+
+    strengths = []
+    for first in range(first_start, first_stop):
+        key, mask = Batch.state(np.array([[ids[first], ids[second]]]))
+        strengths.append(Batch.evaluate_state(tail_keys + key[0], tail_masks | mask[0]))
+    strengths = np.concatenate(strengths)
+
+    values, counts = np.unique(strengths, return_counts=True)
+    categories = np.bincount(values >> CATEGORY_SHIFT, weights=counts, minlength=len(PokerHands.hand_hierarchy))
+    ranks = dict(zip(values.tolist(), counts.tolist()))
+    return len(strengths), [int(n) for n in categories], ranks, time.perf_counter() - start, os.getpid()
+
+
+class EnumerationResult:
+    """Totals of an enumeration, complete or in progress.
+
+    Instance Variables
+    ------------------
+    k : int
+        Cards per hand.
+    ids : tuple(int)
+        Card ids hands are drawn from.
+    partition_hands : int
+        The partition size the hands were split with (see partitions); partition indexes only mean the same thing with the same size.
+    completed : set(int)
+        Indexes of the partitions counted so far.
+    hands : int
+    categories : list(int)
+        Hands per category, indexed like PokerHands.hand_hierarchy.
+    ranks : dict(int: int)
+        Hands per strength.
+    workers : dict(int: list)
+        Per worker process id, [partitions, hands, seconds] in this run (not kept across resumes).
+    """
+
+    def __init__(self, k: int, ids: tuple, partition_hands=PARTITION_HANDS):
+        self.k = k
+        self.ids = ids
+        self.partition_hands = partition_hands
+        self.completed = set()
+        self.hands = 0
+        self.categories = [0] * len(PokerHands.hand_hierarchy)
+        self.ranks = dict()
+        self.workers = dict()
+
+    def add(self, index: int, counted: tuple):
+        """Add the return value of count_partition for partition index."""
+        hands, categories, ranks, seconds, pid = counted
+        self.completed.add(index)
+        self.hands += hands
+        for i, n in enumerate(categories):
+            self.categories[i] += n
+        for strength, n in ranks.items():
+            self.ranks[strength] = self.ranks.get(strength, 0) + n
+        worker = self.workers.setdefault(pid, [0, 0, 0.0])
+        worker[0] += 1
+        worker[1] += hands
+        worker[2] += seconds
+
+    def throughput(self) -> dict:
+        """Hands per second of each worker process id while it was evaluating."""
+        return {pid: hands / seconds if seconds else 0.0 for pid, (parts, hands, seconds) in self.workers.items()}
+
+    def validate(self) -> list:
+        """Differences from the known distribution as (description, expected, counted). Empty if everything matches; only the full deck is checked."""
+        if self.ids != tuple(range(52)) or self.k not in KNOWN_COUNTS:
+            return []
+        categories, distinct = KNOWN_COUNTS[self.k]
+        differences = []
+        for i, (expected, counted) in enumerate(zip(categories, self.categories)):
+            if expected != counted:
+                differences.append((PokerHands.hand_hierarchy[i].__name__, expected, counted))
+        if len(self.ranks) != distinct:
+            differences.append(("distinct strengths", distinct, len(self.ranks)))
+        return differences
+
+
+    def save(self, path):
+        """Write the totals to path as JSON, replacing it atomically."""
+        state = {
+            "version": CHECKPOINT_VERSION,
+            "k": self.k,
+            "ids": list(self.ids),
+            "partition_hands": self.partition_hands,
+            "completed": sorted(self.completed),
+            "hands": self.hands,
+            "categories": self.categories,
+            "ranks": {str(strength): n for strength, n in self.ranks.items()}
+        }
+        temporary = f"{path}.{os.getpid()}.tmp"
+        with open(temporary, 'w') as file:
+            json.dump(state, file)
+        os.replace(temporary, path)
+
+    @classmethod
+    def load(cls, path):
+        """Read totals written by save."""
+        with open(path) as file:
+            state = json.load(file)
+        if state.get("version") != CHECKPOINT_VERSION:
+            raise ValueError(f"{path} is not a version {CHECKPOINT_VERSION} enumeration checkpoint.")
+        result = cls(state["k"], tuple(state["ids"]), state["partition_hands"])
+        result.completed = set(state["completed"])
+        result.hands = state["hands"]
+        result.categories = state["categories"]
+        result.ranks = {int(strength): n for strength, n in state["ranks"].items()}
+        return result
+
+
+def enumerate_hands(k=7, ids=None, processes=None, checkpoint=None, checkpoint_interval=10.0, progress=None,
+                    partition_hands=PARTITION_HANDS) -> EnumerationResult:
+    """Count every k-card hand (5 <= k <= 7) of the card ids (default the full deck).
+
+    Parameters
+    ----------
+    processes : int
+        Worker processes. 1 evaluates in this process; None uses os.cpu_count().
+    checkpoint : str
+        File to resume from if it exists and to save progress to every checkpoint_interval seconds and at the end. It must have been written for the same k, ids, and partition_hands.
+    progress : function
+        Called with the EnumerationResult after each partition.
+    """
+    ids = tuple(range(52)) if ids is None else tuple(ids)
+    if not 5 <= k <= 7:
+        raise ValueError(f"Hands of {k} cards cannot be evaluated; 5 to 7 are allowed.")
+    if len(ids) < k or len(set(ids)) != len(ids) or not all(0 <= i < 52 for i in ids):
+        raise ValueError("ids must be at least k distinct card ids.")
+    # Partitions are by position, so keep ids in order
+    ids = tuple(sorted(ids))
+    if processes is None:
+        processes = os.cpu_count() or 1
+
+    parts = partitions(len(ids), k, partition_hands)
+    result = EnumerationResult(k, ids, partition_hands)
+    if checkpoint is not None and os.path.exists(checkpoint):
+        result = EnumerationResult.load(checkpoint)
+        if result.k != k or result.ids != ids:
+            raise ValueError(f"{checkpoint} is for a different enumeration.")
+        if result.partition_hands != partition_hands:
+            raise ValueError(f"{checkpoint} was split into partitions of {result.partition_hands} hands, not {partition_hands}.")
+    todo = [index for index in range(len(parts)) if index not in result.completed]
+
+    last_save = time.monotonic()
+    def finished(index, counted):
+        nonlocal last_save
+        result.add(index, counted)
+        if checkpoint is not None and time.monotonic() - last_save >= checkpoint_interval:
+            result.save(checkpoint)
+            last_save = time.monotonic()
+        if progress is not None:
+            progress(result)
+
+    if processes == 1:
+        for index in todo:
+            finished(index, count_partition(ids, k, parts[index]))
+    else:
+        with ProcessPoolExecutor(processes) as pool:
+            pending = dict()
+            for index in todo:
+                if len(pending) >= 2 * processes:
+                    done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        finished(pending.pop(future), future.result())
+                pending[pool.submit(count_partition, ids, k, parts[index])] = index
+            for future, index in pending.items():
+                finished(index, future.result())
+
+    if checkpoint is not None:
+        result.save(checkpoint)
+    return result
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Count every hand of the deck by category and strength.")
+    parser.add_argument("--cards", type=int, default=7, choices=(5, 6, 7), help="Cards per hand (default 7).")
+    parser.add_argument("--processes", type=int, help="Worker processes (default one per CPU).")
+    parser.add_argument("--checkpoint", help="Checkpoint file to resume from and save progress to.")
+    parser.add_argument("--checkpoint-interval", type=float, default=10.0, help="Seconds between checkpoint saves (default 10).")
+    args = parser.parse_args(argv)
+
+    total = math.comb(52, args.cards)
+    start = time.perf_counter()
+    def progress(result):
+        print(f"\r{result.hands:,} of {total:,} hands ({result.hands / total:.1%})", end='', file=sys.stderr, flush=True)
+
+    result = enumerate_hands(args.cards, processes=args.processes, checkpoint=args.checkpoint,
+                             checkpoint_interval=args.checkpoint_interval, progress=progress)
+    print(file=sys.stderr)
+    for i, count in enumerate(result.categories):
+        print(f"{PokerHands.hand_hierarchy[i].__name__:>15} {count:>12,}")
+    print(f"{'Total':>15} {result.hands:>12,}")
+    print(f"{len(result.ranks)} distinct strengths; {time.perf_counter() - start:.1f}s")
+    for pid, (parts, hands, seconds) in sorted(result.workers.items()):
+        print(f"worker {pid}: {parts} partitions, {hands:,} hands, {hands / seconds if seconds else 0:,.0f} hands/sec")
+
+    differences = result.validate()
+    for name, expected, counted in differences:
+        print(f"MISMATCH {name}: expected {expected:,}, counted {counted:,}", file=sys.stderr)
+    return 1 if differences else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,318 @@
+"""Equity calculators. monte_carlo deals out the rest of the board many times to estimate each player's chance of winning or tying; exact enumerates every completion of the board."""
+
+import itertools
+import math
+import os
+import random
+import time
+from concurrent.futures import ProcessPoolExecutor, FIRST_COMPLETED, wait
+from fractions import Fraction
+
+from .CardSet import CardSet, permute_suits
+from . import Evaluator
+from .Streams import Stream
+
+
+DEFAULT_TRIALS = 100000
+CHUNK_SIZE = 5000
+
+
+class EquityResult:
+    """Win and tie counts for each player over a number of trials.
+
+    Instance Variables
+    ------------------
+    trials : int
+        Number of boards evaluated.
+    wins : list(int)
+        Per player, trials won outright.
+    ties : list(int)
+        Per player, trials where the best hand was shared with others.
+    shares : list(float)
+        Per player, sum of pot shares won (1 for a win, 1/k for a k-way tie).
+    share_squares : list(float)
+        Per player, sum of squared pot shares. Used for the confidence interval.
+    """
+
+    def __init__(self, players: int):
+        self.trials = 0
+        self.wins = [0] * players
+        self.ties = [0] * players
+        self.shares = [0.0] * players
+        self.share_squares = [0.0] * players
+
+    def merge(self, other):
+        """Add another result's counts to this one. Returns self."""
+        self.trials += other.trials
+        for i in range(len(self.wins)):
+            self.wins[i] += other.wins[i]
+            self.ties[i] += other.ties[i]
+            self.shares[i] += other.shares[i]
+            self.share_squares[i] += other.share_squares[i]
+        return self
+
+    def win(self, player: int) -> float:
+        """Fraction of trials the player won outright."""
+        return self.wins[player] / self.trials
+
+    def tie(self, player: int) -> float:
+        """Fraction of trials the player tied for the best hand."""
+        return self.ties[player] / self.trials
+
+    def equity(self, player: int) -> float:
+        """Expected share of the pot."""
+        return self.shares[player] / self.trials
+
+    def confidence_interval(self, player: int, z=1.96) -> tuple:
+        """(low, high) bounds on the player's equity. z=1.96 is a 95% interval."""
+        mean = self.equity(player)
+        variance = max(self.share_squares[player] / self.trials - mean * mean, 0.0)
+        margin = z * math.sqrt(variance / self.trials)
+        return (mean - margin, mean + margin)
+
+
+    def __str__(self):
+        lines = []
+        for i in range(len(self.wins)):
+            low, high = self.confidence_interval(i)
+            lines.append(f"Player {i}: {self.equity(i):.2%} equity ({self.win(i):.2%} win, {self.tie(i):.2%} tie, 95% CI {low:.2%} - {high:.2%})")
+        return '\n'.join(lines)
+
+
+class ExactResult(EquityResult):
+    """Exact win, tie, and loss counts for each player over every completion of the board. Fractions are returned as fractions.Fraction.
+
+    Instance Variables
+    ------------------
+    trials : int
+        Number of board completions.
+    losses : list(int)
+        Per player, completions where someone else had a better hand.
+    shares : list(Fraction)
+        Per player, exact sum of pot shares won.
+    """
+
+    def __init__(self, players: int):
+        super().__init__(players)
+        self.losses = [0] * players
+        self.shares = [Fraction(0)] * players
+
+    def win(self, player: int) -> Fraction:
+        return Fraction(self.wins[player], self.trials)
+
+    def tie(self, player: int) -> Fraction:
+        return Fraction(self.ties[player], self.trials)
+
+    def loss(self, player: int) -> Fraction:
+        """Fraction of completions the player lost."""
+        return Fraction(self.losses[player], self.trials)
+
+    def equity(self, player: int) -> Fraction:
+        return self.shares[player] / self.trials
+
+    def confidence_interval(self, player: int, z=1.96) -> tuple:
+        """Exact results have no uncertainty."""
+        equity = self.equity(player)
+        return (equity, equity)
+
+    def merge(self, other):
+        super().merge(other)
+        for i in range(len(self.losses)):
+            self.losses[i] += other.losses[i]
+        return self
+
+
+def situation_ids(hole_cards: list, board=(), dead=()) -> tuple:
+    """Convert cards to ids and check that no card is used twice. Returns (list of hole id tuples, board ids, CardSet mask of every known card)."""
+    known = CardSet()
+    count = 0
+    for cards in list(hole_cards) + [board, dead]:
+        for card in cards:
+            known.add(card)
+            count += 1
+    if len(known) != count:
+        raise ValueError("A card was used more than once.")
+    if len(board) > 5:
+        raise ValueError(f"The board has {len(board)} cards; at most 5 are allowed.")
+    if len(hole_cards) < 2:
+        raise ValueError("At least 2 players are needed.")
+
+    holes = [tuple(card.id for card in cards) for cards in hole_cards]
+    return holes, tuple(card.id for card in board), known.mask
+
+
+def _settle(result: EquityResult, strengths: list):
+    """Count one board's outcome into result."""
+    best = max(strengths)
+    winners = [i for i, strength in enumerate(strengths) if strength == best]
+    if len(winners) == 1:
+        result.wins[winners[0]] += 1
+        result.shares[winners[0]] += 1.0
+        result.share_squares[winners[0]] += 1.0
+    else:
+        share = 1.0 / len(winners)
+        for i in winners:
+            result.ties[i] += 1
+            result.shares[i] += share
+            result.share_squares[i] += share * share
+
+def run_chunk(holes: list, board: tuple, known_mask: int, trials: int, seed, path=()) -> EquityResult:
+    """Evaluate trials random board completions dealt from the Stream at path under master seed."""
+    rng = Stream(seed, path)
+    live = [i for i in range(52) if not known_mask >> i & 1]
+    need = 5 - len(board)
+
+    board_key, board_mask = Evaluator.ids_state(board)
+    players = []
+    for hole in holes:
+        key, mask = Evaluator.ids_state(hole)
+        players.append((board_key + key, board_mask | mask))
+
+    card_keys = Evaluator.card_keys
+    evaluate_state = Evaluator.evaluate_state
+    result = EquityResult(len(holes))
+    result.trials = trials
+    for t in range(trials):
+        key = 0
+        mask = 0
+        for i in rng.sample(live, need):
+            key += card_keys[i]
+            mask |= 1 << i
+        _settle(result, [evaluate_state(player_key + key, player_mask | mask) for player_key, player_mask in players])
+    return result
+
+
+def monte_carlo(hole_cards: list, board=(), dead=(), trials=None, time_budget=None, processes=None, seed=None) -> EquityResult:
+    """Estimate each player's equity by dealing random completions of the board.
+
+    Parameters
+    ----------
+    hole_cards : list(list(Card))
+        Each player's hole cards.
+    board : list(Card)
+        Board cards already known (0-5).
+    dead : list(Card)
+        Other cards known to be out of the deck.
+    trials : int
+        Number of boards to deal. Defaults to DEFAULT_TRIALS if time_budget isn't given either.
+    time_budget : float
+        Seconds to keep dealing for. If trials is also given, stops at whichever comes first. At least one chunk is always dealt, however small the budget.
+    processes : int
+        Worker processes to use. Defaults to os.cpu_count(); 1 runs in this process.
+    seed
+        Master seed. Trials are dealt in chunks of CHUNK_SIZE, chunk i from Stream(seed).spawn(i), and chunks are merged in order, so a trial count gives a bit for bit identical result with any number of processes.
+        A time_budget alone is not reproducible, since the number of chunks depends on speed.
+    """
+    holes, board_ids, known_mask = situation_ids(hole_cards, board, dead)
+    if trials is None and time_budget is None:
+        trials = DEFAULT_TRIALS
+    if trials is not None and trials < 1:
+        raise ValueError(f"At least 1 trial is needed, not {trials}.")
+    if processes is None:
+        processes = os.cpu_count() or 1
+    if seed is None:
+        seed = random.getrandbits(64)
+    deadline = None if time_budget is None else time.monotonic() + time_budget
+
+    def chunks():
+        """Yield (trials, stream path) for each chunk until trials or time run out."""
+        remaining = trials
+        index = 0
+        while remaining is None or remaining > 0:
+            if index and deadline is not None and time.monotonic() >= deadline:
+                return
+            size = CHUNK_SIZE if remaining is None else min(CHUNK_SIZE, remaining)
+            yield size, (index,)
+            index += 1
+            if remaining is not None:
+                remaining -= size
+
+    result = EquityResult(len(holes))
+    if processes == 1:
+        for size, path in chunks():
+            result.merge(run_chunk(holes, board_ids, known_mask, size, seed, path))
+        return result
+
+    # Merge chunks in order however they finish, so floating point sums are the same as in one process
+    finished = dict()
+    merged = 0
+    def collect(done):
+        nonlocal merged
+        for future in done:
+            index, chunk = future.result()
+            finished[index] = chunk
+        while merged in finished:
+            result.merge(finished.pop(merged))
+            merged += 1
+
+    with ProcessPoolExecutor(processes) as pool:
+        pending = set()
+        for size, path in chunks():
+            if len(pending) >= 2 * processes:
+                # Keep a couple of chunks queued per worker; no more
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                collect(done)
+            pending.add(pool.submit(_indexed_chunk, path[0], holes, board_ids, known_mask, size, seed, path))
+        collect(pending)
+    return result
+
+def _indexed_chunk(index: int, *args) -> tuple:
+    return index, run_chunk(*args)
+
+
+def suit_symmetries(masks: list) -> list:
+    """Every permutation of suit indexes (as a tuple) that maps each of the CardSet masks onto itself. Always includes the identity."""
+    return [perm for perm in itertools.permutations(range(4)) if all(permute_suits(mask, perm) == mask for mask in masks)]
+
+def exact(hole_cards: list, board=(), dead=()) -> ExactResult:
+    """Compute each player's exact win, tie, and loss fractions by evaluating every completion of the board. Requires numpy.
+
+    Boards that are the same up to a relabelling of suits which leaves every player's hole cards, the board, and the dead cards unchanged are evaluated once and weighted by how many there are.
+    The known board cards are added to each player's hole cards once, and the unknown cards of each completion are combined once for all players.
+    """
+    from . import Batch
+    import numpy as np
+
+    holes, board_ids, known_mask = situation_ids(hole_cards, board, dead)
+    if len(holes) > 10:
+        raise ValueError(f"{len(holes)} players given; at most 10 are supported.")
+
+    live = [i for i in range(52) if not known_mask >> i & 1]
+    keys, masks = Batch.combination_states(live, 5 - len(board_ids))
+
+    # Keep one board per equivalence class, weighted by the class size
+    hole_masks = [Evaluator.ids_state(hole)[1] for hole in holes]
+    board_key, board_mask = Evaluator.ids_state(board_ids)
+    dead_mask = known_mask & ~board_mask
+    for hole_mask in hole_masks:
+        dead_mask &= ~hole_mask
+    group = suit_symmetries(hole_masks + [board_mask, dead_mask])
+    weights = np.ones(len(masks), dtype=np.int64)
+    if len(group) > 1:
+        canonical = np.ones(len(masks), dtype=bool)
+        fixed = np.zeros(len(masks), dtype=np.int64)
+        for perm in group:
+            permuted = permute_suits(masks, perm)
+            canonical &= masks <= permuted
+            fixed += permuted == masks
+        keys, masks, weights = keys[canonical], masks[canonical], len(group) // fixed[canonical]
+
+    strengths = []
+    for hole in holes:
+        key, mask = Evaluator.ids_state(hole)
+        strengths.append(Batch.evaluate_state(keys + (board_key + key), masks | (board_mask | mask)))
+    strengths = np.stack(strengths)
+    winning = strengths == strengths.max(axis=0)
+    winners = winning.sum(axis=0)
+
+    result = ExactResult(len(holes))
+    result.trials = int(weights.sum())
+    for i in range(len(holes)):
+        result.wins[i] = int(weights[winning[i] & (winners == 1)].sum())
+        result.losses[i] = int(weights[~winning[i]].sum())
+        result.ties[i] = result.trials - result.wins[i] - result.losses[i]
+        share = Fraction(result.wins[i])
+        for k in range(2, len(holes) + 1):
+            share += Fraction(int(weights[winning[i] & (winners == k)].sum()), k)
+        result.shares[i] = share
+    return result
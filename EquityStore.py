@@ -0,0 +1,295 @@
+"""Persistent store of equity results, shared between processes and restarts through SQLite.
+
+Situations are stored under a canonical key, so every spot that is the same up to the order of cards, the order of players, and a relabelling of suits shares one entry:
+each player's hole cards, the board, and the dead cards are CardSet masks, and the key is the smallest (sorted player masks, board, dead) over the 24 suit permutations.
+Results are kept in canonical player order and put back in the caller's order on the way out.
+
+The database runs in write-ahead log mode, so any number of readers can work alongside a writer. Lookups only read: when results were last used is kept in memory
+and written in batches of TOUCH_BATCH (and before evicting or closing), so hits don't take the write lock. When the store grows past max_entries, the least recently used results are deleted.
+Precompute common spots with the warm command, e.g. python -m PlayingCards.EquityStore equity.db warm --hero "QQ+, AKs" --villain "QQ+, AKs"
+"""
+
+import argparse
+import itertools
+import json
+import sqlite3
+import sys
+import time
+from fractions import Fraction
+
+from .CardSet import CardSet, permute_suits
+from . import Equity
+from .Ranges import Range, parse_cards
+
+
+DEFAULT_MAX_ENTRIES = 100000
+# Hits remembered before their last used times are written
+TOUCH_BATCH = 256
+# Inserts between recounting the rows, which other processes may have added to
+COUNT_INTERVAL = 1000
+PERMUTATIONS = tuple(itertools.permutations(range(4)))
+EXACT = 'exact'
+MONTE_CARLO = 'monte_carlo'
+
+
+def canonical(hole_cards: list, board=(), dead=()) -> tuple:
+    """The canonical form of a situation.
+
+    Returns
+    -------
+    (str, list(int))
+        The key, and for each player in hole_cards, their index in the canonical player order.
+    """
+    masks = [CardSet(cards).mask for cards in hole_cards]
+    board_mask = CardSet(board).mask
+    dead_mask = CardSet(dead).mask
+    best = None
+    for perm in PERMUTATIONS:
+        permuted = [permute_suits(mask, perm) for mask in masks]
+        candidate = (sorted(permuted), permute_suits(board_mask, perm), permute_suits(dead_mask, perm))
+        if best is None or candidate < best[0]:
+            best = (candidate, permuted)
+    (players, board_mask, dead_mask), permuted = best
+    order = [players.index(mask) for mask in permuted]
+    key = f"{'.'.join(f'{mask:x}' for mask in players)}|{board_mask:x}|{dead_mask:x}"
+    return key, order
+
+def situation(key: str) -> tuple:
+    """The canonical (hole cards, board, dead) of a key from canonical."""
+    players, board, dead = key.split('|')
+    holes = [list(CardSet(mask=int(mask, 16))) for mask in players.split('.')]
+    return holes, list(CardSet(mask=int(board, 16))), list(CardSet(mask=int(dead, 16)))
+
+
+def _encode(result) -> str:
+    exact = isinstance(result, Equity.ExactResult)
+    fields = {
+        "trials": result.trials,
+        "wins": result.wins,
+        "ties": result.ties,
+        "shares": [str(share) for share in result.shares] if exact else result.shares,
+        "share_squares": result.share_squares
+    }
+    if exact:
+        fields["losses"] = result.losses
+    return json.dumps(fields)
+
+def _decode(text: str, order: list):
+    """An EquityResult (or ExactResult) from stored JSON, with players put back in the caller's order."""
+    fields = json.loads(text)
+    exact = "losses" in fields
+    result = Equity.ExactResult(len(order)) if exact else Equity.EquityResult(len(order))
+    result.trials = fields["trials"]
+    number = Fraction if exact else float
+    for i, position in enumerate(order):
+        result.wins[i] = fields["wins"][position]
+        result.ties[i] = fields["ties"][position]
+        result.shares[i] = number(fields["shares"][position])
+        result.share_squares[i] = fields["share_squares"][position]
+        if exact:
+            result.losses[i] = fields["losses"][position]
+    return result
+
+
+class EquityStore:
+    """Equity results in an SQLite database. Use as a context manager or call close().
+
+    Instance Variables
+    ------------------
+    path : str
+    max_entries : int or None
+        Most results kept; the least recently used are deleted past it. None keeps everything.
+    hits : int
+        Lookups answered from the store by this instance.
+    misses : int
+        Lookups this instance had to compute.
+    """
+
+    def __init__(self, path, max_entries=DEFAULT_MAX_ENTRIES, timeout=30.0):
+        """Open or create the store at path. timeout is how many seconds to wait for another process's write to finish."""
+        self.path = path
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self._connection = sqlite3.connect(path, timeout=timeout, isolation_level=None)
+        self._connection.execute("PRAGMA journal_mode=WAL")
+        self._connection.execute("PRAGMA synchronous=NORMAL")
+        self._connection.execute(
+            "CREATE TABLE IF NOT EXISTS results (key TEXT PRIMARY KEY, method TEXT NOT NULL, value TEXT NOT NULL, last_used REAL NOT NULL)")
+        self._connection.execute("CREATE INDEX IF NOT EXISTS results_last_used ON results (last_used)")
+        # Last used times of hits not yet written, and an estimate of the rows kept up to date by this instance's inserts
+        self._touched = dict()
+        self._count = len(self)
+        self._inserts = 0
+
+    @staticmethod
+    def _method_key(key: str, method: str, trials) -> str:
+        return f"{key}|{EXACT}" if method == EXACT else f"{key}|{MONTE_CARLO}:{trials}"
+
+    def get(self, hole_cards: list, board=(), dead=(), method=EXACT, trials=Equity.DEFAULT_TRIALS):
+        """The stored result of a situation, or None. Takes the arguments of equity."""
+        key, order = canonical(hole_cards, board, dead)
+        stored_key = self._method_key(key, method, trials)
+        row = self._connection.execute("SELECT value FROM results WHERE key = ?", (stored_key,)).fetchone()
+        if row is None:
+            return None
+        self._touch(stored_key)
+        return _decode(row[0], order)
+
+    def equity(self, hole_cards: list, board=(), dead=(), method=EXACT, trials=Equity.DEFAULT_TRIALS, processes=None):
+        """Each player's equity in a situation, from the store if it has been computed before.
+
+        Parameters
+        ----------
+        method : str
+            EXACT for Equity.exact (returns an ExactResult; requires numpy), or MONTE_CARLO for Equity.monte_carlo with trials trials (returns an EquityResult).
+            Monte Carlo results are seeded by the situation's key, so they are the same whichever process computed them.
+        processes : int
+            Worker processes for Monte Carlo.
+        """
+        if method not in (EXACT, MONTE_CARLO):
+            raise ValueError(f"Unknown method {method!r}; use {EXACT!r} or {MONTE_CARLO!r}.")
+        Equity.situation_ids(hole_cards, board, dead)
+        key, order = canonical(hole_cards, board, dead)
+        stored_key = self._method_key(key, method, trials)
+        row = self._connection.execute("SELECT value FROM results WHERE key = ?", (stored_key,)).fetchone()
+        if row is not None:
+            self.hits += 1
+            self._touch(stored_key)
+            return _decode(row[0], order)
+
+        self.misses += 1
+        holes, canonical_board, canonical_dead = situation(key)
+        if method == EXACT:
+            result = Equity.exact(holes, canonical_board, canonical_dead)
+        else:
+            result = Equity.monte_carlo(holes, canonical_board, canonical_dead, trials=trials, processes=processes, seed=stored_key)
+        value = _encode(result)
+        self._connection.execute("INSERT OR REPLACE INTO results VALUES (?, ?, ?, ?)", (stored_key, method, value, time.time()))
+        self._count += 1
+        self._inserts += 1
+        if self._inserts >= COUNT_INTERVAL:
+            self._count = len(self)
+            self._inserts = 0
+        if self.max_entries is not None and self._count > self.max_entries:
+            self.evict()
+        return _decode(value, order)
+
+    def _touch(self, stored_key: str):
+        """Note a hit, writing the batch of last used times once it is full."""
+        self._touched[stored_key] = time.time()
+        if len(self._touched) >= TOUCH_BATCH:
+            self.flush()
+
+    def flush(self):
+        """Write the last used times of hits so far in one transaction."""
+        if not self._touched:
+            return
+        touched = [(used, key) for key, used in self._touched.items()]
+        self._touched.clear()
+        with self._connection:
+            self._connection.execute("BEGIN")
+            self._connection.executemany("UPDATE results SET last_used = ? WHERE key = ?", touched)
+
+    def evict(self) -> int:
+        """Delete the least recently used results past max_entries. Returns how many were deleted."""
+        if self.max_entries is None:
+            return 0
+        self.flush()
+        self._count = len(self)
+        self._inserts = 0
+        excess = self._count - self.max_entries
+        if excess <= 0:
+            return 0
+        self._connection.execute(
+            "DELETE FROM results WHERE key IN (SELECT key FROM results ORDER BY last_used LIMIT ?)", (excess,))
+        self._count -= excess
+        return excess
+
+    def warm(self, spots, method=EXACT, trials=Equity.DEFAULT_TRIALS, processes=None, progress=None) -> int:
+        """Compute and store every situation (hole cards, board, dead) in spots that isn't stored yet. Returns the number computed."""
+        computed = 0
+        for hole_cards, board, dead in spots:
+            misses = self.misses
+            self.equity(hole_cards, board, dead, method, trials, processes)
+            computed += self.misses - misses
+            if progress is not None:
+                progress(computed)
+        return computed
+
+    def __len__(self):
+        return self._connection.execute("SELECT COUNT(*) FROM results").fetchone()[0]
+
+    def stats(self) -> dict:
+        lookups = self.hits + self.misses
+        return {
+            "entries": len(self),
+            "max_entries": self.max_entries,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / lookups if lookups else 0.0
+        }
+
+    def close(self):
+        """Write pending last used times and close the database."""
+        self.flush()
+        self._connection.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+        return False
+
+
+def heads_up_spots(hero: Range, villain: Range, board=(), dead=()):
+    """Yield one (hole cards, board, dead) situation per canonical heads up matchup of a hero and villain combo, skipping combos blocked by the board or dead cards."""
+    blocked = CardSet(list(board) + list(dead)).mask
+    seen = set()
+    villain_combos = villain.combos(blocked)
+    for hero_cards, _ in hero.combos(blocked):
+        hero_mask = CardSet(hero_cards).mask
+        for villain_cards, _ in villain_combos:
+            if CardSet(villain_cards).mask & hero_mask:
+                continue
+            key, _ = canonical([hero_cards, villain_cards], board, dead)
+            if key not in seen:
+                seen.add(key)
+                yield [list(hero_cards), list(villain_cards)], list(board), list(dead)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Persistent equity result store.")
+    parser.add_argument("database", help="SQLite file of the store.")
+    parser.add_argument("--max-entries", type=int, default=DEFAULT_MAX_ENTRIES)
+    commands = parser.add_subparsers(dest="command", required=True)
+    warm = commands.add_parser("warm", help="Precompute heads up matchups between two ranges.")
+    warm.add_argument("--hero", default="QQ+, AKs, AKo", help="Hero range (default QQ+, AKs, AKo).")
+    warm.add_argument("--villain", help="Villain range (default the hero range).")
+    warm.add_argument("--board", default="", help="Board cards, e.g. AsKh7d (default preflop).")
+    warm.add_argument("--dead", default="", help="Dead cards.")
+    warm.add_argument("--method", choices=(EXACT, MONTE_CARLO), default=EXACT)
+    warm.add_argument("--trials", type=int, default=Equity.DEFAULT_TRIALS, help="Monte Carlo trials per spot.")
+    warm.add_argument("--processes", type=int, help="Worker processes for Monte Carlo.")
+    warm.add_argument("--quiet", action="store_true", help="Don't report progress.")
+    commands.add_parser("stats", help="Show the number of stored results.")
+    args = parser.parse_args(argv)
+
+    with EquityStore(args.database, args.max_entries) as store:
+        if args.command == "warm":
+            board = parse_cards(args.board)
+            dead = parse_cards(args.dead)
+            spots = list(heads_up_spots(Range(args.hero), Range(args.villain or args.hero), board, dead))
+            start = time.perf_counter()
+            progress = None if args.quiet else lambda done: print(f"\r{done} computed", end='', file=sys.stderr, flush=True)
+            computed = store.warm(spots, args.method, args.trials, args.processes, progress)
+            if not args.quiet:
+                print(f"\r{len(spots)} spots, {computed} computed in {time.perf_counter() - start:.1f}s, {len(store)} stored", file=sys.stderr)
+        else:
+            print(json.dumps(store.stats(), indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
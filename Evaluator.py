@@ -0,0 +1,217 @@
+"""Table-driven poker hand evaluator. Produces the same categories and ordering as PokerHands, encoded as a single integer strength.
+
+A strength packs the index of the hand's class in PokerHands.hand_hierarchy above five 4 bit card values (highest priority first). Larger is better.
+Ranks are looked up by a base 5 key (the sum of 5 ** (value - 2) over the cards, which is unique for every value multiset) and flushes by the 13 bit mask of the values in a suit.
+The cards themselves are a CardSet mask (bit card.id per card), so suit masks are 13 bit slices of it. Keys and masks of disjoint groups of cards can simply be added.
+"""
+
+from .Card import all_cards
+from .Suits import all_suits
+from . import PokerHands
+
+
+CATEGORY_SHIFT = 20
+KICKER_BITS = 4
+
+HIGH_CARD, PAIR, TWO_PAIR, THREE_KIND, STRAIGHT, FLUSH, FULL_HOUSE, FOUR_KIND, STRAIGHT_FLUSH, ROYAL_FLUSH = range(10)
+
+suit_index = {suit: i for i, suit in enumerate(all_suits)}
+rank_key = {value: 5 ** (value - 2) for value in range(2, 15)}
+rank_bit = {value: 1 << (value - 2) for value in range(2, 15)}
+# rank_key of each card, indexed by Card.id
+card_keys = tuple(rank_key[card.value] for card in all_cards)
+
+_WHEEL = rank_bit[14] | rank_bit[2] | rank_bit[3] | rank_bit[4] | rank_bit[5]
+
+
+def make_strength(category: int, values: list) -> int:
+    """Pack a category and up to 5 card values (highest priority first) into a strength. Missing values count as 0."""
+    strength = category
+    for i in range(5):
+        strength <<= KICKER_BITS
+        if i < len(values):
+            strength |= values[i]
+    return strength
+
+def category(strength: int) -> int:
+    """The index in PokerHands.hand_hierarchy of the hand a strength represents."""
+    return strength >> CATEGORY_SHIFT
+
+def kickers(strength: int) -> list:
+    """The card values packed into a strength, highest priority first. Ace-low straights report the Ace as 1."""
+    values = []
+    for i in range(4, -1, -1):
+        value = (strength >> (KICKER_BITS * i)) & 0xF
+        if value:
+            values.append(value)
+    return values
+
+
+def _straight_high(mask: int) -> int:
+    """The top value of the highest straight in a value mask, or 0. The wheel (Ace to 5) is 5 high."""
+    for top in range(14, 5, -1):
+        run = 0b11111 << (top - 6)
+        if mask & run == run:
+            return top
+    if mask & _WHEEL == _WHEEL:
+        return 5
+    return 0
+
+def _straight_values(top: int) -> list:
+    return [top - i for i in range(5)]
+
+
+def _build_straight_table():
+    return [_straight_high(mask) for mask in range(1 << 13)]
+
+straight_table = _build_straight_table()
+
+
+def _build_flush_table():
+    """Strength of the best flush or straight flush for every suit mask. 0 where there are fewer than 5 cards."""
+    table = [0] * (1 << 13)
+    for mask in range(1 << 13):
+        if bin(mask).count('1') < 5:
+            continue
+        top = straight_table[mask]
+        if top:
+            if top == 14:
+                table[mask] = make_strength(ROYAL_FLUSH, _straight_values(top))
+            else:
+                table[mask] = make_strength(STRAIGHT_FLUSH, _straight_values(top))
+        else:
+            values = [value for value in range(14, 1, -1) if mask & rank_bit[value]]
+            table[mask] = make_strength(FLUSH, values[:5])
+    return table
+
+flush_table = _build_flush_table()
+
+
+def _counts_strength(counts: dict) -> int:
+    """Strength of the best hand (ignoring suits) for a dictionary of value: count."""
+    values = [value for value in range(14, 1, -1) if counts.get(value)]
+    quads = [value for value in values if counts[value] >= 4]
+    trips = [value for value in values if counts[value] == 3]
+    pairs = [value for value in values if counts[value] == 2]
+
+    if quads:
+        quad = quads[0]
+        return make_strength(FOUR_KIND, [quad] * 4 + [value for value in values if value != quad][:1])
+
+    if trips and (len(trips) >= 2 or pairs):
+        three = trips[0]
+        two = max(trips[1:2] + pairs[:1])
+        return make_strength(FULL_HOUSE, [three] * 3 + [two] * 2)
+
+    mask = 0
+    for value in values:
+        mask |= rank_bit[value]
+    top = straight_table[mask]
+    if top:
+        return make_strength(STRAIGHT, _straight_values(top))
+
+    if trips:
+        three = trips[0]
+        return make_strength(THREE_KIND, [three] * 3 + [value for value in values if value != three][:2])
+
+    if len(pairs) >= 2:
+        high, low = pairs[0], pairs[1]
+        rest = [value for value in values if value != high and value != low]
+        return make_strength(TWO_PAIR, [high] * 2 + [low] * 2 + rest[:1])
+
+    if pairs:
+        pair = pairs[0]
+        return make_strength(PAIR, [pair] * 2 + [value for value in values if value != pair][:3])
+
+    return make_strength(HIGH_CARD, values[:5])
+
+def _key_counts(key: int) -> dict:
+    counts = dict()
+    for value in range(2, 15):
+        key, count = divmod(key, 5)
+        if count:
+            counts[value] = count
+    return counts
+
+
+class _RankTable(dict):
+    """Maps base 5 value keys to the best non-flush strength. Entries are computed the first time they are looked up."""
+
+    def __missing__(self, key):
+        strength = _counts_strength(_key_counts(key))
+        self[key] = strength
+        return strength
+
+rank_table = _RankTable()
+
+
+def build_rank_table(max_cards=7):
+    """Fill rank_table for every value multiset of up to max_cards cards (a single deck). Returns rank_table."""
+    def fill(value, key, remaining):
+        if value > 14:
+            rank_table[key]
+            return
+        for count in range(min(4, remaining) + 1):
+            fill(value + 1, key + count * rank_key[value], remaining - count)
+
+    fill(2, 0, max_cards)
+    return rank_table
+
+
+def evaluate_state(key: int, mask: int) -> int:
+    """Strength from a base 5 value key and a CardSet mask of the same cards."""
+    best = rank_table[key]
+    for shift in (0, 13, 26, 39):
+        flush = flush_table[mask >> shift & 0x1FFF]
+        if flush > best:
+            best = flush
+    return best
+
+def state(cards) -> tuple:
+    """The (value key, CardSet mask) of cards."""
+    key = 0
+    mask = 0
+    for card in cards:
+        key += card_keys[card.id]
+        mask |= 1 << card.id
+    return key, mask
+
+def ids_state(ids) -> tuple:
+    """The (value key, CardSet mask) of the cards with the given ids."""
+    key = 0
+    mask = 0
+    for i in ids:
+        key += card_keys[i]
+        mask |= 1 << i
+    return key, mask
+
+def evaluate(cards) -> int:
+    """Strength of the best poker hand that can be made from cards (any number of them)."""
+    key = 0
+    mask = 0
+    for card in cards:
+        key += card_keys[card.id]
+        mask |= 1 << card.id
+    return evaluate_state(key, mask)
+
+
+def to_pokerhand(cards, strength: int):
+    """Build the PokerHands object described by strength out of cards. Cards of equal value are taken in the order they appear."""
+    hand_category = category(strength)
+    pool = list(cards)
+    if hand_category in (FLUSH, STRAIGHT_FLUSH, ROYAL_FLUSH):
+        mask = state(pool)[1]
+        for suit, i in suit_index.items():
+            if flush_table[mask >> (13 * i) & 0x1FFF] == strength:
+                pool = [card for card in pool if card.suit is suit]
+                break
+
+    chosen = []
+    for value in kickers(strength):
+        if value == 1:
+            value = 14
+        for i, card in enumerate(pool):
+            if card.value == value:
+                chosen.append(pool.pop(i))
+                break
+    return PokerHands.hand_hierarchy[hand_category](chosen, strength)
@@ -1,20 +1,57 @@
 """Hand class with algorithms to determine value."""
 
 from .Card import Card, sort_cards
+from . import Evaluator
 from . import PokerHands
 from .Suits import all_suits
 
 
 class Hand:
-    """Contains cards that build with each other to form hands."""
+    """Contains cards that build with each other to form hands.
+    
+    Instance Variables
+    ------------------
+    cards : list(Card)
+        The cards in the hand, in the order they were added. Change it only through add, remove, and pop, which keep _key and _mask in step in O(1);
+        the hand uses the list it was made with, so the caller must not change that list either. To evaluate other cards, make a new Hand.
+    _key : int
+        Base 5 value key of the cards (see Evaluator); digit value - 2 counts the cards of that value.
+    _mask : int
+        CardSet mask of the cards; each 13 bit slice is the values held in one suit.
+    """
+
+    # EvaluationCache that evaluate_poker looks results up in, set by Cache.install
+    _cache = None
 
     def __init__(self, cards: list):
         """Add the collection cards to the hand."""
         self.cards = cards
+        self._key, self._mask = Evaluator.state(cards)
 
     def add(self, card: Card):
         """Add card to hand."""
         self.cards.append(card)
+        self._key += Evaluator.card_keys[card.id]
+        self._mask |= 1 << card.id
+
+    def remove(self, card: Card):
+        """Remove card (the same suit and value) from hand. Raises ValueError if it is not in the hand."""
+        for i in range(len(self.cards) - 1, -1, -1):
+            if self.cards[i] & card:
+                self._discard(self.cards.pop(i))
+                return
+        raise ValueError(f"{card} is not in the hand.")
+
+    def pop(self) -> Card:
+        """Remove and return the last card added. Undoes add."""
+        card = self.cards.pop()
+        self._discard(card)
+        return card
+
+    def _discard(self, card: Card):
+        """Take a card just removed from cards out of the value key and mask."""
+        self._key -= Evaluator.card_keys[card.id]
+        self._mask &= ~(1 << card.id)
 
     def card_strs(self) -> list:
         """Get the hand's string as a list of card strings."""
@@ -30,6 +67,14 @@ class Hand:
             new_cards.append(c)
         return Hand(new_cards)
 
+    def state(self) -> tuple:
+        """The hand's (value key, CardSet mask) as used by Evaluator. The mask identifies the cards regardless of order."""
+        return self._key, self._mask
+
+    def strength(self) -> int:
+        """Strength of the best poker hand possible with the cards (see Evaluator). Only reads the hand's value key and mask."""
+        return Evaluator.evaluate_state(self._key, self._mask)
+
 
     def make_histograms(self):
         """Create value and suit histograms. The histograms have a key of int and Suit, respectively, and a value of a list of cards."""
@@ -52,7 +97,16 @@ class Hand:
 
 
     def evaluate_poker(self):
-        """Creates the best poker hand possible with the cards and returns it. Returns PokerHands.PokerHand or one of its children."""
+        """Creates the best poker hand possible with the cards and returns it. Returns PokerHands.PokerHand or one of its children.
+        Uses the table-driven Evaluator on the hand's running value key and mask, or the installed Cache.EvaluationCache; evaluate_poker_histogram gives the same result."""
+        cache = Hand._cache
+        if cache is not None:
+            key, mask = self.state()
+            return cache._evaluate(self.cards, key, mask)
+        return Evaluator.to_pokerhand(self.cards, self.strength())
+
+    def evaluate_poker_histogram(self):
+        """Creates the best poker hand possible with the cards by building histograms. Returns PokerHands.PokerHand or one of its children."""
         self.make_histograms()
 
         flush = self.flush_check()
@@ -64,12 +118,13 @@ class Hand:
 
         if straight:
             if flush:
-                # Possible Straight Flush
+                # Possible Straight Flush; look for a straight within the flush suit only
+                flush_values = {card.value: card for card in flush}
                 straight_flush = []
-                for n in straight:
-                    for card in n:
-                        if card in flush:
-                            straight_flush.append(card)
+                for value in (14, 13, 12, 11, 10, 9, 8, 7, 6, 5, 4, 3, 2, 14):
+                    if value in flush_values:
+                        straight_flush.append(flush_values[value])
+                        if len(straight_flush) == 5:
                             break
                     else:
                         straight_flush = []
@@ -101,10 +156,13 @@ class Hand:
         
         if kinds[3]:
             # Possible Full House
-            three_kind = kinds[3][0]
-            if kinds[2]:
+            three_kind = list(kinds[3][0])
+            # A second three-of-a-kind can fill the pair
+            fills = kinds[3][1:2] + kinds[2][:1]
+            if fills:
                 # Full House
-                for card in kinds[2][0]:
+                pair = max(fills, key=lambda cards: cards[0].value)
+                for card in pair[:2]:
                     three_kind.append(card)
                 return PokerHands.Full_House(three_kind)
 
@@ -117,12 +175,12 @@ class Hand:
 
         if kinds[3]:
             # Three of a kind (Not Full House; already checked)
-            three_kind = kinds[3][0]
+            three_kind = list(kinds[3][0])
             return PokerHands.Three_Kind(self.fill_pokerhand(three_kind))
 
         if kinds[2]:
             # Pair; Possible Two Pair
-            pair = kinds[2][0]
+            pair = list(kinds[2][0])
 
             if len(kinds[2]) >= 2:
                 # Two Pair
@@ -170,8 +228,8 @@ class Hand:
             Returned when straight is not found.
         """
         straight = []
-        # Iterates through each possible card value
-        for value in range(14, 1, -1):
+        # Iterates through each possible card value, ending with Ace again as low
+        for value in (14, 13, 12, 11, 10, 9, 8, 7, 6, 5, 4, 3, 2, 14):
             try:
                 cards = self.value_spread[value]
                 straight.append(cards)
@@ -182,6 +240,9 @@ class Hand:
                     return straight
                 straight = []
         
+        if len(straight) >= 5:
+            # The straight ran down to the low Ace
+            return straight
         return False
 
     def of_a_kind_check(self):
@@ -197,11 +258,13 @@ class Hand:
             3: [],
             4: []
         }
-        for _, cards in self.value_spread.items():
-            try:
-                of_a_kinds[len(cards)].append(cards)
-            except KeyError:
-                pass
+        for value in range(14, 1, -1):
+            cards = self.value_spread.get(value)
+            if cards:
+                try:
+                    of_a_kinds[len(cards)].append(cards)
+                except KeyError:
+                    pass
 
         return of_a_kinds
 
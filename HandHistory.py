@@ -0,0 +1,221 @@
+"""Compact binary hand history files. Each dealt hand is a fixed width record, so files can be appended to in bulk and read through a memory map without parsing.
+
+File layout (little endian)
+---------------------------
+Header, HEADER.size bytes: magic b'PCHH', format version, players per record, record size in bytes.
+Records, one after another:
+    ranks : players x uint32
+        Each player's strength (see Evaluator) with the board, or 0 if not evaluated.
+    board : 5 x uint8
+        Board card ids (Card.id), NO_CARD where not dealt.
+    holes : players x 2 x uint8
+        Each player's hole card ids, NO_CARD where not dealt.
+    padding to a multiple of 4 bytes.
+"""
+
+import mmap
+import os
+import struct
+
+from .Card import NO_CARD, all_cards
+from . import Evaluator
+from .Hand import Hand
+
+
+MAGIC = b'PCHH'
+VERSION = 1
+HEADER = struct.Struct('<4sBBHI')
+
+
+def record_struct(players: int) -> struct.Struct:
+    """The struct of one record for the given number of players."""
+    size = 4 * players + 5 + 2 * players
+    return struct.Struct(f'<{players}I{5 + 2 * players}B{-size % 4}x')
+
+def record_dtype(players: int):
+    """The numpy dtype of one record. Requires numpy."""
+    import numpy as np
+    return np.dtype({
+        'names': ['ranks', 'board', 'holes'],
+        'formats': [('<u4', (players,)), ('u1', (5,)), ('u1', (players, 2))],
+        'offsets': [0, 4 * players, 4 * players + 5],
+        'itemsize': record_struct(players).size
+    })
+
+def _read_header(file, path) -> tuple:
+    magic, version, players, _, record_size = HEADER.unpack(file.read(HEADER.size))
+    if magic != MAGIC:
+        raise ValueError(f"{path} is not a hand history file.")
+    if version != VERSION:
+        raise ValueError(f"{path} is format version {version}; only version {VERSION} is supported.")
+    if record_size != record_struct(players).size:
+        raise ValueError(f"{path} has a corrupt header.")
+    return players, record_size
+
+
+class HandHistoryWriter:
+    """Appends records to a hand history file, creating it if needed. Records are buffered and written in bulk; use as a context manager or call close().
+
+    Instance Variables
+    ------------------
+    players : int
+        Number of players in every record of the file.
+    buffer_records : int
+        Records held in memory before they are written out.
+    """
+
+    def __init__(self, path, players: int, buffer_records=4096):
+        if not 1 <= players <= 255:
+            raise ValueError(f"{players} players cannot be stored; 1 to 255 are allowed.")
+        self.path = path
+        self.players = players
+        self.buffer_records = buffer_records
+        self._record = record_struct(players)
+        self._buffer = bytearray()
+        self._pending = 0
+
+        self._file = open(path, 'ab+')
+        self._file.seek(0)
+        if os.fstat(self._file.fileno()).st_size == 0:
+            self._file.write(HEADER.pack(MAGIC, VERSION, players, 0, self._record.size))
+        else:
+            existing, _ = _read_header(self._file, path)
+            if existing != players:
+                self._file.close()
+                raise ValueError(f"{path} holds {existing} player records, not {players}.")
+
+    def write_ids(self, board: list, holes: list, ranks: list):
+        """Add a record from card ids. board has up to 5 ids; holes has one list of up to 2 ids per player; ranks has one strength per player."""
+        if len(holes) != self.players or len(ranks) != self.players:
+            raise ValueError(f"Expected {self.players} players' hole cards and ranks.")
+        cards = list(board) + [NO_CARD] * (5 - len(board))
+        for hole in holes:
+            cards.extend(hole)
+            cards.extend([NO_CARD] * (2 - len(hole)))
+        self._buffer += self._record.pack(*ranks, *cards)
+        self._pending += 1
+        if self._pending >= self.buffer_records:
+            self.flush()
+
+    def write(self, board: list, holes: list, ranks=None):
+        """Add a record from Cards. If ranks isn't given, each player's hole cards are evaluated with the board."""
+        if ranks is None:
+            ranks = [Evaluator.evaluate(list(hole) + list(board)) for hole in holes]
+        self.write_ids([card.id for card in board], [[card.id for card in hole] for hole in holes], ranks)
+
+    def write_raw(self, data):
+        """Add already packed records (bytes, or a numpy array of record_dtype)."""
+        data = memoryview(data).cast('B')
+        if len(data) % self._record.size:
+            raise ValueError("Data is not a whole number of records.")
+        self.flush()
+        self._file.write(data)
+
+    def flush(self):
+        """Write buffered records to the file."""
+        if self._buffer:
+            self._file.write(self._buffer)
+            self._buffer = bytearray()
+            self._pending = 0
+        self._file.flush()
+
+    def close(self):
+        self.flush()
+        self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+        return False
+
+
+class HandHistoryReader:
+    """Reads a hand history file through a read-only memory map. Records are decoded only when asked for.
+
+    Instance Variables
+    ------------------
+    players : int
+        Number of players in every record.
+    record_size : int
+        Bytes per record.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self._file = open(path, 'rb')
+        self.players, self.record_size = _read_header(self._file, path)
+        self._record = record_struct(self.players)
+        size = os.fstat(self._file.fileno()).st_size
+        self._count = (size - HEADER.size) // self.record_size
+        self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ) if self._count else None
+
+    def __len__(self):
+        return self._count
+
+    def record_ids(self, i: int) -> tuple:
+        """Record i as (board ids, list of hole id tuples, ranks). Cards not dealt are left out."""
+        if not 0 <= i < self._count:
+            raise IndexError(f"Record {i} is out of range.")
+        values = self._record.unpack_from(self._map, HEADER.size + i * self.record_size)
+        ranks = values[:self.players]
+        board = tuple(card for card in values[self.players:self.players + 5] if card != NO_CARD)
+        holes = []
+        for p in range(self.players):
+            start = self.players + 5 + 2 * p
+            holes.append(tuple(card for card in values[start:start + 2] if card != NO_CARD))
+        return board, holes, ranks
+
+    def board(self, i: int) -> list:
+        """The board cards of record i."""
+        return [all_cards[card] for card in self.record_ids(i)[0]]
+
+    def hands(self, i: int) -> list:
+        """Each player's Hand (hole cards then board) in record i."""
+        board, holes, _ = self.record_ids(i)
+        return [Hand([all_cards[card] for card in hole + board]) for hole in holes]
+
+    def pokerhands(self, i: int) -> list:
+        """Each player's PokerHand in record i, built from the stored ranks without evaluating. Players with no stored rank are evaluated."""
+        board, holes, ranks = self.record_ids(i)
+        results = []
+        for hole, rank in zip(holes, ranks):
+            cards = [all_cards[card] for card in hole + board]
+            results.append(Evaluator.to_pokerhand(cards, rank or Evaluator.evaluate(cards)))
+        return results
+
+    def __iter__(self):
+        for i in range(self._count):
+            yield self.record_ids(i)
+
+
+    def raw(self, start=0, stop=None) -> memoryview:
+        """The bytes of records start to stop, without copying."""
+        stop = self._count if stop is None else min(stop, self._count)
+        if not self._count or start >= stop:
+            return memoryview(b'')
+        return memoryview(self._map)[HEADER.size + start * self.record_size:HEADER.size + stop * self.record_size]
+
+    def arrays(self, start=0, stop=None):
+        """Records start to stop as a numpy array of record_dtype viewing the memory map (no copy). Fields: 'ranks', 'board', 'holes'. Requires numpy."""
+        import numpy as np
+        stop = self._count if stop is None else min(stop, self._count)
+        dtype = record_dtype(self.players)
+        if not self._count or start >= stop:
+            return np.zeros(0, dtype=dtype)
+        return np.frombuffer(self._map, dtype=dtype, count=stop - start, offset=HEADER.size + start * self.record_size)
+
+
+    def close(self):
+        """Close the file. Views returned by raw or arrays must be released first."""
+        if self._map is not None:
+            self._map.close()
+        self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+        return False
@@ -0,0 +1,74 @@
+"""Omaha hand evaluation: the best hand using exactly two hole cards and three board cards, for 4 and 5 card Omaha.
+
+Without flushes, only the values of a five card hand matter, so each distinct pair of hole values is combined with each distinct triple of board values and looked up once in Evaluator.rank_table.
+Flushes are only possible in a suit with at least three board cards and two hole cards, so on most boards they are skipped entirely; otherwise only that suit's cards are combined, through Evaluator.flush_table.
+"""
+
+import itertools
+
+from . import Evaluator
+from .Showdown import tiers
+
+
+def _check(hole_cards: list, board: list):
+    if not 4 <= len(hole_cards) <= 5:
+        raise ValueError(f"Omaha hands have 4 or 5 hole cards, not {len(hole_cards)}.")
+    if not 3 <= len(board) <= 5:
+        raise ValueError(f"The board has {len(board)} cards; 3 to 5 are needed.")
+    if len(set(card.id for card in hole_cards) | set(card.id for card in board)) != len(hole_cards) + len(board):
+        raise ValueError("A card was used more than once.")
+
+def _value_keys(cards: list, k: int) -> dict:
+    """Base 5 value key of each k-card combination of cards, to one combination with that key."""
+    card_keys = Evaluator.card_keys
+    keys = dict()
+    for combination in itertools.combinations(cards, k):
+        keys.setdefault(sum(card_keys[card.id] for card in combination), combination)
+    return keys
+
+def _suit_cards(cards: list) -> list:
+    """Cards grouped by suit index."""
+    suits = [[], [], [], []]
+    for card in cards:
+        suits[card.id // 13].append(card)
+    return suits
+
+def best_hand(hole_cards: list, board: list) -> tuple:
+    """The best Omaha hand. Returns (strength, hole cards used, board cards used). Raises ValueError for a wrong number of cards or a card used twice."""
+    _check(hole_cards, board)
+    rank_table = Evaluator.rank_table
+    best = -1
+    best_hole = best_board = None
+    board_keys = _value_keys(board, 3)
+    for hole_key, hole in _value_keys(hole_cards, 2).items():
+        for board_key, triple in board_keys.items():
+            strength = rank_table[hole_key + board_key]
+            if strength > best:
+                best, best_hole, best_board = strength, hole, triple
+
+    flush_table = Evaluator.flush_table
+    board_suits = _suit_cards(board)
+    for suit, hole in enumerate(_suit_cards(hole_cards)):
+        if len(board_suits[suit]) < 3 or len(hole) < 2:
+            continue
+        for pair in itertools.combinations(hole, 2):
+            pair_bits = 1 << pair[0].id % 13 | 1 << pair[1].id % 13
+            for triple in itertools.combinations(board_suits[suit], 3):
+                strength = flush_table[pair_bits | 1 << triple[0].id % 13 | 1 << triple[1].id % 13 | 1 << triple[2].id % 13]
+                if strength > best:
+                    best, best_hole, best_board = strength, pair, triple
+    return best, list(best_hole), list(best_board)
+
+def evaluate(hole_cards: list, board: list) -> int:
+    """Strength (see Evaluator) of the best Omaha hand."""
+    return best_hand(hole_cards, board)[0]
+
+def evaluate_poker(hole_cards: list, board: list):
+    """The best Omaha hand as a PokerHand of the five cards used."""
+    strength, hole, triple = best_hand(hole_cards, board)
+    return Evaluator.to_pokerhand(hole + triple, strength)
+
+
+def showdown(board: list, players: list) -> list:
+    """Rank Omaha players sharing board. Returns tiers of player indexes with equal hands, best first (see Showdown.tiers)."""
+    return tiers([evaluate(hole, board) for hole in players])
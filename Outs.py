@@ -0,0 +1,184 @@
+"""Outs and draw analysis on the flop and turn.
+
+Only cards that can complete a flush need to be evaluated one by one: every other unseen card of the same value gives the same hand, so it is looked up once per value.
+A suit can only complete a flush if it already has enough cards in the hand (5 minus the cards still to come); on most boards that leaves at most one suit.
+Evaluations add each card to the hand's value key and mask (see Evaluator), so nothing is rebuilt from the cards.
+Two card runouts from the flop are counted the same way, by pairs of values with multiplicities, with only the flush suit's cards paired explicitly.
+"""
+
+from .CardSet import CardSet
+from . import Evaluator
+from . import PokerHands
+
+
+def _live_suits(mask: int, to_come: int) -> int:
+    """CardSet mask of every card in a suit that can still make a flush with to_come more cards."""
+    live = 0
+    for suit in range(4):
+        if ((mask >> (13 * suit)) & 0x1FFF).bit_count() + to_come >= 5:
+            live |= 0x1FFF << (13 * suit)
+    return live
+
+def _ids(mask: int) -> list:
+    return list(CardSet(mask=mask).ids())
+
+def next_card_strengths(key: int, mask: int, unseen: int) -> dict:
+    """Strength of the hand with state (key, mask) plus each card in the unseen mask, by card id."""
+    card_keys = Evaluator.card_keys
+    evaluate_state = Evaluator.evaluate_state
+    live = _live_suits(mask, 1)
+    by_value = dict()
+    strengths = dict()
+    for i in _ids(unseen):
+        bit = 1 << i
+        if bit & live:
+            strengths[i] = evaluate_state(key + card_keys[i], mask | bit)
+        else:
+            value = i % 13
+            strength = by_value.get(value)
+            if strength is None:
+                strength = by_value[value] = evaluate_state(key + card_keys[i], mask | bit)
+            strengths[i] = strength
+    return strengths
+
+def two_card_categories(key: int, mask: int, unseen: int) -> dict:
+    """Number of pairs of unseen cards giving each category when added to the hand with state (key, mask)."""
+    card_keys = Evaluator.card_keys
+    evaluate_state = Evaluator.evaluate_state
+    live = _live_suits(mask, 2)
+    flush_ids = _ids(unseen & live)
+    # Cards that cannot make a flush: one representative per value and how many share it
+    counts = [0] * 13
+    representative = [0] * 13
+    for i in _ids(unseen & ~live):
+        counts[i % 13] += 1
+        representative[i % 13] = i
+    values = [value for value in range(13) if counts[value]]
+
+    tally = dict()
+    def count(strength, weight):
+        category = Evaluator.category(strength)
+        tally[category] = tally.get(category, 0) + weight
+
+    for a, v in enumerate(values):
+        first = representative[v]
+        for w in values[a:]:
+            second = representative[w]
+            weight = counts[v] * (counts[v] - 1) // 2 if v == w else counts[v] * counts[w]
+            if weight:
+                count(evaluate_state(key + card_keys[first] + card_keys[second], mask | 1 << first | 1 << second), weight)
+    for a, first in enumerate(flush_ids):
+        key_first = key + card_keys[first]
+        mask_first = mask | 1 << first
+        for w in values:
+            second = representative[w]
+            count(evaluate_state(key_first + card_keys[second], mask_first | 1 << second), counts[w])
+        for second in flush_ids[a + 1:]:
+            count(evaluate_state(key_first + card_keys[second], mask_first | 1 << second), 1)
+    return tally
+
+
+class OutsReport:
+    """Draws of one player's hand on a flop or turn board.
+
+    Instance Variables
+    ------------------
+    strength : int
+        Current strength (see Evaluator).
+    category : int
+        Current category, an index into PokerHands.hand_hierarchy.
+    unseen : CardSet
+        Cards not in the hand, on the board, in opponents' hands, or dead.
+    improves : dict(int: CardSet)
+        For each category better than the current one, the unseen cards that make it on the next card.
+    outs : CardSet
+        Every unseen card that improves the category on the next card.
+    winners : CardSet or None
+        Unseen cards after which the hand is best or tied for best against the known opponents; None without opponents.
+    leading : bool or None
+        Whether the hand is best or tied for best right now; None without opponents.
+    next_card : dict(int: float)
+        Probability of each category after the next card.
+    by_river : dict(int: float)
+        Probability of each category once the board is complete. Same as next_card on the turn.
+    """
+
+    def __init__(self, hole_cards: list, board: list, opponents=(), dead=()):
+        """Analyse hole_cards with a 3 or 4 card board. opponents is a list of other players' hole cards. Raises ValueError if a card is used twice."""
+        if len(board) not in (3, 4):
+            raise ValueError(f"Outs are for flop and turn boards; the board has {len(board)} cards.")
+        known = CardSet()
+        count = 0
+        for cards in [hole_cards, board, dead] + list(opponents):
+            for card in cards:
+                known.add(card)
+                count += 1
+        if len(known) != count:
+            raise ValueError("A card was used more than once.")
+
+        self.unseen = CardSet(mask=CardSet.FULL_MASK & ~known.mask)
+        key, mask = Evaluator.state(list(hole_cards) + list(board))
+        self.strength = Evaluator.evaluate_state(key, mask)
+        self.category = Evaluator.category(self.strength)
+
+        strengths = next_card_strengths(key, mask, self.unseen.mask)
+        unseen = len(self.unseen)
+        self.improves = dict()
+        self.next_card = dict()
+        for i, strength in strengths.items():
+            category = Evaluator.category(strength)
+            self.next_card[category] = self.next_card.get(category, 0) + 1 / unseen
+            if category > self.category:
+                self.improves.setdefault(category, CardSet()).mask |= 1 << i
+        self.outs = CardSet()
+        for cards in self.improves.values():
+            self.outs.mask |= cards.mask
+
+        if len(board) == 3:
+            pairs = unseen * (unseen - 1) // 2
+            self.by_river = {category: n / pairs for category, n in two_card_categories(key, mask, self.unseen.mask).items()}
+        else:
+            self.by_river = dict(self.next_card)
+
+        self.winners = None
+        self.leading = None
+        if opponents:
+            board_key, board_mask = Evaluator.state(board)
+            best = [0] * 52
+            current = 0
+            for cards in opponents:
+                opponent_key, opponent_mask = Evaluator.state(cards)
+                opponent_key += board_key
+                opponent_mask |= board_mask
+                current = max(current, Evaluator.evaluate_state(opponent_key, opponent_mask))
+                for i, strength in next_card_strengths(opponent_key, opponent_mask, self.unseen.mask).items():
+                    if strength > best[i]:
+                        best[i] = strength
+            self.leading = self.strength >= current
+            self.winners = CardSet(mask=sum(1 << i for i, strength in strengths.items() if strength >= best[i]))
+
+    def improve_next(self) -> float:
+        """Probability the next card improves the category."""
+        return len(self.outs) / len(self.unseen)
+
+    def improve_by_river(self) -> float:
+        """Probability the category has improved once the board is complete."""
+        return sum(p for category, p in self.by_river.items() if category > self.category)
+
+    def win_next(self):
+        """Probability of being best or tied for best after the next card, or None without opponents."""
+        return None if self.winners is None else len(self.winners) / len(self.unseen)
+
+    def __str__(self):
+        lines = [f"{PokerHands.hand_hierarchy[self.category].__name__}: {len(self.outs)} outs, "
+                 f"{self.improve_next():.1%} next card, {self.improve_by_river():.1%} by the river"]
+        for category in sorted(self.improves, reverse=True):
+            lines.append(f"  {PokerHands.hand_hierarchy[category].__name__}: {self.improves[category]}")
+        if self.winners is not None:
+            lines.append(f"  {'Leading' if self.leading else 'Behind'}; best after {len(self.winners)} of {len(self.unseen)} cards")
+        return "\n".join(lines)
+
+
+def outs(hole_cards: list, board: list, opponents=(), dead=()) -> OutsReport:
+    """Analyse the draws of hole_cards on a flop or turn board. See OutsReport."""
+    return OutsReport(hole_cards, board, opponents, dead)
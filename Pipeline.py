@@ -0,0 +1,123 @@
+"""Streaming showdown pipeline for re-scoring hand history files in constant memory. Requires numpy.
+
+Records are read lazily in chunks straight from the memory mapped file, evaluated with Batch, and the winners of each hand found. Results are yielded chunk by chunk;
+with worker processes, only a bounded number of chunks are ever in flight, so a slow consumer holds the workers back instead of letting results pile up.
+Workers are only sent (path, start, stop) and open the file themselves.
+"""
+
+import os
+from collections import deque, namedtuple
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+from . import Batch
+from .Card import NO_CARD
+from .HandHistory import HandHistoryReader, HandHistoryWriter
+
+
+CHUNK_RECORDS = 65536
+# Strength given to seats without hole cards (empty or folded), below every hand
+EMPTY_SEAT = -1
+
+ShowdownChunk = namedtuple('ShowdownChunk', ['start', 'strengths', 'winners'])
+ShowdownChunk.__doc__ = """Results for records start to start + len(strengths).
+
+strengths : numpy.ndarray
+    (n, players) int32 strength of each player's hole cards with the board, EMPTY_SEAT for seats dealt no hole cards.
+winners : numpy.ndarray
+    (n, players) bool, True for every player with the best hand (more than one on a split pot). Empty seats never win.
+"""
+
+
+_readers = dict()
+
+def _reader(path) -> HandHistoryReader:
+    """A reader for path, kept open for the life of the worker process."""
+    reader = _readers.get(path)
+    if reader is None:
+        reader = _readers[path] = HandHistoryReader(path)
+    return reader
+
+def score_records(records) -> tuple:
+    """Evaluate a numpy array of HandHistory records. Returns (strengths, winners) as in ShowdownChunk."""
+    board = records['board']
+    holes = records['holes']
+    players = holes.shape[1]
+    board_keys, board_masks = Batch.state(board)
+    strengths = np.empty((len(records), players), dtype=np.int32)
+    for p in range(players):
+        keys, masks = Batch.state(holes[:, p, :])
+        strengths[:, p] = Batch.evaluate_state(keys + board_keys, masks | board_masks)
+        # Without hole cards the board alone would be scored; such seats are out of the hand
+        strengths[holes[:, p, 0] == NO_CARD, p] = EMPTY_SEAT
+    winners = strengths == strengths.max(axis=1, keepdims=True)
+    return strengths, winners
+
+def score_chunk(path, start: int, stop: int) -> ShowdownChunk:
+    """Evaluate records start to stop of the file at path. Run in worker processes."""
+    records = _reader(path).arrays(start, stop)
+    strengths, winners = score_records(records)
+    del records
+    return ShowdownChunk(start, strengths, winners)
+
+
+def chunk_ranges(count: int, chunk_records=CHUNK_RECORDS):
+    """Yield (start, stop) covering count records in chunks."""
+    for start in range(0, count, chunk_records):
+        yield start, min(start + chunk_records, count)
+
+def showdown_chunks(path, chunk_records=CHUNK_RECORDS, processes=1, max_pending=None):
+    """Yield a ShowdownChunk for each chunk of the file at path, in file order.
+
+    Parameters
+    ----------
+    processes : int
+        Worker processes to evaluate with. 1 evaluates in this process as results are requested; None uses os.cpu_count().
+    max_pending : int
+        Most chunks submitted to workers but not yet yielded. Defaults to 2 per worker.
+    """
+    path = os.fspath(path)
+    with HandHistoryReader(path) as reader:
+        count = len(reader)
+    if processes is None:
+        processes = os.cpu_count() or 1
+
+    if processes == 1:
+        with HandHistoryReader(path) as reader:
+            for start, stop in chunk_ranges(count, chunk_records):
+                records = reader.arrays(start, stop)
+                strengths, winners = score_records(records)
+                del records
+                yield ShowdownChunk(start, strengths, winners)
+        return
+
+    if max_pending is None:
+        max_pending = 2 * processes
+    with ProcessPoolExecutor(processes) as pool:
+        pending = deque()
+        for start, stop in chunk_ranges(count, chunk_records):
+            if len(pending) >= max_pending:
+                yield pending.popleft().result()
+            pending.append(pool.submit(score_chunk, path, start, stop))
+        while pending:
+            yield pending.popleft().result()
+
+def showdowns(path, **options):
+    """Yield (record index, strengths tuple, winner indexes tuple) for each record of the file at path. Takes the options of showdown_chunks."""
+    for chunk in showdown_chunks(path, **options):
+        for i, (strengths, winners) in enumerate(zip(chunk.strengths.tolist(), chunk.winners.tolist())):
+            yield chunk.start + i, tuple(strengths), tuple(p for p, won in enumerate(winners) if won)
+
+
+def rescore_file(source, destination, **options) -> int:
+    """Copy the hand history at source to destination with every rank re-evaluated (0 for empty seats). Takes the options of showdown_chunks. Returns the number of records written."""
+    source = os.fspath(source)
+    written = 0
+    with HandHistoryReader(source) as reader, HandHistoryWriter(destination, reader.players) as writer:
+        for chunk in showdown_chunks(source, **options):
+            records = reader.arrays(chunk.start, chunk.start + len(chunk.strengths)).copy()
+            records['ranks'] = np.maximum(chunk.strengths, 0)
+            writer.write_raw(records)
+            written += len(records)
+    return written
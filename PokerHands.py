@@ -1,15 +1,34 @@
 """Houses the PokerHand base class (high card hand) and its subclasses (every other hand type in poker). Also, hand_hierarchy, which defines what hands are best."""
 
 from .Card import Card, sort_cards
+from . import Evaluator
 
 
 class PokerHand:
-    """Up to 5 cards of no relavence to eachother."""
-
-    def __init__(self, cards: list):
-        """Be sure that cards are already properly sorted."""
+    """Up to 5 cards of no relavence to eachother.
+    
+    Instance Variables
+    ------------------
+    cards : list(Card)
+        The cards making up the hand, most important first.
+    strength : int
+        Totally ordered strength of the hand (see Evaluator). All comparisons between hands compare this.
+    """
+
+    def __init__(self, cards: list, strength: int = None):
+        """Be sure that cards are already properly sorted. strength is computed from the cards when not given."""
         self.cards = cards
-        self.tested_high = False
+        if strength is None:
+            strength = self.strength_from_cards()
+        self.strength = strength
+
+    def strength_from_cards(self) -> int:
+        """Compute the strength of this hand type made of its cards."""
+        values = [card.value for card in self.cards[:5]]
+        if self.__class__ in (Straight, Straight_Flush) and values[0] == 5 and values[-1] == 14:
+            # Ace plays low in the wheel
+            values[-1] = 1
+        return Evaluator.make_strength(_hierarchy_index[self.__class__], values)
 
     def __str__(self):
         return f"{self.cards[0].value_str()} High"
@@ -43,97 +62,40 @@ class PokerHand:
 
     def __lt__(self, other):
         if isinstance(other, PokerHand):
-            # Is a poker hand
-            if self.__class__ is other.__class__:
-                # Same type of poker hand
-                for i in range(5):
-                    try:
-                        this_card = self.cards[i]
-                        other_card = other.cards[i]
-                    except IndexError:
-                        if len(self.cards) < len(other.cards):
-                            return True
-                        elif len(self.cards) > len(other.cards):
-                            raise False
-                        else:
-                            raise self.EqualHands(self, other)
-
-                    if this_card < other_card:
-                        return True
-                    elif this_card > other_card:
-                        return False
-                    # They are equal, go to next
-                    self.tested_high = True
-
-                # All cards were equal
-                raise self.EqualHands(self, other)
-            else:
-                # Either lower or higher in hierarchy
-                rank_self = hand_hierarchy.index(self.__class__)
-                rank_other = hand_hierarchy.index(other.__class__)
-                if rank_self < rank_other:
-                    return True
-                else:
-                    return False
+            return self.strength < other.strength
+        return NotImplemented
+
+    def __le__(self, other):
+        if isinstance(other, PokerHand):
+            return self.strength <= other.strength
         return NotImplemented
 
     def __gt__(self, other):
         if isinstance(other, PokerHand):
-            # Is a poker hand
-            if self.__class__ is other.__class__:
-                # Same type of poker hand
-                for i in range(5):
-                    try:
-                        this_card = self.cards[i]
-                        other_card = other.cards[i]
-                    except IndexError:
-                        if len(self.cards) > len(other.cards):
-                            return True
-                        elif len(self.cards) < len(other.cards):
-                            raise False
-                        else:
-                            raise self.EqualHands(self, other)
-
-                    if this_card > other_card:
-                        return True
-                    elif this_card < other_card:
-                        return False
-                    # They are equal, go to next
-                    self.tested_high = True
-                
-                # All cards were equal
-                raise self.EqualHands(self, other)
-            else:
-                # Either lower or higher in hierarchy
-                rank_self = hand_hierarchy.index(self.__class__)
-                rank_other = hand_hierarchy.index(other.__class__)
-                if rank_self > rank_other:
-                    return True
-                else:
-                    return False
+            return self.strength > other.strength
+        return NotImplemented
+
+    def __ge__(self, other):
+        if isinstance(other, PokerHand):
+            return self.strength >= other.strength
         return NotImplemented
 
     class EqualHands(Exception):
-        """Raised if two hands were found to be equal during comparison."""
+        """Formerly raised if two hands were found to be equal during comparison. Comparisons no longer raise it; use ==."""
         pass
 
     def __eq__(self, other):
         if isinstance(other, PokerHand):
-            if self.__class__ is other.__class__:
-                try:
-                    # If this doesn't raise EqualHands, drop out of if and return False.
-                    self < other
-                except self.EqualHands:
-                    self.tested_high = False
-                    return True
-            return False
+            return self.strength == other.strength
         return NotImplemented
 
     def __ne__(self, other):
-        result = self == other
-        if result is NotImplemented:
-            return result
-        return not result
+        if isinstance(other, PokerHand):
+            return self.strength != other.strength
+        return NotImplemented
+
+    def __hash__(self):
+        return hash(self.strength)
 
 
 class Pair(PokerHand):
@@ -191,4 +153,5 @@ class Royal_Flush(PokerHand):
         return "Royal Flush"
 
 
-hand_hierarchy = (PokerHand, Pair, Two_Pair, Three_Kind, Straight, Flush, Full_House, Four_Kind, Straight_Flush, Royal_Flush)
\ No newline at end of file
+hand_hierarchy = (PokerHand, Pair, Two_Pair, Three_Kind, Straight, Flush, Full_House, Four_Kind, Straight_Flush, Royal_Flush)
+_hierarchy_index = {hand_class: i for i, hand_class in enumerate(hand_hierarchy)}
\ No newline at end of file
@@ -0,0 +1,272 @@
+"""Preflop equity tables for the 169 starting hand classes ("AA", "AKs", "72o", ...).
+
+Two tables are kept:
+    heads_up : 169 x 169, the equity of one class against another, each dealt a random combo of its class.
+    versus_random : 169 x max_opponents, the equity of a class against 1 to max_opponents random hands.
+Equity is the expected share of the pot, ties split evenly.
+
+The tables are estimated once by Monte Carlo with Batch (requires numpy) and saved to a file; lookups load that file the first time they are needed.
+Building takes about a minute with the default trials, so it is never done implicitly: build the file with python -m PlayingCards.Preflop first.
+It goes to DEFAULT_PATH in the user's cache directory unless the PLAYINGCARDS_PREFLOP environment variable, --output, or set_path names another file.
+Loading only needs the standard library.
+
+The entries are estimates, not exact equities. A share of the pot is between 0 and 1, so its standard deviation is at most 0.5 and an entry estimated from n samples
+has a standard error of at most 0.5 / sqrt(n) (see standard_error). With the default 2000 trials (DEFAULT_TRIALS), a versus_random entry is within about 1.1% and a heads up entry,
+averaged over boards from both sides of the matchup, within about 0.8%, one standard error either way. Build with more --trials for tighter tables.
+
+File layout (little endian)
+---------------------------
+Header, HEADER.size bytes: magic b'PCPF', format version, max_opponents, number of classes, trials per matchup.
+heads_up : classes x classes float32, row is the hero's class, in CLASSES order.
+versus_random : classes x max_opponents float32.
+"""
+
+import argparse
+import math
+import os
+import struct
+import sys
+import time
+from array import array
+
+from .Ranges import RANKS, class_combos, class_name, combo_ids, hand_class
+
+
+MAGIC = b'PCPF'
+VERSION = 1
+HEADER = struct.Struct('<4sBBHI')
+PATH_VARIABLE = 'PLAYINGCARDS_PREFLOP'
+DEFAULT_PATH = os.environ.get(PATH_VARIABLE) or os.path.join(
+    os.environ.get('XDG_CACHE_HOME') or os.path.join(os.path.expanduser('~'), '.cache'), 'playingcards', 'preflop_equity.bin')
+# Trials per entry; about 1% standard error, see standard_error
+DEFAULT_TRIALS = 2000
+MAX_OPPONENTS = 9
+
+
+def _build_classes() -> tuple:
+    """Class names in table order: by top card, then bottom card, high first; pair, suited, offsuit."""
+    names = []
+    for high in range(14, 1, -1):
+        names.append(class_name(high, high, False))
+        for low in range(high - 1, 1, -1):
+            names.append(class_name(high, low, True))
+            names.append(class_name(high, low, False))
+    return tuple(names)
+
+CLASSES = _build_classes()
+CLASS_INDEX = {name: i for i, name in enumerate(CLASSES)}
+
+
+def standard_error(trials: int, heads_up=False) -> float:
+    """Upper bound on the standard error of a table entry built with trials trials. Heads up entries average 2 * trials boards, one set from each side of the matchup."""
+    return 0.5 / math.sqrt(2 * trials if heads_up else trials)
+
+
+def class_index(hand) -> int:
+    """Table index of a starting hand given as a class name ("AKs", "QQ"; any case, either card first) or two Cards."""
+    if isinstance(hand, str):
+        index = CLASS_INDEX.get(hand)
+        if index is not None:
+            return index
+        ranks, kind = hand[:2].upper(), hand[2:].lower()
+        if len(ranks) != 2 or not all(rank in RANKS for rank in ranks) or kind not in ('', 's', 'o') or (kind == '') != (ranks[0] == ranks[1]):
+            raise ValueError(f"{hand!r} is not a starting hand class.")
+        return CLASS_INDEX[class_name(RANKS.index(ranks[0]) + 2, RANKS.index(ranks[1]) + 2, kind == 's')]
+    first, second = hand
+    if first is second:
+        raise ValueError("A starting hand needs two different cards.")
+    return CLASS_INDEX[hand_class(first, second)]
+
+
+class PreflopTables:
+    """Preflop equities of every starting hand class.
+
+    Instance Variables
+    ------------------
+    heads_up : array('f')
+        Flattened classes x classes table; heads_up[hero * len(CLASSES) + villain].
+    versus_random : array('f')
+        Flattened classes x max_opponents table; versus_random[hero * max_opponents + opponents - 1].
+    max_opponents : int
+    trials : int
+        Monte Carlo trials each entry was estimated from; standard_error(trials) bounds the error of the estimates.
+    """
+
+    def __init__(self, heads_up: array, versus_random: array, max_opponents: int, trials: int):
+        self.heads_up = heads_up
+        self.versus_random = versus_random
+        self.max_opponents = max_opponents
+        self.trials = trials
+
+    def equity(self, hero, villain) -> float:
+        """Heads up equity of hero against villain, each a class name or two Cards. Cards in both hands are not accounted for."""
+        return self.heads_up[class_index(hero) * len(CLASSES) + class_index(villain)]
+
+    def equity_vs_random(self, hero, opponents=1) -> float:
+        """Equity of hero (class name or two Cards) against opponents random hands."""
+        if not 1 <= opponents <= self.max_opponents:
+            raise ValueError(f"Tables cover 1 to {self.max_opponents} opponents, not {opponents}.")
+        return self.versus_random[class_index(hero) * self.max_opponents + opponents - 1]
+
+    def save(self, path=DEFAULT_PATH):
+        """Write the tables to path, replacing it atomically."""
+        heads_up = array('f', self.heads_up)
+        versus_random = array('f', self.versus_random)
+        if sys.byteorder == 'big':
+            heads_up.byteswap()
+            versus_random.byteswap()
+        temporary = f"{path}.{os.getpid()}.tmp"
+        with open(temporary, 'wb') as file:
+            file.write(HEADER.pack(MAGIC, VERSION, self.max_opponents, len(CLASSES), self.trials))
+            heads_up.tofile(file)
+            versus_random.tofile(file)
+        os.replace(temporary, path)
+
+    @classmethod
+    def load(cls, path=DEFAULT_PATH):
+        """Read tables written by save. Raises ValueError if the file is not a version this module reads."""
+        with open(path, 'rb') as file:
+            magic, version, max_opponents, classes, trials = HEADER.unpack(file.read(HEADER.size))
+            if magic != MAGIC:
+                raise ValueError(f"{path} is not a preflop equity file.")
+            if version != VERSION:
+                raise ValueError(f"{path} is format version {version}; only version {VERSION} is supported.")
+            if classes != len(CLASSES):
+                raise ValueError(f"{path} has {classes} starting hand classes; {len(CLASSES)} are expected.")
+            heads_up = array('f')
+            versus_random = array('f')
+            try:
+                heads_up.fromfile(file, classes * classes)
+                versus_random.fromfile(file, classes * max_opponents)
+            except EOFError:
+                raise ValueError(f"{path} is truncated.") from None
+        if sys.byteorder == 'big':
+            heads_up.byteswap()
+            versus_random.byteswap()
+        return cls(heads_up, versus_random, max_opponents, trials)
+
+
+def _combo_table():
+    """(169, 12, 2) card ids of each class's combos, padded by repeating, and (169,) combo counts."""
+    import numpy as np
+    table = np.zeros((len(CLASSES), 12, 2), dtype=np.uint8)
+    counts = np.zeros(len(CLASSES), dtype=np.int64)
+    for i, name in enumerate(CLASSES):
+        ids = [combo_ids[mask] for mask in class_combos[name]]
+        counts[i] = len(ids)
+        table[i] = (ids * (12 // len(ids)))[:12]
+    return table, counts
+
+def _deal_rest(rng, used, count: int):
+    """(N, count) ids of random cards not in the (N, k) array used, each row a uniformly random set."""
+    import numpy as np
+    order = rng.random((len(used), 52), dtype=np.float32)
+    np.put_along_axis(order, used.astype(np.intp), 2.0, axis=1)
+    return np.argpartition(order, count - 1, axis=1)[:, :count]
+
+def _strengths(board_state, holes):
+    from . import Batch
+    keys, masks = Batch.state(holes)
+    return Batch.evaluate_state(keys + board_state[0], masks | board_state[1])
+
+def build_tables(trials=DEFAULT_TRIALS, max_opponents=MAX_OPPONENTS, seed=None, progress=None) -> PreflopTables:
+    """Estimate the tables by Monte Carlo. Requires numpy.
+
+    Each heads up entry is the average of trials boards from each side of the matchup (samples dealing the same card twice are dropped).
+    Each versus_random entry is estimated from trials deals. progress, if given, is called with the fraction done.
+    """
+    import numpy as np
+    from . import Batch
+
+    rng = np.random.default_rng(seed)
+    table, counts = _combo_table()
+    classes = len(CLASSES)
+    steps = classes + max_opponents
+
+    heads_up = np.zeros((classes, classes))
+    villain_class = np.repeat(np.arange(classes), trials)
+    for hero in range(classes):
+        hero_ids = table[hero, rng.integers(counts[hero], size=len(villain_class))]
+        villain_ids = table[villain_class, (rng.random(len(villain_class)) * counts[villain_class]).astype(np.int64)]
+        holes = np.hstack((hero_ids, villain_ids))
+        valid = (hero_ids[:, :, None] != villain_ids[:, None, :]).all(axis=(1, 2))
+        board_state = Batch.state(_deal_rest(rng, holes, 5))
+        hero_strength = _strengths(board_state, hero_ids)
+        villain_strength = _strengths(board_state, villain_ids)
+        share = np.where(hero_strength > villain_strength, 1.0, np.where(hero_strength == villain_strength, 0.5, 0.0))
+        heads_up[hero] = np.bincount(villain_class, share * valid, classes) / np.bincount(villain_class, valid, classes)
+        if progress:
+            progress((hero + 1) / steps)
+    # Use the estimates from both sides of every matchup
+    heads_up = (heads_up + 1 - heads_up.T) / 2
+
+    versus_random = np.zeros((classes, max_opponents))
+    hero_class = np.repeat(np.arange(classes), trials)
+    for opponents in range(1, max_opponents + 1):
+        hero_ids = table[hero_class, (rng.random(len(hero_class)) * counts[hero_class]).astype(np.int64)]
+        dealt = _deal_rest(rng, hero_ids, 2 * opponents + 5)
+        board_state = Batch.state(dealt[:, :5])
+        hero_strength = _strengths(board_state, hero_ids)
+        best = np.zeros_like(hero_strength)
+        ties = np.zeros(len(hero_strength), dtype=np.int64)
+        for p in range(opponents):
+            strength = _strengths(board_state, dealt[:, 5 + 2 * p:7 + 2 * p])
+            np.maximum(best, strength, out=best)
+            ties += strength == hero_strength
+        share = np.where(hero_strength >= best, 1.0 / (1 + ties), 0.0)
+        versus_random[:, opponents - 1] = share.reshape(classes, trials).mean(axis=1)
+        if progress:
+            progress((classes + opponents) / steps)
+
+    return PreflopTables(array('f', heads_up.ravel().tolist()), array('f', versus_random.ravel().tolist()), max_opponents, trials)
+
+
+_tables = None
+_path = DEFAULT_PATH
+
+def set_path(path):
+    """Use tables from path for later lookups instead of DEFAULT_PATH. The next lookup loads them."""
+    global _tables, _path
+    _tables = None
+    _path = path
+
+def tables() -> PreflopTables:
+    """The tables, loaded from the tables file the first time they are needed. Raises FileNotFoundError if it hasn't been built."""
+    global _tables
+    if _tables is None:
+        if not os.path.exists(_path):
+            raise FileNotFoundError(f"No preflop equity tables at {_path}. Build them with python -m PlayingCards.Preflop --output {_path}")
+        _tables = PreflopTables.load(_path)
+    return _tables
+
+def equity(hero, villain) -> float:
+    """Heads up preflop equity of hero against villain, each a class name ("AKs") or two Cards."""
+    return tables().equity(hero, villain)
+
+def equity_vs_random(hero, opponents=1) -> float:
+    """Preflop equity of hero (class name or two Cards) against opponents random hands."""
+    return tables().equity_vs_random(hero, opponents)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Build the preflop equity tables file.")
+    parser.add_argument("--output", default=DEFAULT_PATH, help=f"File to write (default {DEFAULT_PATH}).")
+    parser.add_argument("--trials", type=int, default=DEFAULT_TRIALS, help=f"Monte Carlo trials per entry (default {DEFAULT_TRIALS}).")
+    parser.add_argument("--max-opponents", type=int, default=MAX_OPPONENTS)
+    parser.add_argument("--seed", type=int)
+    args = parser.parse_args(argv)
+
+    start = time.perf_counter()
+    built = build_tables(args.trials, args.max_opponents, args.seed,
+                         lambda done: print(f"\r{done:.0%}", end='', file=sys.stderr, flush=True))
+    directory = os.path.dirname(os.path.abspath(args.output))
+    os.makedirs(directory, exist_ok=True)
+    built.save(args.output)
+    print(f"\rWrote {args.output} in {time.perf_counter() - start:.1f}s", file=sys.stderr)
+    print(f"Standard error at most {standard_error(args.trials, heads_up=True):.2%} heads up and {standard_error(args.trials):.2%} versus random hands"
+          f" from {args.trials} trials per entry", file=sys.stderr)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
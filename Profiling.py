@@ -0,0 +1,163 @@
+"""Opt-in call counters and timers for the evaluation pipeline and deck operations.
+
+Nothing is measured until enable() is called: it swaps the watched functions for counting wrappers, and disable() puts the originals back, so there is no cost while disabled.
+A long running process can poll snapshot() at any time.
+"""
+
+import functools
+from contextlib import contextmanager
+from time import perf_counter
+
+from . import Evaluator
+from .Deck import ArrayDeck, Deck
+from .Hand import Hand
+
+
+# (owner, attribute name) of functions whose calls and time are recorded
+stage_targets = (
+    (Hand, 'evaluate_poker'),
+    (Hand, 'evaluate_poker_histogram'),
+    (Hand, 'strength'),
+    (Hand, 'make_histograms'),
+    (Hand, 'flush_check'),
+    (Hand, 'straight_check'),
+    (Hand, 'of_a_kind_check'),
+    (Hand, 'fill_pokerhand'),
+    (Evaluator, 'evaluate_state'),
+    (Evaluator, 'to_pokerhand')
+)
+# Functions returning a PokerHand whose category is recorded
+category_targets = (
+    (Hand, 'evaluate_poker'),
+    (Hand, 'evaluate_poker_histogram')
+)
+# (owner, attribute name) of functions whose calls are counted
+deck_targets = (
+    (Deck, 'draw'),
+    (Deck, 'deal'),
+    (Deck, 'shuffle'),
+    (Deck, 'add'),
+    (Deck, 'bury'),
+    (Deck, 'remove'),
+    (Deck, 'contains'),
+    (ArrayDeck, 'deal_ids'),
+    (ArrayDeck, 'shuffle'),
+    (ArrayDeck, 'reset'),
+    (ArrayDeck, 'remove'),
+    (ArrayDeck, 'contains')
+)
+
+_stages = dict()
+_categories = dict()
+_deck_calls = dict()
+_originals = []
+
+
+def _target_name(owner, attribute: str) -> str:
+    return f"{owner.__name__.rpartition('.')[2]}.{attribute}"
+
+def _timed(name: str, func, record_category: bool):
+    stats = _stages.setdefault(name, [0, 0.0])
+
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        start = perf_counter()
+        try:
+            result = func(*args, **kwargs)
+        finally:
+            stats[0] += 1
+            stats[1] += perf_counter() - start
+        if record_category:
+            category = result.__class__.__name__
+            _categories[category] = _categories.get(category, 0) + 1
+        return result
+    return wrapper
+
+# Deck operations in progress; only the outermost is counted, so deal isn't also counted as the draw it makes
+_deck_depth = 0
+
+def _counted(name: str, func):
+    _deck_calls.setdefault(name, 0)
+
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        global _deck_depth
+        if not _deck_depth:
+            _deck_calls[name] += 1
+        _deck_depth += 1
+        try:
+            return func(*args, **kwargs)
+        finally:
+            _deck_depth -= 1
+    return wrapper
+
+
+def enabled() -> bool:
+    """Whether the wrappers are installed."""
+    return bool(_originals)
+
+def enable():
+    """Install the counting wrappers. Does nothing if already enabled."""
+    if _originals:
+        return
+    for owner, attribute in stage_targets:
+        original = getattr(owner, attribute)
+        _originals.append((owner, attribute, original))
+        setattr(owner, attribute, _timed(_target_name(owner, attribute), original, (owner, attribute) in category_targets))
+    for owner, attribute in deck_targets:
+        original = getattr(owner, attribute)
+        _originals.append((owner, attribute, original))
+        setattr(owner, attribute, _counted(_target_name(owner, attribute), original))
+
+def disable():
+    """Restore the original functions. Counts are kept until reset."""
+    while _originals:
+        owner, attribute, original = _originals.pop()
+        setattr(owner, attribute, original)
+
+def reset():
+    """Zero every counter."""
+    for stats in _stages.values():
+        stats[0] = 0
+        stats[1] = 0.0
+    _categories.clear()
+    for name in _deck_calls:
+        _deck_calls[name] = 0
+
+
+def snapshot() -> dict:
+    """A copy of the current counters.
+
+    Returns
+    -------
+    dict
+        "enabled": bool
+        "stages": {name: {"calls": int, "seconds": float, "mean_us": float}} for each timed function. Time includes any timed functions it calls.
+        "categories": {PokerHand class name: count} of evaluation results.
+        "deck": {name: calls} for each deck operation, counting only calls made from outside the decks: the draw a deal makes is part of the deal, so the counts add up.
+    """
+    stages = dict()
+    for name, (calls, seconds) in _stages.items():
+        stages[name] = {
+            "calls": calls,
+            "seconds": seconds,
+            "mean_us": seconds / calls * 1e6 if calls else 0.0
+        }
+    return {
+        "enabled": enabled(),
+        "stages": stages,
+        "categories": dict(_categories),
+        "deck": dict(_deck_calls)
+    }
+
+
+@contextmanager
+def profiling(reset_counts=True):
+    """Enable profiling for a with block, disabling it afterwards. Counters are reset first if reset_counts is True."""
+    if reset_counts:
+        reset()
+    enable()
+    try:
+        yield
+    finally:
+        disable()
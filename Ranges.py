@@ -0,0 +1,200 @@
+"""Hand range notation, e.g. "QQ+, AKs, A5s-A2s, KQo:0.5", expanded to weighted two-card combos.
+
+Every one of the 169 starting hand classes has its combos precomputed. A combo is kept as the CardSet mask of its two cards, so removing combos blocked by the board or dead cards is one AND per combo.
+
+Notation (comma separated)
+--------------------------
+"QQ"          A pocket pair (6 combos).
+"AKs", "AKo"  Suited (4 combos) or offsuit (12 combos). "AK" is both.
+"QQ+"         QQ and every higher pair.
+"ATs+"        ATs, AJs, AQs, AKs: the kicker rises up to one below the top card.
+"99-66"       Pairs from 99 down to 66.
+"A5s-A2s"     A5s, A4s, A3s, A2s.
+"AsKh"        A single combo. Suits are s, h, d, c.
+":weight"     Appended to any of the above, e.g. "AKo:0.25". Defaults to 1. Later entries override earlier ones.
+"""
+
+import re
+
+from .Card import Card, all_cards, card_from_id
+from .Suits import Clubs, Diamonds, Hearts, Spades
+
+
+RANKS = '23456789TJQKA'
+SUITS = {'s': Spades, 'h': Hearts, 'd': Diamonds, 'c': Clubs}
+
+def _value(rank: str) -> int:
+    return RANKS.index(rank) + 2
+
+def _rank(value: int) -> str:
+    return RANKS[value - 2]
+
+
+def class_name(high: int, low: int, suited: bool) -> str:
+    """The starting hand class of two values, e.g. class_name(14, 13, True) == "AKs"."""
+    if high < low:
+        high, low = low, high
+    if high == low:
+        return _rank(high) * 2
+    return _rank(high) + _rank(low) + ('s' if suited else 'o')
+
+def hand_class(first: Card, second: Card) -> str:
+    """The starting hand class of two hole cards, e.g. "AKs", "QQ", "T9o"."""
+    return class_name(first.value, second.value, first.suit is second.suit)
+
+
+def _build_class_combos() -> dict:
+    """Map each of the 169 class names to the tuple of masks of its combos."""
+    classes = dict()
+    for a in range(52):
+        for b in range(a + 1, 52):
+            name = hand_class(all_cards[a], all_cards[b])
+            classes.setdefault(name, []).append(1 << a | 1 << b)
+    return {name: tuple(masks) for name, masks in classes.items()}
+
+def _build_combo_ids() -> dict:
+    """Map each combo mask to its two card ids, higher value first."""
+    ids = dict()
+    for a in range(52):
+        for b in range(a + 1, 52):
+            ids[1 << a | 1 << b] = (b, a) if b % 13 > a % 13 else (a, b)
+    return ids
+
+class_combos = _build_class_combos()
+combo_ids = _build_combo_ids()
+
+
+def dead_mask(dead) -> int:
+    """A CardSet mask of dead cards given as a CardSet, a mask, or a collection of Cards."""
+    if isinstance(dead, int):
+        return dead
+    mask = getattr(dead, 'mask', None)
+    if mask is not None:
+        return mask
+    mask = 0
+    for card in dead:
+        mask |= 1 << card.id
+    return mask
+
+
+_CARD = re.compile(r'([2-9TJQKA])([shdc])')
+
+def parse_cards(text: str) -> list:
+    """Cards written as value and suit letters, e.g. "AsKh7d" or "As Kh 7d". Raises ValueError if it cannot be parsed."""
+    text = text.replace(' ', '').replace(',', '')
+    cards = []
+    position = 0
+    while position < len(text):
+        match = _CARD.match(text, position)
+        if not match:
+            raise ValueError(f"Cannot parse cards {text!r}.")
+        cards.append(Card(_value(match[1]), SUITS[match[2]]))
+        position = match.end()
+    return cards
+
+
+_CLASS = re.compile(r'^([2-9TJQKA])([2-9TJQKA])([so]?)$')
+_COMBO = re.compile(r'^([2-9TJQKA])([shdc])([2-9TJQKA])([shdc])$')
+
+def _expand_token(token: str) -> list:
+    """Class names (or combo masks for explicit combos) described by one range token without a weight."""
+    if match := _COMBO.match(token):
+        first = Card(_value(match[1]), SUITS[match[2]])
+        second = Card(_value(match[3]), SUITS[match[4]])
+        if first is second:
+            raise ValueError(f"{token} uses the same card twice.")
+        return [1 << first.id | 1 << second.id]
+
+    plus = token.endswith('+')
+    if plus:
+        token = token[:-1]
+    start, _, end = token.partition('-')
+    match = _CLASS.match(start)
+    if not match:
+        raise ValueError(f"Cannot parse range token {token!r}.")
+    high, low, kind = _value(match[1]), _value(match[2]), match[3]
+    if high < low:
+        high, low = low, high
+    if high == low and kind:
+        raise ValueError(f"Pairs cannot be suited or offsuit: {token!r}.")
+    kinds = [kind == 's'] if kind else [True, False]
+
+    if end:
+        if plus:
+            raise ValueError(f"Cannot combine + and - in {token!r}.")
+        end_match = _CLASS.match(end)
+        if not end_match or end_match[3] != kind:
+            raise ValueError(f"Both ends of {token!r} must be the same kind of hand.")
+        end_high, end_low = sorted((_value(end_match[1]), _value(end_match[2])), reverse=True)
+        if high == low:
+            if end_high != end_low:
+                raise ValueError(f"Both ends of {token!r} must be pairs.")
+            return [class_name(v, v, False) for v in range(min(high, end_high), max(high, end_high) + 1)]
+        if end_high != high:
+            raise ValueError(f"Both ends of {token!r} must have the same top card.")
+        lows = range(min(low, end_low), max(low, end_low) + 1)
+    elif plus:
+        if high == low:
+            return [class_name(v, v, False) for v in range(high, 15)]
+        lows = range(low, high)
+    else:
+        lows = [low]
+
+    if high == low:
+        return [class_name(high, high, False)]
+    return [class_name(high, value, suited) for value in lows if value != high for suited in kinds]
+
+
+class Range:
+    """A weighted set of two-card starting hands.
+
+    Instance Variables
+    ------------------
+    weights : dict(int: float)
+        Combo mask (bits of its two cards' ids) to weight.
+    """
+
+    def __init__(self, text=''):
+        """Create a range from notation (see module docstring). Raises ValueError if it cannot be parsed."""
+        self.weights = dict()
+        for token in text.replace(' ', '').split(','):
+            if token:
+                self.add(token)
+
+    def add(self, token: str):
+        """Add one range token, e.g. "A5s-A2s:0.5"."""
+        token, _, weight = token.partition(':')
+        weight = float(weight) if weight else 1.0
+        for item in _expand_token(token):
+            for mask in class_combos[item] if isinstance(item, str) else (item,):
+                self.weights[mask] = weight
+
+    def combo_ids(self, dead=()) -> list:
+        """List of (card id, card id, weight) for every combo not blocked by dead cards (any form dead_mask takes) and with a positive weight."""
+        blocked = dead_mask(dead)
+        return [combo_ids[mask] + (weight,) for mask, weight in self.weights.items() if not mask & blocked and weight > 0]
+
+    def combos(self, dead=()) -> list:
+        """List of ((Card, Card), weight) for every combo not blocked by dead cards and with a positive weight."""
+        return [((card_from_id(a), card_from_id(b)), weight) for a, b, weight in self.combo_ids(dead)]
+
+    def classes(self) -> list:
+        """Names of the starting hand classes with at least one combo in the range."""
+        names = []
+        for name, masks in class_combos.items():
+            if any(mask in self.weights for mask in masks):
+                names.append(name)
+        return names
+
+    def __len__(self):
+        return len(self.weights)
+
+    def __contains__(self, combo):
+        """Whether a pair of Cards is in the range."""
+        first, second = combo
+        return (1 << first.id | 1 << second.id) in self.weights
+
+
+def parse_range(text: str) -> Range:
+    """Parse range notation into a Range."""
+    return Range(text)
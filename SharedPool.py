@@ -0,0 +1,151 @@
+"""Process pool evaluating hands held in shared memory. Requires numpy.
+
+The parent writes card ids into a multiprocessing.shared_memory block and workers evaluate rows of it where they lie, writing strengths into a second block.
+Workers attach to both blocks once when they start, so each task only carries a (start, stop) row range and returns nothing:
+the cost of handing work to a worker is the same for ten hands as for ten million.
+"""
+
+import os
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+
+import numpy as np
+
+from . import Batch
+from .Card import NO_CARD
+from .Evaluator import CATEGORY_SHIFT
+
+
+DEFAULT_CAPACITY = 1 << 20
+# Fewest rows worth sending to a worker as one task
+MIN_TASK_ROWS = 8192
+
+
+def _views(ids_memory, strengths_memory, capacity: int, width: int) -> tuple:
+    ids = np.ndarray((capacity, width), dtype=np.uint8, buffer=ids_memory.buf)
+    strengths = np.ndarray(capacity, dtype=np.int32, buffer=strengths_memory.buf)
+    return ids, strengths
+
+def _evaluate_rows(ids, strengths, start: int, stop: int):
+    strengths[start:stop] = Batch.evaluate_state(*Batch.state(ids[start:stop]))
+
+
+_worker = None
+
+def _attach(ids_name: str, strengths_name: str, capacity: int, width: int):
+    """Worker initializer: open the shared blocks and keep them for the life of the process."""
+    global _worker
+    ids_memory = shared_memory.SharedMemory(name=ids_name)
+    strengths_memory = shared_memory.SharedMemory(name=strengths_name)
+    _worker = (ids_memory, strengths_memory) + _views(ids_memory, strengths_memory, capacity, width)
+    Batch._get_tables()
+
+def _work(start: int, stop: int):
+    """Evaluate rows start to stop of the shared ids into the shared strengths. Run in worker processes."""
+    _, _, ids, strengths = _worker
+    _evaluate_rows(ids, strengths, start, stop)
+
+
+class SharedBatchPool:
+    """Worker processes evaluating batches of hands through shared memory. Use as a context manager or call close().
+
+    Instance Variables
+    ------------------
+    ids : numpy.ndarray
+        (capacity, width) uint8 card ids in shared memory. Ids from 52 to 255 (NO_CARD) stand for no card, so hands of 5 to width cards can share a batch.
+    strengths : numpy.ndarray
+        (capacity,) int32 strengths in shared memory, written by evaluate_in_place.
+    capacity : int
+        Most hands held at once; evaluate splits bigger batches.
+    width : int
+        Most cards per hand.
+    processes : int
+        Worker processes; 1 evaluates in this process.
+    """
+
+    def __init__(self, processes=None, capacity=DEFAULT_CAPACITY, width=7):
+        if not 5 <= width <= 7:
+            raise ValueError(f"Hands of up to {width} cards cannot be evaluated; 5 to 7 are allowed.")
+        self.capacity = capacity
+        self.width = width
+        self.processes = (os.cpu_count() or 1) if processes is None else processes
+        self._ids_memory = shared_memory.SharedMemory(create=True, size=capacity * width)
+        self._strengths_memory = shared_memory.SharedMemory(create=True, size=4 * capacity)
+        self.ids, self.strengths = _views(self._ids_memory, self._strengths_memory, capacity, width)
+        self._pool = None
+        if self.processes > 1:
+            self._pool = ProcessPoolExecutor(self.processes, initializer=_attach,
+                                             initargs=(self._ids_memory.name, self._strengths_memory.name, capacity, width))
+
+    def evaluate_in_place(self, count: int):
+        """Evaluate the first count rows of ids, filled in by the caller, into strengths. Returns a view of strengths[:count]."""
+        if not 0 <= count <= self.capacity:
+            raise ValueError(f"{count} hands do not fit in a capacity of {self.capacity}.")
+        if self._pool is None or count <= MIN_TASK_ROWS:
+            _evaluate_rows(self.ids, self.strengths, 0, count)
+            return self.strengths[:count]
+
+        step = max(MIN_TASK_ROWS, -(-count // self.processes))
+        futures = [self._pool.submit(_work, start, min(start + step, count)) for start in range(0, count, step)]
+        for future in futures:
+            future.result()
+        return self.strengths[:count]
+
+    def evaluate(self, ids):
+        """Evaluate an (N, k) integer array of card ids, 5 <= k <= width, in batches of up to capacity rows.
+
+        Returns
+        -------
+        (numpy.ndarray, numpy.ndarray)
+            The (N,) int32 strengths and (N,) int8 categories, as Batch.evaluate_batch.
+        """
+        ids = np.asarray(ids)
+        if ids.ndim != 2 or not 5 <= ids.shape[1] <= self.width:
+            raise ValueError(f"Expected an (N, 5..{self.width}) array of card ids, got shape {ids.shape}.")
+        if not np.issubdtype(ids.dtype, np.integer):
+            raise TypeError(f"Card ids must be integers, not {ids.dtype}.")
+        if ids.size and (ids.min() < 0 or ids.max() > 51):
+            raise ValueError("Card ids must be between 0 and 51.")
+
+        k = ids.shape[1]
+        strengths = np.empty(len(ids), dtype=np.int32)
+        for start in range(0, len(ids), self.capacity):
+            rows = ids[start:start + self.capacity]
+            self.ids[:len(rows), :k] = rows
+            self.ids[:len(rows), k:] = NO_CARD
+            strengths[start:start + len(rows)] = self.evaluate_in_place(len(rows))
+        return strengths, (strengths >> CATEGORY_SHIFT).astype(np.int8)
+
+    def evaluate_hands(self, hands):
+        """Evaluate Hands (or lists of Cards) of 5 to width cards each. Returns strengths and categories as evaluate."""
+        strengths = np.empty(len(hands), dtype=np.int32)
+        for start in range(0, len(hands), self.capacity):
+            rows = hands[start:start + self.capacity]
+            self.ids[:len(rows)] = NO_CARD
+            for i, hand in enumerate(rows):
+                cards = getattr(hand, 'cards', hand)
+                if not 5 <= len(cards) <= self.width:
+                    raise ValueError(f"Hand {start + i} has {len(cards)} cards; 5 to {self.width} are allowed.")
+                self.ids[i, :len(cards)] = [card.id for card in cards]
+            strengths[start:start + len(rows)] = self.evaluate_in_place(len(rows))
+        return strengths, (strengths >> CATEGORY_SHIFT).astype(np.int8)
+
+
+    def close(self):
+        """Stop the workers and free the shared memory. Views of ids and strengths must not be used afterwards."""
+        if self._pool is not None:
+            self._pool.shutdown()
+            self._pool = None
+        if self._ids_memory is not None:
+            del self.ids, self.strengths
+            for memory in (self._ids_memory, self._strengths_memory):
+                memory.close()
+                memory.unlink()
+            self._ids_memory = self._strengths_memory = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+        return False
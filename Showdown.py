@@ -0,0 +1,53 @@
+"""Showdown of any number of players sharing a board. Every player's hand is evaluated once, and players are grouped into tiers of equal hands for splitting pots."""
+
+from . import Evaluator
+
+
+def _cards(cards) -> list:
+    """The cards of a Hand, or cards itself."""
+    return getattr(cards, 'cards', cards)
+
+def player_strengths(table, players: list) -> list:
+    """Strength (see Evaluator) of each player's cards together with the table.
+
+    Parameters
+    ----------
+    table : Hand or list(Card)
+        The shared board.
+    players : list(Hand or list(Card))
+        Each player's hole cards.
+    """
+    board_key, board_mask = Evaluator.state(_cards(table))
+    card_keys = Evaluator.card_keys
+    evaluate_state = Evaluator.evaluate_state
+    strengths = []
+    for hole in players:
+        key = board_key
+        mask = board_mask
+        for card in _cards(hole):
+            key += card_keys[card.id]
+            mask |= 1 << card.id
+        strengths.append(evaluate_state(key, mask))
+    return strengths
+
+def tiers(strengths: list) -> list:
+    """Group player indexes by equal strength, best first. The first tier holds the winner(s)."""
+    order = sorted(range(len(strengths)), key=strengths.__getitem__, reverse=True)
+    grouped = []
+    last = None
+    for i in order:
+        if strengths[i] != last:
+            grouped.append([])
+            last = strengths[i]
+        grouped[-1].append(i)
+    return grouped
+
+def showdown(table, players: list) -> list:
+    """Rank players sharing table. Returns list(list(int)): tiers of player indexes with equal hands, best first, each in seat order."""
+    return tiers(player_strengths(table, players))
+
+def winners(table, players: list) -> list:
+    """Indexes of the player(s) with the best hand."""
+    strengths = player_strengths(table, players)
+    best = max(strengths)
+    return [i for i, strength in enumerate(strengths) if strength == best]
@@ -0,0 +1,270 @@
+"""Asynchronous game simulator running many tables in one event loop.
+
+Each table has its own Deck and deals the streets into every player's Hand. Between streets, each player still in the hand asks their policy whether to stay or fold.
+Policies are coroutines, so they can await outside services (e.g. the service under load test) without blocking other tables.
+Hands still contested after the river go to a showdown; the pot is split between the first tier.
+
+While running, the simulator counts hands per second and samples event loop lag: how late a timer that should fire every lag_interval seconds actually fires.
+Growing lag means the loop is saturated, which is the scaling limit of the process.
+"""
+
+import asyncio
+import statistics
+import time
+from collections import namedtuple
+
+from .Deck import Deck, make_rng
+from .Hand import Hand
+from .Showdown import showdown
+from .Streams import Stream
+
+
+STAY = 'stay'
+FOLD = 'fold'
+# (name, cards dealt to the board) after the preflop decisions
+STREETS = (('flop', 3), ('turn', 1), ('river', 1))
+
+TableView = namedtuple('TableView', ['table', 'hand_number', 'seat', 'street', 'hand', 'board', 'active'])
+TableView.__doc__ = """What a policy sees when asked for a decision.
+
+hand : Hand
+    The player's hole cards followed by the board.
+board : Hand
+    The board dealt so far.
+active : tuple(int)
+    Seats still in the hand, including this one.
+"""
+
+HandResult = namedtuple('HandResult', ['table', 'hand_number', 'board', 'holes', 'folded', 'tiers'])
+HandResult.__doc__ = """Outcome of one simulated hand.
+
+board : list(Card)
+    The board dealt, fewer than 5 cards if all but one player folded early.
+holes : list(list(Card))
+    Each seat's hole cards.
+folded : list(int)
+    Seats that folded, in the order they folded.
+tiers : list(list(int))
+    Seats still in at the end grouped by equal hands, best first (see Showdown.showdown). The first tier splits the pot.
+"""
+
+
+async def always_stay(view: TableView) -> str:
+    """Policy that never folds."""
+    return STAY
+
+def random_folder(probability: float, seed=None, rng=None):
+    """A policy folding with the given probability at each decision."""
+    rng = make_rng(seed, rng)
+
+    async def policy(view: TableView) -> str:
+        return FOLD if rng.random() < probability else STAY
+    return policy
+
+
+class Table:
+    """One simulated table: a seat for each policy and its own Deck.
+
+    Instance Variables
+    ------------------
+    number : int
+        Index of the table in the simulation.
+    policies : list
+        Async policy of each seat, called with a TableView and returning STAY or FOLD.
+    rng : random.Random or module random
+        Shuffles this table's decks.
+    hands_played : int
+    """
+
+    def __init__(self, number: int, policies: list, seed=None, rng=None):
+        if len(policies) < 2:
+            raise ValueError("A table needs at least 2 players.")
+        if 2 * len(policies) + 5 > 52:
+            raise ValueError(f"{len(policies)} players cannot all be dealt from one deck.")
+        self.number = number
+        self.policies = policies
+        self.rng = make_rng(seed, rng)
+        self.hands_played = 0
+
+    async def _decide(self, street: str, players: list, board: Hand, active: list, folded: list) -> list:
+        """Ask each active seat's policy in seat order. The last player left cannot fold. Returns the seats still active."""
+        staying = []
+        for i, seat in enumerate(active):
+            if len(staying) + len(active) - i == 1:
+                staying.append(seat)
+                break
+            view = TableView(self.number, self.hands_played, seat, street, players[seat], board, tuple(active))
+            if await self.policies[seat](view) == FOLD:
+                folded.append(seat)
+            else:
+                staying.append(seat)
+        return staying
+
+    async def play_hand(self) -> HandResult:
+        """Deal and play out one hand."""
+        deck = Deck(rng=self.rng)
+        board = Hand([])
+        players = [Hand(deck.draw(2)) for policy in self.policies]
+        holes = [list(hand.cards) for hand in players]
+        folded = []
+
+        active = await self._decide('preflop', players, board, list(range(len(players))), folded)
+        for street, count in STREETS:
+            if len(active) == 1:
+                break
+            # Let other tables run between streets
+            await asyncio.sleep(0)
+            for card in deck.deal(count):
+                board.add(card)
+                for hand in players:
+                    hand.add(card)
+            active = await self._decide(street, players, board, active, folded)
+
+        if len(active) == 1:
+            tiers = [active]
+        else:
+            tiers = [[active[i] for i in tier] for tier in showdown(board, [holes[seat] for seat in active])]
+        result = HandResult(self.number, self.hands_played, board.cards, holes, folded, tiers)
+        self.hands_played += 1
+        return result
+
+
+class SimulationStats:
+    """Throughput and event loop lag of a simulation. Updated live while it runs.
+
+    Instance Variables
+    ------------------
+    hands : int
+        Hands finished.
+    showdowns : int
+        Hands that reached a showdown.
+    elapsed : float
+        Seconds since the simulation started (final once it has stopped).
+    lags : list(float)
+        Event loop lag samples in seconds.
+    """
+
+    def __init__(self):
+        self.hands = 0
+        self.showdowns = 0
+        self.elapsed = 0.0
+        self.lags = []
+        self._start = None
+
+    def hands_per_sec(self) -> float:
+        return self.hands / self.elapsed if self.elapsed else 0.0
+
+    def summary(self) -> dict:
+        """The stats as a JSON friendly dictionary; lag in milliseconds."""
+        lags = self.lags or [0.0]
+        if len(lags) > 1:
+            # Percentiles 1 to 99, linearly interpolated between samples
+            cuts = statistics.quantiles(lags, n=100, method='inclusive')
+            p50, p99 = cuts[49], cuts[98]
+        else:
+            p50 = p99 = lags[0]
+        return {
+            "hands": self.hands,
+            "showdowns": self.showdowns,
+            "elapsed": self.elapsed,
+            "hands_per_sec": self.hands_per_sec(),
+            "lag_mean_ms": sum(lags) / len(lags) * 1e3,
+            "lag_p50_ms": p50 * 1e3,
+            "lag_p99_ms": p99 * 1e3,
+            "lag_max_ms": max(lags) * 1e3,
+            "lag_samples": len(self.lags)
+        }
+
+    def __str__(self):
+        summary = self.summary()
+        return (f"{summary['hands']} hands in {summary['elapsed']:.2f}s ({summary['hands_per_sec']:,.0f} hands/sec), "
+                f"loop lag p50 {summary['lag_p50_ms']:.2f}ms p99 {summary['lag_p99_ms']:.2f}ms max {summary['lag_max_ms']:.2f}ms")
+
+
+class Simulator:
+    """Runs many Tables concurrently in one event loop.
+
+    Instance Variables
+    ------------------
+    tables : list(Table)
+    stats : SimulationStats
+        Stats of the current or last run.
+    on_result : function
+        Called with every HandResult, or None. May be a coroutine function.
+    lag_interval : float
+        Seconds between event loop lag samples.
+    """
+
+    def __init__(self, tables=100, players=6, policy=always_stay, seed=None, on_result=None, lag_interval=0.01):
+        """Parameters
+        ----------
+        policy : async function or list(async function)
+            Policy for every seat, or one per seat. Policies keeping state should be given per seat.
+        seed : int or str
+            Makes the deal at every table reproducible; table i shuffles with Stream(seed).spawn("table", i).
+        """
+        policies = list(policy) if isinstance(policy, (list, tuple)) else [policy] * players
+        if len(policies) != players:
+            raise ValueError(f"Expected {players} policies, got {len(policies)}.")
+        self.tables = []
+        for i in range(tables):
+            rng = Stream(seed, ("table", i)) if seed is not None else None
+            self.tables.append(Table(i, policies, rng=rng))
+        self.on_result = on_result
+        self.lag_interval = lag_interval
+        self.stats = SimulationStats()
+        self._stopping = False
+
+    def stop(self):
+        """Make every table finish its current hand and the run end."""
+        self._stopping = True
+
+    async def _monitor_lag(self):
+        loop = asyncio.get_running_loop()
+        while True:
+            expected = loop.time() + self.lag_interval
+            await asyncio.sleep(self.lag_interval)
+            self.stats.lags.append(max(0.0, loop.time() - expected))
+            self.stats.elapsed = time.perf_counter() - self.stats._start
+
+    async def _run_table(self, table: Table, hands, deadline):
+        stats = self.stats
+        while not self._stopping:
+            if hands is not None and table.hands_played >= hands:
+                return
+            if deadline is not None and time.perf_counter() >= deadline:
+                return
+            result = await table.play_hand()
+            stats.hands += 1
+            if len(result.tiers) > 1 or len(result.tiers[0]) > 1:
+                stats.showdowns += 1
+            if self.on_result is not None:
+                handled = self.on_result(result)
+                if asyncio.iscoroutine(handled):
+                    await handled
+
+    async def run(self, hands=None, duration=None) -> SimulationStats:
+        """Play hands at every table until each has played hands hands, duration seconds pass, or stop() is called. At least one limit is needed."""
+        if hands is None and duration is None:
+            raise ValueError("Give hands, duration, or both.")
+        self.stats = SimulationStats()
+        self._stopping = False
+        self.stats._start = time.perf_counter()
+        deadline = self.stats._start + duration if duration is not None else None
+
+        monitor = asyncio.create_task(self._monitor_lag())
+        try:
+            await asyncio.gather(*(self._run_table(table, hands, deadline) for table in self.tables))
+        finally:
+            monitor.cancel()
+            try:
+                await monitor
+            except asyncio.CancelledError:
+                pass
+            self.stats.elapsed = time.perf_counter() - self.stats._start
+        return self.stats
+
+
+def simulate(tables=100, players=6, hands=None, duration=None, **options) -> SimulationStats:
+    """Run a Simulator to completion in a new event loop. Takes the options of Simulator."""
+    return asyncio.run(Simulator(tables, players, **options).run(hands, duration))
@@ -0,0 +1,60 @@
+"""Deterministic, splittable random number streams.
+
+A Stream is a random.Random seeded from a master seed and a path of keys, e.g. Stream(42).spawn("table", 7).
+The seed is the SHA-256 digest of the master seed and path, so every path gets its own independent generator: streams never depend on which process creates them or in what order,
+and a simulation that gives each table, worker, or batch its own path re-runs bit for bit with any number of workers.
+Streams can be given anywhere a random.Random is taken, such as Deck(rng=stream).
+"""
+
+import hashlib
+import random
+
+
+def derive(seed, path=()) -> int:
+    """The 256 bit seed of the stream at path under master seed. seed and the keys in path must be ints or strings."""
+    for key in (seed,) + tuple(path):
+        if not isinstance(key, (int, str)):
+            raise TypeError(f"Stream seeds and keys must be ints or strings, not {type(key).__name__}.")
+    return int.from_bytes(hashlib.sha256(repr((seed,) + tuple(path)).encode()).digest(), 'big')
+
+
+class Stream(random.Random):
+    """A random.Random derived from a master seed and a path of keys.
+
+    Instance Variables
+    ------------------
+    master : int or str
+        The master seed. A random one is chosen if none was given; keep it to reproduce a run.
+    path : tuple(int or str)
+        Keys from the master seed to this stream.
+    """
+
+    def __init__(self, seed=None, path=()):
+        if seed is None:
+            seed = random.SystemRandom().getrandbits(64)
+        self.master = seed
+        self.path = tuple(path)
+        super().__init__(derive(seed, self.path))
+
+    def spawn(self, *keys):
+        """The independent child stream at this stream's path followed by keys. Does not use or change this stream's state."""
+        return Stream(self.master, self.path + keys)
+
+    def split(self, n: int) -> list:
+        """Child streams 0 to n - 1."""
+        return [self.spawn(i) for i in range(n)]
+
+    def restart(self):
+        """Rewind the stream to its first number."""
+        self.seed(derive(self.master, self.path))
+
+    def numpy(self):
+        """A new numpy.random.Generator for this stream's path, independent of the random.Random state. Requires numpy."""
+        import numpy as np
+        return np.random.default_rng(np.random.SeedSequence(derive(self.master, self.path)))
+
+    def __reduce__(self):
+        return (self.__class__, (self.master, self.path), self.getstate())
+
+    def __repr__(self):
+        return f"Stream({self.master!r}, {self.path!r})"
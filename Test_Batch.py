@@ -0,0 +1,52 @@
+"""Test functions for Batch.evaluate_batch. Requires numpy."""
+
+import random
+
+import numpy as np
+
+from Batch import evaluate_batch, hands_to_ids, state
+from Card import NO_CARD
+from Deck import Deck
+from Hand import Hand
+from PokerHands import hand_hierarchy
+
+
+def test_sequence():
+    scalar_agreement()
+    bad_input()
+
+
+def scalar_agreement(trials=5000):
+    """Ensure the batch strengths and categories match Hand.evaluate_poker for 5, 6, and 7 card hands."""
+    random.seed(7)
+    for size in (5, 6, 7):
+        hands = [Hand(Deck().draw(size)) for i in range(trials)]
+        strengths, categories = evaluate_batch(hands_to_ids(hands))
+        assert strengths.shape == (trials,) and categories.shape == (trials,), "Results have the wrong shape."
+
+        for hand, strength, category in zip(hands, strengths.tolist(), categories.tolist()):
+            pokerhand = hand.evaluate_poker()
+            assert strength == pokerhand.strength, f"[{hand}] has batch strength {strength}, expected {pokerhand.strength}."
+            assert hand_hierarchy[category] is pokerhand.__class__, f"[{hand}] has batch category {hand_hierarchy[category]}, expected {pokerhand.__class__}."
+
+    print("Batch Scalar Agreement Test Passed")
+
+def bad_input():
+    for ids in (np.zeros((3, 4), dtype=int), np.zeros(7, dtype=int), np.full((2, 7), 52), np.array([[0, 1, 2, 3, 4, 5, 6], [0, 0, 1, 2, 3, 4, 5]])):
+        try:
+            evaluate_batch(ids)
+        except ValueError:
+            pass
+        else:
+            assert False, f"Array {ids.tolist()} should have been rejected."
+
+    # state ORs the card bits, so a repeated id cannot carry into another card's bit
+    assert state(np.array([[0, 0, 1]]))[1][0] == 0b11, "A repeated id corrupted the mask."
+    padded, plain = state(np.array([[3, 17, NO_CARD]])), state(np.array([[3, 17]]))
+    assert padded[0][0] == plain[0][0] and padded[1][0] == plain[1][0], "NO_CARD added to the state."
+
+    print("Batch Bad Input Test Passed")
+
+
+if __name__ == "__main__":
+    test_sequence()
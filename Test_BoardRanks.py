@@ -0,0 +1,68 @@
+"""Test functions for hand versus range ranking on a board."""
+
+import random
+
+from BoardRanks import ranking, cache_info
+from Card import all_cards
+from CardSet import CardSet
+from Deck import Deck
+from Evaluator import evaluate
+from Ranges import Range
+
+
+def test_sequence():
+    brute_force_check()
+    board_cache()
+
+
+def brute_force_check():
+    rng = random.Random(12)
+    hand_range = Range("22+, A2s+, KTs+, QJs, ATo+, KQo:0.5")
+    for trial in range(5):
+        deck = Deck(rng=rng)
+        hole = deck.deal(2)
+        dead = deck.deal(1)
+        board = deck.deal(5 if trial else 3)
+        ranks = ranking(board)
+        assert len(ranks) == (52 - len(board)) * (51 - len(board)) // 2, f"{len(ranks)} live holdings on a {len(board)} card board."
+        assert list(ranks.strengths) == sorted(ranks.strengths), "Strengths are not sorted."
+
+        strength = evaluate(hole + board)
+        assert ranks.strength(hole) == strength, "Hole card strength differs from Evaluator."
+        counts = [0, 0, 0]
+        weighted = [0.0, 0.0, 0.0]
+        used = CardSet(hole + board + dead)
+        for a in range(52):
+            for b in range(a + 1, 52):
+                if 1 << a & used.mask or 1 << b & used.mask:
+                    continue
+                other = evaluate([all_cards[a], all_cards[b]] + board)
+                outcome = 0 if strength > other else 1 if strength == other else 2
+                counts[outcome] += 1
+                weighted[outcome] += hand_range.weights.get(1 << a | 1 << b, 0.0)
+        assert ranks.rank(hole, dead) == tuple(counts), f"Rank {ranks.rank(hole, dead)} differs from brute force {counts}."
+        total = sum(weighted)
+        for got, expected in zip(ranks.versus(hole, hand_range, dead), weighted):
+            assert abs(got - expected / total) < 1e-9, "Weighted results against the range differ from brute force."
+        assert abs(ranks.percentile(hole, dead) - (counts[0] + counts[1] / 2) / sum(counts)) < 1e-12, "Percentile is wrong."
+
+    print("Brute Force Board Ranking Test Passed")
+
+def board_cache():
+    board = Deck(seed=4).deal(5)
+    first = ranking(board)
+    hits = cache_info().hits
+    assert ranking(list(reversed(board))) is first, "The same board in another order was not cached."
+    assert cache_info().hits == hits + 1, "The cache hit was not counted."
+    try:
+        first.strength(board[:2])
+    except ValueError:
+        pass
+    else:
+        assert False, "Board cards should not be a live holding."
+
+    print("Board Cache Test Passed")
+
+
+if __name__ == "__main__":
+    test_sequence()
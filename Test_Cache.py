@@ -0,0 +1,67 @@
+"""Test functions for the evaluation cache."""
+
+import threading
+
+import Cache
+from Deck import Deck
+from Hand import Hand
+import Profiling
+
+
+def test_sequence():
+    evaluation_cache()
+
+
+def evaluation_cache():
+    cache = Cache.EvaluationCache(maxsize=2)
+    deck = Deck(seed=8)
+    first, second, third = deck.deal(5), deck.deal(5), deck.deal(5)
+    result = cache.evaluate(first)
+    assert cache.evaluate(Hand(list(reversed(first)))) is result, "Reordered cards missed the cache."
+    assert result.strength == Hand(list(first)).strength(), "Cached result has the wrong strength."
+    cache.evaluate(second)
+    cache.evaluate(third)
+    assert first not in cache and third in cache, "The least recently used entry was not evicted."
+    stats = cache.stats()
+    assert (stats["hits"], stats["misses"], stats["evictions"], stats["size"]) == (1, 3, 1, 2), f"Wrong counters: {stats}"
+    cache.resize(1)
+    assert len(cache) == 1 and cache.evictions == 2, "Shrinking did not evict."
+
+    original = Hand.evaluate_poker
+    with Cache.caching(maxsize=100, thread_safe=True) as shared:
+        hands = [Hand(Deck(seed=i).deal(7)) for i in range(20)]
+        def worker():
+            for hand in hands:
+                hand.evaluate_poker()
+        threads = [threading.Thread(target=worker) for i in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        assert Cache.installed() is shared, "The cache was not installed."
+    assert Hand.evaluate_poker is original, "Uninstalling did not restore Hand.evaluate_poker."
+    assert shared.hits + shared.misses == 80 and len(shared) == 20, f"Shared cache counted {shared}."
+
+    # Caching and profiling can be switched on and off in any order
+    hand = Hand(Deck(seed=3).deal(7))
+    for order in (("enable", "install", "disable", "uninstall"), ("install", "enable", "uninstall", "disable"), ("enable", "install", "uninstall", "disable")):
+        cache = Cache.EvaluationCache()
+        steps = {"enable": Profiling.enable, "disable": Profiling.disable, "install": lambda: Cache.install(cache), "uninstall": Cache.uninstall}
+        Profiling.reset()
+        for step in order:
+            steps[step]()
+            hand.evaluate_poker()
+            profiled = Profiling.enabled()
+            cached = Cache.installed() is cache
+            calls = Profiling.snapshot()["stages"].get("Hand.evaluate_poker", {"calls": 0})["calls"]
+            lookups = cache.hits + cache.misses
+            hand.evaluate_poker()
+            assert (Profiling.snapshot()["stages"].get("Hand.evaluate_poker", {"calls": 0})["calls"] > calls) == profiled, f"Profiling is wrong after {step} in {order}."
+            assert (cache.hits + cache.misses > lookups) == cached, f"Caching is wrong after {step} in {order}."
+        assert Hand.evaluate_poker is original, f"Hand.evaluate_poker was not restored after {order}."
+
+    print("Evaluation Cache Test Passed")
+
+
+if __name__ == "__main__":
+    test_sequence()
@@ -1,4 +1,7 @@
-from Card import Card
+import pickle
+
+from Card import Card, all_cards, card_from_id, get_card_dict
+from Deck import Deck
 from Suits import Hearts, Diamonds, Spades, Clubs
 
 
@@ -7,6 +10,7 @@ def test_sequence():
     str_test()
     comparison_test()
     and_or_test()
+    interning_test()
 
 
 def str_test():
@@ -76,6 +80,40 @@ def and_or_test():
 
     print("And/Or Override Test Passed")
 
+def interning_test():
+    A = Card(10, Clubs)
+    assert A is Card(10, Clubs), "Card(10, Clubs) returned a new instance."
+    assert Card(1, Spades) is Card(14, Spades), "Card(1, Spades) should be the Ace of Spades."
+    assert len(all_cards) == 52 and len(set(card.id for card in all_cards)) == 52, "There should be 52 distinct cards."
+    for i, card in enumerate(all_cards):
+        assert card.id == i and card_from_id(i) is card, f"{card} has id {card.id}, expected {i}."
+
+    cards = get_card_dict()
+    assert cards['C10'] is A, "get_card_dict did not return the shared instance."
+    deck = Deck(shuffle=False)
+    assert all(card is card_from_id(card.id) for card in deck._deck), "Deck did not use the shared instances."
+    # Another instance can't sneak a second copy of a card into a deck
+    assert not deck.add(A) and not deck.bury(Card(10, Clubs)) and deck.size == 52, "Deck accepted a card it already held."
+    assert pickle.loads(pickle.dumps(A)) is A, "Unpickling did not return the shared instance."
+
+    # Equal cards hash equally, so sets and dicts agree with ==
+    for a in all_cards:
+        for b in all_cards:
+            assert (a == b) == (hash(a) == hash(b)), f"{a} and {b} break the hash and equality contract."
+    assert {Card(10, Clubs)} == {Card(10, Hearts)} and len(set(all_cards)) == 13, "Sets of cards should follow value equality."
+    seen = {A.id: "ten", Card(10, Hearts).id: "other ten"}
+    assert len(seen) == 2 and seen[Card(10, Clubs).id] == "ten", "Card ids should tell cards apart."
+    assert not hasattr(A, '__dict__'), "Cards should not have a __dict__."
+
+    try:
+        Card(15, Clubs)
+    except ValueError:
+        pass
+    else:
+        assert False, "Card(15, Clubs) should raise ValueError."
+
+    print("Interning Test Passed")
+
 
 if __name__ == "__main__":
     test_sequence()
\ No newline at end of file
@@ -0,0 +1,66 @@
+"""Test functions for the array deck and seeded shuffling."""
+
+from CardSet import CardSet
+from Deck import ArrayDeck, Deck
+
+
+def test_sequence():
+    seeded_shuffle()
+    array_deck()
+
+
+def seeded_shuffle():
+    for deck_type in (Deck, ArrayDeck):
+        a = deck_type(seed=5).deal(52)
+        b = deck_type(seed=5).deal(52)
+        c = deck_type(seed=6).deal(52)
+        assert all(x is y for x, y in zip(a, b)), f"{deck_type.__name__}s with the same seed were shuffled differently."
+        assert not all(x is y for x, y in zip(a, c)), f"{deck_type.__name__}s with different seeds were shuffled the same."
+        assert len(set(card.id for card in a)) == 52, f"{deck_type.__name__} dealt duplicate cards."
+
+    print("Seeded Shuffle Test Passed")
+
+def array_deck():
+    deck = ArrayDeck(seed=1)
+    first = deck.deal(5)
+    assert isinstance(deck.deal(1), list), "Dealing 1 card did not return a list."
+    assert deck.size == 46, f"Deck has {deck.size} cards after dealing 6."
+    for card in first:
+        assert not deck.contains(card), f"Deck contained {card} after it was dealt."
+
+    assert len(deck.deal_ids(46)) == 46, "deal_ids returned the wrong number of ids."
+    try:
+        deck.deal(1)
+    except IndexError:
+        pass
+    else:
+        assert False, "Dealing from an empty deck should raise IndexError."
+
+    deck.reset(shuffle=False)
+    assert deck.size == 52, "Reset did not return every card."
+    assert all(x is y for x, y in zip(deck.deal(5), first)), "Reset without shuffling changed the order."
+
+    deck.reset()
+    order = deck.deal(52)
+    deck.reset(shuffle=False)
+    removed = order[20]
+    assert deck.remove(removed), f"{removed} could not be removed."
+    assert not deck.remove(removed), f"{removed} was removed twice."
+    rest = deck.deal(51)
+    assert all(x is y for x, y in zip([c for c in order if c is not removed], rest)), "Removing a card changed the order of the others."
+
+    deck.reset()
+    removed = deck.deal(3) + [card for card in order[:10] if deck.remove(card)]
+    assert deck.size == 52 - len(removed) and deck.remaining() == CardSet.full() - CardSet(removed), "Removed cards are still counted."
+    assert not any(deck.contains(card) for card in removed), "Deck contained a removed card."
+    deck.shuffle()
+    rest = deck.deal(deck.size)
+    assert not CardSet(rest) & CardSet(removed) and len(CardSet(rest)) == len(rest), "A removed card was dealt after shuffling."
+    deck.reset(shuffle=False)
+    assert deck.size == 52 and all(deck.contains(card) for card in removed), "Reset did not return removed cards."
+
+    print("Array Deck Test Passed")
+
+
+if __name__ == "__main__":
+    test_sequence()
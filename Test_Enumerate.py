@@ -0,0 +1,76 @@
+"""Test functions for exhaustive hand enumeration."""
+
+import itertools
+import os
+import tempfile
+
+from Card import all_cards
+from Enumerate import KNOWN_COUNTS, enumerate_hands
+from Evaluator import CATEGORY_SHIFT, evaluate
+
+
+def test_sequence():
+    small_deck()
+    five_card_distribution()
+    checkpoint_resume()
+
+
+IDS = (0, 3, 4, 8, 9, 12, 13, 17, 21, 25, 26, 30, 38, 39, 40, 51)
+
+def small_deck():
+    result = enumerate_hands(7, IDS, processes=1, partition_hands=500)
+    ranks = dict()
+    for hand in itertools.combinations(IDS, 7):
+        strength = evaluate([all_cards[i] for i in hand])
+        ranks[strength] = ranks.get(strength, 0) + 1
+    assert result.hands == sum(ranks.values()) == 11440, f"Counted {result.hands} hands instead of 11440."
+    assert result.ranks == ranks, "Strength counts differ from evaluating every hand."
+    categories = [0] * 10
+    for strength, count in ranks.items():
+        categories[strength >> CATEGORY_SHIFT] += count
+    assert result.categories == categories, "Category counts differ from evaluating every hand."
+
+    print("Small Deck Test Passed")
+
+def five_card_distribution():
+    result = enumerate_hands(5, processes=2)
+    assert not result.validate(), f"5 card distribution differs: {result.validate()}"
+    assert result.categories == KNOWN_COUNTS[5][0], "validate() missed a difference."
+    assert result.workers and all(rate > 0 for rate in result.throughput().values()), "Worker throughput was not recorded."
+
+    print("Five Card Distribution Test Passed")
+
+def checkpoint_resume():
+    class Interrupt(Exception):
+        pass
+
+    def interrupt(result):
+        if len(result.completed) == 5:
+            raise Interrupt
+
+    expected = enumerate_hands(6, IDS, processes=1, partition_hands=200)
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "enum.json")
+        try:
+            enumerate_hands(6, IDS, processes=1, checkpoint=path, checkpoint_interval=0, progress=interrupt, partition_hands=200)
+        except Interrupt:
+            pass
+        counted = []
+        resumed = enumerate_hands(6, IDS, processes=1, checkpoint=path, partition_hands=200,
+                                  progress=lambda result: counted.append(len(result.completed)))
+        assert counted[0] == 6, f"Resumed run started from {counted[0] - 1} partitions instead of 5."
+        assert (resumed.hands, resumed.categories, resumed.ranks) == (expected.hands, expected.categories, expected.ranks), \
+            "Resumed totals differ from an uninterrupted run."
+        for other in ({"k": 5}, {"k": 6, "partition_hands": 5000}):
+            try:
+                enumerate_hands(ids=IDS, processes=1, checkpoint=path, **other)
+            except ValueError:
+                pass
+            else:
+                assert False, f"A checkpoint for another enumeration should raise ValueError ({other})."
+
+    print("Checkpoint Resume Test Passed")
+
+
+if __name__ == "__main__":
+    test_sequence()
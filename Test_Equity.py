@@ -0,0 +1,99 @@
+"""Test functions for Equity.monte_carlo and Equity.exact."""
+
+import itertools
+from fractions import Fraction
+
+from Card import all_cards, get_card_dict
+from Equity import exact, monte_carlo
+from Hand import Hand
+
+
+def test_sequence():
+    monte_carlo_test()
+    bad_situation()
+    exact_test()
+
+
+def monte_carlo_test():
+    c = get_card_dict()
+    holes = [[c['SAce'], c['HAce']], [c['DKing'], c['CKing']]]
+
+    result = monte_carlo(holes, trials=20000, processes=1, seed=11)
+    assert result.trials == 20000, f"Ran {result.trials} trials instead of 20000."
+    assert 0.79 < (e := result.equity(0)) < 0.84, f"Aces vs Kings equity was {e:.2%}."
+    assert abs(result.equity(0) + result.equity(1) - 1) < 1e-9, "Equities do not add up to 1."
+    low, high = result.confidence_interval(0)
+    assert low < result.equity(0) < high, "Equity is outside its own confidence interval."
+
+    parallel = monte_carlo(holes, trials=20000, processes=2, seed=11)
+    assert parallel.wins == result.wins and parallel.ties == result.ties, "Seeded results differ between 1 and 2 processes."
+    assert parallel.shares == result.shares and parallel.share_squares == result.share_squares, "Seeded shares are not bit for bit identical."
+
+    # The river is known; a set of Kings always wins
+    board = [c['SKing'], c['S2'], c['H7'], c['C9'], c['D3']]
+    result = monte_carlo(holes, board=board, trials=10, processes=1)
+    assert result.wins == [0, 10], f"Kings should win every trial, got {result.wins}."
+
+    # An exhausted time budget still deals one chunk
+    for processes in (1, 2):
+        result = monte_carlo(holes, time_budget=0, processes=processes, seed=5)
+        assert result.trials > 0 and str(result), f"A zero time budget ran {result.trials} trials with {processes} processes."
+
+    print("Monte Carlo Test Passed")
+
+def bad_situation():
+    c = get_card_dict()
+    try:
+        monte_carlo([[c['SAce'], c['HAce']], [c['SAce'], c['CKing']]], trials=10, processes=1)
+    except ValueError:
+        pass
+    else:
+        assert False, "A card used twice should raise ValueError."
+    try:
+        monte_carlo([[c['SAce'], c['HAce']], [c['DKing'], c['CKing']]], trials=0, processes=1)
+    except ValueError:
+        pass
+    else:
+        assert False, "Zero trials should raise ValueError."
+
+    print("Bad Situation Test Passed")
+
+def brute_force_equity(holes: list, board: list) -> list:
+    """Exact equity by evaluating every completion with Hand.evaluate_poker."""
+    known = [card.id for hole in holes for card in hole] + [card.id for card in board]
+    live = [card for card in all_cards if card.id not in known]
+    shares = [Fraction(0)] * len(holes)
+    boards = 0
+    for completion in itertools.combinations(live, 5 - len(board)):
+        hands = [Hand(list(hole) + list(board) + list(completion)).evaluate_poker() for hole in holes]
+        best = max(hands)
+        winners = [i for i, hand in enumerate(hands) if hand == best]
+        for i in winners:
+            shares[i] += Fraction(1, len(winners))
+        boards += 1
+    return [share / boards for share in shares]
+
+def exact_test():
+    c = get_card_dict()
+    situations = [
+        ([[c['SAce'], c['HAce']], [c['DKing'], c['CKing']]], [c['S2'], c['S7'], c['D9']]),
+        # Clubs and Diamonds are interchangeable here, so boards are merged by suit symmetry
+        ([[c['SAce'], c['HAce']], [c['SKing'], c['HKing']]], [c['S2'], c['H7'], c['S9']]),
+        ([[c['SAce'], c['SKing']], [c['D10'], c['C10']], [c['H5'], c['H6']]], [c['S2'], c['H7'], c['D9'], c['C3']])
+    ]
+    for holes, board in situations:
+        result = exact(holes, board)
+        expected = brute_force_equity(holes, board)
+        for i in range(len(holes)):
+            assert result.equity(i) == expected[i], f"Player {i} has exact equity {result.equity(i)}, expected {expected[i]}."
+            assert result.win(i) + result.tie(i) + result.loss(i) == 1, f"Player {i}'s win, tie, and loss do not add up to 1."
+        assert sum(result.equity(i) for i in range(len(holes))) == 1, "Equities do not add up to 1."
+
+    result = exact([[c['SAce'], c['HAce']], [c['DKing'], c['CKing']]])
+    assert result.trials == 1712304, f"Preflop enumeration covered {result.trials} boards instead of 1712304."
+
+    print("Exact Equity Test Passed")
+
+
+if __name__ == "__main__":
+    test_sequence()
@@ -0,0 +1,128 @@
+"""Test functions for the persistent equity store."""
+
+import os
+import sqlite3
+import tempfile
+
+from EquityStore import EquityStore, canonical, heads_up_spots, main, MONTE_CARLO
+from Equity import exact
+from CardSet import CardSet
+from Ranges import Range, parse_cards
+
+
+def test_sequence():
+    canonical_keys()
+    stored_results()
+    eviction()
+    warm_up()
+
+
+def canonical_keys():
+    key, order = canonical([parse_cards("AsKs"), parse_cards("QhJh")], parse_cards("2s7h9d"))
+    # Reordered players, reordered cards, and relabelled suits are the same situation
+    same = [
+        ([parse_cards("JhQh"), parse_cards("KsAs")], parse_cards("9d2s7h")),
+        ([parse_cards("AhKh"), parse_cards("QcJc")], parse_cards("2h7c9s")),
+        ([parse_cards("QdJd"), parse_cards("AcKc")], parse_cards("7d2c9h"))
+    ]
+    for holes, board in same:
+        other_key, other_order = canonical(holes, board)
+        assert other_key == key, f"{holes} on {board} has key {other_key}, expected {key}."
+    assert canonical(same[0][0], same[0][1])[1] == order[::-1], "Player order was not tracked."
+    assert canonical([parse_cards("AsKs"), parse_cards("QhJh")], parse_cards("2s7h9h"))[0] != key, "Different boards share a key."
+    assert canonical([parse_cards("AsKs"), parse_cards("QhJh")], parse_cards("2s7h9d"), parse_cards("3c"))[0] != key, "Dead cards were ignored."
+
+    print("Canonical Keys Test Passed")
+
+
+def stored_results():
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "equity.db")
+        holes = [parse_cards("AsKs"), parse_cards("QhJh")]
+        board = parse_cards("2s7h9d")
+        expected = exact(holes, board)
+        with EquityStore(path) as store:
+            assert store.get(holes, board) is None, "Empty store returned a result."
+            result = store.equity(holes, board)
+            assert result.shares == expected.shares and result.losses == expected.losses, "Stored result differs from Equity.exact."
+            assert store.misses == 1 and len(store) == 1
+
+            # An isomorphic situation with the players swapped is a hit, returned in its own order
+            swapped = store.equity([parse_cards("QdJd"), parse_cards("AcKc")], parse_cards("7d2c9h"))
+            assert store.hits == 1 and len(store) == 1, "Isomorphic situation was computed again."
+            assert swapped.shares == expected.shares[::-1] and swapped.wins == expected.wins[::-1], "Players were not put back in order."
+
+            first = store.equity(holes, board, method=MONTE_CARLO, trials=2000)
+            assert len(store) == 2, "Monte Carlo and exact results share an entry."
+
+        # Results outlive the store; Monte Carlo ones are reproducible from any process
+        with EquityStore(path) as store:
+            assert store.get(holes, board).shares == expected.shares, "Result was not persisted."
+            assert store.get(holes, board, method=MONTE_CARLO, trials=2000).shares == first.shares
+            assert store.get(holes, board, method=MONTE_CARLO, trials=1000) is None, "Trial counts share an entry."
+        with EquityStore(os.path.join(directory, "other.db")) as store:
+            assert store.equity(holes, board, method=MONTE_CARLO, trials=2000).shares == first.shares, "Monte Carlo result is not reproducible."
+
+        # Hits only read, so they don't wait for another process's write
+        writer = sqlite3.connect(path, isolation_level=None)
+        writer.execute("BEGIN IMMEDIATE")
+        with EquityStore(path, timeout=0.1) as store:
+            for i in range(3):
+                assert store.equity(holes, board).shares == expected.shares
+            assert store.hits == 3
+            writer.execute("COMMIT")
+        writer.close()
+
+        with EquityStore(path) as store:
+            for bad in (lambda: store.equity(holes, board, method='guess'), lambda: store.equity([parse_cards("AsKs"), parse_cards("AsJh")])):
+                try:
+                    bad()
+                except ValueError:
+                    pass
+                else:
+                    raise AssertionError("Invalid situation was accepted.")
+
+    print("Stored Results Test Passed")
+
+
+def eviction():
+    with tempfile.TemporaryDirectory() as directory:
+        board = parse_cards("2s7h9dTc")
+        spots = [[parse_cards(hero), parse_cards("QhJh")] for hero in ("AsKs", "AdKd", "AsAd", "3c4c")]
+        with EquityStore(os.path.join(directory, "equity.db"), max_entries=3) as store:
+            for holes in spots[:3]:
+                store.equity(holes, board)
+            store.get(spots[0], board)
+            store.equity(spots[3], board)
+            assert len(store) == 3, f"{len(store)} results stored past a limit of 3."
+            assert store.get(spots[1], board) is None, "The least recently used result was kept."
+            assert all(store.get(holes, board) is not None for holes in (spots[0], spots[2], spots[3])), "A recently used result was evicted."
+
+    print("Eviction Test Passed")
+
+
+def warm_up():
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "equity.db")
+        hero, villain = Range("AA, KK"), Range("AKs")
+        board = parse_cards("2c7c9c")
+        spots = list(heads_up_spots(hero, villain, board))
+        # Only the suits off the board can be relabelled, so 24 matchups fall into 6 classes
+        assert len(spots) == 6, f"{len(spots)} canonical spots, expected 6."
+        with EquityStore(path) as store:
+            assert store.warm(spots) == 6
+            assert store.warm(spots) == 0, "Stored spots were computed again."
+            for hero_cards, _ in hero.combos(board):
+                for villain_cards, _ in villain.combos(board):
+                    if not CardSet(hero_cards).mask & CardSet(villain_cards).mask:
+                        assert store.get([list(hero_cards), list(villain_cards)], board) is not None, "A matchup was not warmed."
+
+        assert main([path, "warm", "--hero", "QQ", "--villain", "AKs", "--board", "2c7c9c", "--quiet"]) == 0
+        with EquityStore(path) as store:
+            assert len(store) == 12, f"{len(store)} results after warming QQ against AKs."
+
+    print("Warm Up Test Passed")
+
+
+if __name__ == "__main__":
+    test_sequence()
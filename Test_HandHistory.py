@@ -0,0 +1,80 @@
+"""Test functions for HandHistory writing and reading."""
+
+import os
+import random
+import tempfile
+
+from Deck import Deck
+from Hand import Hand
+from HandHistory import HEADER, HandHistoryReader, HandHistoryWriter, record_struct
+
+
+def test_sequence():
+    round_trip()
+    append_and_arrays()
+
+
+def deal_records(count: int, players: int, seed: int) -> list:
+    rng = random.Random(seed)
+    records = []
+    for i in range(count):
+        deck = Deck(rng=rng)
+        holes = [deck.deal(2) for p in range(players)]
+        records.append((deck.deal(5), holes))
+    return records
+
+def round_trip():
+    records = deal_records(100, 3, seed=21)
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "hands.bin")
+        with HandHistoryWriter(path, 3, buffer_records=16) as writer:
+            for board, holes in records:
+                writer.write(board, holes)
+            # A hand that ended before the river
+            writer.write(records[0][0][:3], records[0][1], ranks=[0, 0, 0])
+
+        assert os.path.getsize(path) == HEADER.size + 101 * record_struct(3).size, "File size does not match the record count."
+        with HandHistoryReader(path) as reader:
+            assert len(reader) == 101, f"Read {len(reader)} records instead of 101."
+            for i, (board, holes) in enumerate(records):
+                assert all(a is b for a, b in zip(reader.board(i), board)), f"Record {i} board did not round trip."
+                for hand, pokerhand, hole in zip(reader.hands(i), reader.pokerhands(i), holes):
+                    expected = Hand(hole + board).evaluate_poker()
+                    assert all(a is b for a, b in zip(hand.cards, hole + board)), f"Record {i} hole cards did not round trip."
+                    assert pokerhand.strength == expected.strength and pokerhand.__class__ is expected.__class__, f"Record {i} stored [{pokerhand}], expected [{expected}]."
+
+            board, holes, ranks = reader.record_ids(100)
+            assert len(board) == 3, "A 3 card board did not round trip."
+            assert reader.pokerhands(100)[0].strength == Hand(records[0][1][0] + records[0][0][:3]).evaluate_poker().strength, "An unevaluated record was not evaluated on read."
+
+    print("Hand History Round Trip Test Passed")
+
+def append_and_arrays():
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "hands.bin")
+        for seed in (1, 2):
+            with HandHistoryWriter(path, 2) as writer:
+                for board, holes in deal_records(50, 2, seed):
+                    writer.write(board, holes)
+        try:
+            HandHistoryWriter(path, 3)
+        except ValueError:
+            pass
+        else:
+            assert False, "Appending records with a different player count should raise ValueError."
+
+        with HandHistoryReader(path) as reader:
+            assert len(reader) == 100, f"Read {len(reader)} records after appending twice."
+            records = reader.arrays()
+            assert records.shape == (100,) and not records.flags.owndata, "arrays() should be a view of the file."
+            assert records['holes'].shape == (100, 2, 2), "Hole card array has the wrong shape."
+            board, holes, ranks = reader.record_ids(57)
+            assert tuple(records['board'][57]) == board and tuple(records['ranks'][57]) == ranks, "Array record 57 does not match record_ids."
+            assert len(reader.raw(10, 20)) == 10 * reader.record_size, "raw() returned the wrong number of bytes."
+            del records
+
+    print("Hand History Append Test Passed")
+
+
+if __name__ == "__main__":
+    test_sequence()
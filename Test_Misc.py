@@ -1,4 +1,5 @@
 from Card import Card, sort_cards
+from CardSet import CardSet, card_from_id
 from Deck import Deck
 from Suits import Diamonds, Hearts, Clubs, Spades
 
@@ -9,6 +10,8 @@ def test_sequence():
     deck = Deck()
     deck_creation(deck)
     deck_draw(deck)
+    deck_remove()
+    card_set()
 
 
 def card_sort():
@@ -62,6 +65,54 @@ def deck_draw(deck=Deck()):
 
     print("Draw Tests Passed")
 
+def deck_remove():
+    deck = Deck()
+    card = Card(12, Hearts)
+    assert deck.remove(card), f"{card} could not be removed."
+    assert not deck.contains(card), f"Deck contained {card} after it was removed."
+    assert not deck.remove(card), f"{card} was removed twice."
+    assert (s := deck.size) == 51, f"Deck has {s} cards after removing 1."
+    assert not deck.remaining() & CardSet([card]), f"Remaining cards contained {card}."
+
+    drawn = deck.draw(51)
+    assert not any(c & card for c in drawn), f"{card} was drawn after being removed."
+    assert deck.size == 0, "Deck should be empty."
+
+    assert deck.bury(card) and deck.add(Card(3, Clubs)), "Adding cards the deck did not hold returned False."
+    assert deck.contains(card), f"Deck did not contain buried {card}."
+    assert (c := deck.draw()) & Card(3, Clubs), f"Drew {c} instead of the card added on top."
+    assert (c := deck.draw()) & card, f"Drew {c} instead of the buried card."
+
+    deck = Deck()
+    deck.remove(card)
+    deck.add(card)
+    assert deck.size == 52, f"Deck has {deck.size} cards after removing and adding a card."
+    assert deck.draw() & card, f"{card} was not on top after being added back."
+
+    deck = Deck()
+    assert not deck.add(card) and not deck.bury(card), f"{card} was added to a deck already holding it."
+    assert deck.size == 52, f"Deck has {deck.size} cards after adding a card it held."
+    drawn = deck.draw(52)
+    assert len(CardSet(drawn)) == 52, "A card was drawn twice."
+
+    print("Remove Tests Passed")
+
+def card_set():
+    full = CardSet.full()
+    assert len(full) == 52, f"Full CardSet has {len(full)} cards."
+    for i in range(52):
+        assert card_from_id(i).id == i, f"Card id {i} did not round trip."
+
+    spades = CardSet([Card(value, Spades) for value in range(2, 15)])
+    aces = CardSet([Card(14, suit) for suit in (Diamonds, Hearts, Clubs, Spades)])
+    assert len(spades | aces) == 16, "Union has the wrong size."
+    assert list(spades & aces)[0] & Card(14, Spades), "Intersection should be the Ace of Spades."
+    assert len(spades - aces) == 12, "Difference has the wrong size."
+    assert Card(14, Hearts) in aces and Card(13, Hearts) not in aces, "Membership test failed."
+    assert len(full - spades - aces) == 36, "Repeated difference has the wrong size."
+
+    print("CardSet Tests Passed")
+
 
 if __name__ == "__main__":
     test_sequence()
\ No newline at end of file
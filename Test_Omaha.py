@@ -0,0 +1,70 @@
+"""Test functions for Omaha evaluation."""
+
+import itertools
+import random
+
+from Card import get_card_dict
+from CardSet import CardSet
+from Deck import Deck
+from Hand import Hand
+import Omaha
+from PokerHands import Flush, Straight
+
+
+def test_sequence():
+    two_plus_three()
+    brute_force_check()
+
+
+def two_plus_three():
+    c = get_card_dict()
+    # Four hearts on board but only one in the hand: no flush
+    board = [c['H2'], c['H4'], c['H9'], c['HKing'], c['S5']]
+    result = Omaha.evaluate_poker([c['HAce'], c['S3'], c['D10'], c['CJack']], board)
+    assert type(result) is Straight, f"Expected a wheel straight, got {type(result).__name__}."
+
+    result = Omaha.evaluate_poker([c['HAce'], c['HQueen'], c['D5'], c['C3']], board)
+    assert type(result) is Flush, f"Expected a flush, got {type(result).__name__}."
+
+    # Trips on the board with a pocket pair play as a full house of two board cards and the pair
+    board = [c['S8'], c['H8'], c['D8'], c['C2'], c['H3']]
+    assert Omaha.evaluate([c['SAce'], c['DAce'], c['S10'], c['D9']], board) == Hand([c['SAce'], c['DAce'], c['S8'], c['H8'], c['D8']]).strength(), \
+        "Aces full should be the best hand."
+
+    try:
+        Omaha.evaluate([c['SAce'], c['DAce']], board)
+    except ValueError:
+        pass
+    else:
+        assert False, "Two hole cards should raise ValueError."
+
+    print("Two Plus Three Test Passed")
+
+def brute_force_check():
+    rng = random.Random(31)
+    for trial in range(300):
+        deck = Deck(rng=rng)
+        hole = deck.deal(4 + trial % 2)
+        board = deck.deal(3 + trial % 3)
+        expected = max(Hand(list(pair) + list(triple)).evaluate_poker()
+                       for pair in itertools.combinations(hole, 2) for triple in itertools.combinations(board, 3))
+        result = Omaha.evaluate_poker(hole, board)
+        assert result.strength == expected.strength and type(result) is type(expected), \
+            f"{hole} on {board}: got {type(result).__name__}, expected {type(expected).__name__}."
+        used = CardSet(result.cards)
+        assert len(used & CardSet(hole)) == 2 and len(used & CardSet(board)) == 3, \
+            "The hand does not use two hole cards and three board cards."
+
+    deck = Deck(rng=rng)
+    players = [deck.deal(4) for i in range(3)]
+    board = deck.deal(5)
+    assert len(CardSet([card for hole in players for card in hole] + board)) == 17, "A card was dealt twice."
+    ranked = Omaha.showdown(board, players)
+    strengths = [Omaha.evaluate(hole, board) for hole in players]
+    assert strengths[ranked[0][0]] == max(strengths), "Showdown winner is not the best hand."
+
+    print("Brute Force Omaha Test Passed")
+
+
+if __name__ == "__main__":
+    test_sequence()
@@ -0,0 +1,76 @@
+"""Test functions for the outs analyser."""
+
+import itertools
+import random
+
+from Card import get_card_dict
+from CardSet import CardSet
+from Deck import Deck
+from Evaluator import FLUSH, STRAIGHT, category, evaluate
+from Outs import outs
+
+
+def test_sequence():
+    flush_draw()
+    brute_force_check()
+
+
+def flush_draw():
+    c = get_card_dict()
+    # Nut flush draw with an open ended straight draw
+    report = outs([c['HAce'], c['H10']], [c['HJack'], c['HQueen'], c['S3']])
+    assert len(report.improves[FLUSH]) == 8, f"{len(report.improves[FLUSH])} flush outs instead of 8 (the 9th heart makes a royal flush)."
+    assert len(report.improves[STRAIGHT]) == 3, f"{len(report.improves[STRAIGHT])} straight outs instead of 3."
+    assert c['HKing'] in report.outs, "The royal flush card is missing from the outs."
+    assert len(report.unseen) == 47, f"{len(report.unseen)} unseen cards instead of 47."
+
+    villain = [c['SAce'], c['DAce']]
+    report = outs([c['HAce'], c['H10']], [c['HJack'], c['HQueen'], c['S3']], opponents=[villain])
+    assert report.leading is False, "Pocket aces lead this flop."
+    assert len(report.unseen) == 45, "Opponent cards should not be unseen."
+    assert all(card not in report.winners for card in villain), "Opponent cards counted as winners."
+
+    print("Flush Draw Test Passed")
+
+def brute_force_check():
+    rng = random.Random(99)
+    for trial in range(30):
+        deck = Deck(rng=rng)
+        hole = deck.deal(2)
+        opponent = deck.deal(2)
+        board = deck.deal(3 if trial % 2 else 4)
+        report = outs(hole, board, opponents=[opponent])
+        unseen = list(report.unseen)
+        assert len(unseen) == 52 - 4 - len(board), "Wrong unseen cards."
+
+        current = category(evaluate(hole + board))
+        next_counts = dict()
+        expected_outs = CardSet()
+        expected_winners = CardSet()
+        for card in unseen:
+            strength = evaluate(hole + board + [card])
+            next_counts[category(strength)] = next_counts.get(category(strength), 0) + 1
+            if category(strength) > current:
+                expected_outs.add(card)
+            if strength >= evaluate(opponent + board + [card]):
+                expected_winners.add(card)
+        assert report.outs == expected_outs, f"Outs differ on {board} with {hole}."
+        assert report.winners == expected_winners, f"Winning cards differ on {board} with {hole}."
+        for cat, count in next_counts.items():
+            assert abs(report.next_card[cat] - count / len(unseen)) < 1e-9, "Next card odds differ."
+
+        if len(board) == 3:
+            river_counts = dict()
+            for pair in itertools.combinations(unseen, 2):
+                cat = category(evaluate(hole + board + list(pair)))
+                river_counts[cat] = river_counts.get(cat, 0) + 1
+            pairs = len(unseen) * (len(unseen) - 1) // 2
+            assert set(river_counts) == set(report.by_river), "River categories differ."
+            for cat, count in river_counts.items():
+                assert abs(report.by_river[cat] - count / pairs) < 1e-9, f"River odds differ on {board} with {hole}."
+
+    print("Brute Force Outs Test Passed")
+
+
+if __name__ == "__main__":
+    test_sequence()
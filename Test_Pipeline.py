@@ -0,0 +1,74 @@
+"""Test functions for the Pipeline showdown stages. Requires numpy."""
+
+import os
+import random
+import tempfile
+
+from Deck import Deck
+from Hand import Hand
+from HandHistory import HandHistoryReader, HandHistoryWriter
+from Pipeline import EMPTY_SEAT, rescore_file, showdowns
+
+
+def test_sequence():
+    streaming_showdowns()
+    empty_seats()
+
+
+def streaming_showdowns():
+    rng = random.Random(31)
+    deals = []
+    for i in range(500):
+        deck = Deck(rng=rng)
+        holes = [deck.deal(2) for p in range(4)]
+        deals.append((deck.deal(5), holes))
+
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "hands.bin")
+        with HandHistoryWriter(path, 4) as writer:
+            for board, holes in deals:
+                writer.write(board, holes, ranks=[0, 0, 0, 0])
+
+        for processes in (1, 2):
+            results = list(showdowns(path, chunk_records=64, processes=processes, max_pending=2))
+            assert len(results) == 500, f"Got {len(results)} showdowns from 500 records."
+            for (index, strengths, winners), (board, holes) in zip(results, deals):
+                hands = [Hand(hole + board).evaluate_poker() for hole in holes]
+                best = max(hands)
+                assert strengths == tuple(hand.strength for hand in hands), f"Record {index} strengths are wrong."
+                assert winners == tuple(p for p, hand in enumerate(hands) if hand == best), f"Record {index} winners are wrong."
+
+        rescored = os.path.join(directory, "rescored.bin")
+        assert rescore_file(path, rescored, chunk_records=100) == 500, "Rescoring did not write every record."
+        with HandHistoryReader(rescored) as reader:
+            for i in (0, 250, 499):
+                assert list(reader.record_ids(i)[2]) == list(results[i][1]), f"Rescored record {i} has the wrong ranks."
+
+    print("Streaming Showdown Test Passed")
+
+def empty_seats():
+    deck = Deck(seed=4)
+    # A royal flush on the board plays for everyone; the empty seat must not share the pot
+    board = [card for card in Deck(shuffle=False).deal(52) if card.id in (8, 9, 10, 11, 12)]
+    for card in board:
+        deck.remove(card)
+    holes = [deck.deal(2), [], deck.deal(2)]
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "hands.bin")
+        with HandHistoryWriter(path, 3) as writer:
+            writer.write(board, [holes[0], holes[2], holes[1]], ranks=[0, 0, 0])
+            writer.write(board, holes, ranks=[0, 0, 0])
+        results = list(showdowns(path))
+        assert results[0][2] == (0, 1), f"Live players should split, got winners {results[0][2]}."
+        assert results[1][1][1] == EMPTY_SEAT and results[1][2] == (0, 2), f"Empty seat was scored: {results[1]}."
+
+        rescored = os.path.join(directory, "rescored.bin")
+        rescore_file(path, rescored)
+        with HandHistoryReader(rescored) as reader:
+            assert reader.record_ids(1)[2][1] == 0, "Empty seat was given a rank."
+
+    print("Empty Seat Test Passed")
+
+
+if __name__ == "__main__":
+    test_sequence()
@@ -1,9 +1,11 @@
 """Test functions for Hands.Hand creation, Hands.Hand.evaulate_poker, PokerHands.PokerHand and children creation and comparison."""
 
+import random
+
 from Card import Card, get_card_dict
 from Deck import Deck
 from Hand import Hand
-from PokerHands import PokerHand
+from Showdown import showdown
 from Suits import Spades, Clubs, Hearts, Diamonds
 
 
@@ -65,17 +67,10 @@ def turn(table: Hand, hands: list):
     for hand in hands:
         pokerhands.append(hand.evaluate_poker())
     
-    winner = None
-    draw = []
-    for i, hand in enumerate(pokerhands):
-        try:
-            if winner is None:
-                winner = i
-            elif hand > pokerhands[winner]:
-                winner = i
-        except PokerHand.EqualHands:
-            winner = i
-            draw.append(winner)
+    # Each player's hand holds their 2 hole cards followed by the table
+    best = showdown(table, [hand.cards[:2] for hand in hands])[0]
+    winner = best[0]
+    draw = best if len(best) > 1 else []
     
     for i, hand in enumerate(hands):
         title_str = f"Player {i}: "
@@ -139,6 +134,101 @@ def test_cases():
 
     print("PokerHand Test Cases All Passed")
 
+def strength_sorting():
+    """Ensure PokerHands sort, max, and hash by strength without raising."""
+    c = get_card_dict()
+    hands = [
+        Hand([c['S5'], c['D2'], c['H9'], c['C10'], c['S4']]).evaluate_poker(),
+        Hand([c['S9'], c['D9'], c['H9'], c['CJack'], c['SJack']]).evaluate_poker(),
+        Hand([c['SAce'], c['D2'], c['H3'], c['C4'], c['S5']]).evaluate_poker(),
+        Hand([c['S6'], c['D2'], c['H3'], c['C4'], c['S5']]).evaluate_poker(),
+        Hand([c['D5'], c['H2'], c['C9'], c['S10'], c['D4']]).evaluate_poker()
+    ]
+
+    ordered = sorted(hands)
+    assert ordered[-1] is hands[1], f"[{ordered[-1]}] should sort highest."
+    assert max(hands) is hands[1], f"max() should be [{hands[1]}]."
+    assert hands[2] < hands[3], f"[{hands[2].full_str()}] should be worse than [{hands[3].full_str()}]."
+    assert hands[0] == hands[4], f"[{hands[0]}] should be equal to [{hands[4]}]."
+    assert hands[0] <= hands[4] and hands[0] >= hands[4], f"[{hands[0]}] should be <= and >= [{hands[4]}]."
+    assert len({hands[0], hands[4]}) == 1, "Equal hands should hash equally."
+
+    for hand in hands:
+        assert hand.strength == hand.strength_from_cards(), f"[{hand}] strength does not match its cards."
+
+    print("Strength Sorting Test Passed")
+
+def evaluator_cross_check(trials=20000):
+    """Compare the table-driven evaluate_poker against the histogram implementation over random 5, 6, and 7 card hands."""
+    random.seed(2024)
+    results = []
+    for i in range(trials):
+        deck = Deck()
+        hand = Hand(deck.draw(random.randint(5, 7)))
+
+        table = hand.evaluate_poker()
+        histogram = hand.evaluate_poker_histogram()
+        assert table.__class__ is histogram.__class__, f"[{hand}] evaluated to {table} by table but {histogram} by histogram."
+        assert table == histogram, f"[{hand}] evaluated to [{table.full_str()}] by table but [{histogram.full_str()}] by histogram."
+        results.append((table, histogram))
+
+    # Ordering between different hands must agree as well
+    for i in range(trials - 1):
+        table_a, histogram_a = results[i]
+        table_b, histogram_b = results[i + 1]
+        if table_a == table_b:
+            assert histogram_a == histogram_b, f"[{table_a}] and [{table_b}] should be equal."
+        else:
+            assert (table_a > table_b) == (histogram_a > histogram_b), f"[{table_a}] and [{table_b}] were ordered differently."
+
+    print("Evaluator Cross Check Passed")
+
+def incremental_state(trials=2000):
+    """Ensure adding and removing cards keeps Hand's running state in step with its cards."""
+    random.seed(99)
+    for i in range(trials):
+        deck = Deck()
+        hand = Hand(deck.draw(2))
+        for street in (3, 1, 1):
+            for card in deck.draw(street) if street > 1 else [deck.draw()]:
+                hand.add(card)
+            fresh = Hand(list(hand.cards))
+            assert hand.strength() == fresh.strength(), f"[{hand}] running state disagrees with a fresh Hand."
+
+        full = hand.strength()
+        last = hand.pop()
+        assert hand.strength() == Hand(list(hand.cards)).strength(), f"[{hand}] state is wrong after pop."
+        hand.add(last)
+        assert hand.strength() == full, f"[{hand}] state did not return after undoing a pop."
+
+        removed = hand.cards[random.randrange(len(hand))]
+        hand.remove(removed)
+        assert hand.strength() == Hand(list(hand.cards)).strength(), f"[{hand}] state is wrong after removing {removed}."
+
+        hand.add(removed)
+        assert hand.strength() == full, f"[{hand}] state did not return after adding {removed} back."
+
+    print("Incremental State Test Passed")
+
+def showdown_test(trials=2000):
+    """Ensure showdown tiers agree with evaluating and comparing every player's hand."""
+    random.seed(5)
+    for i in range(trials):
+        deck = Deck()
+        holes = [deck.draw(2) for p in range(random.randint(2, 10))]
+        table = deck.draw(5)
+        hands = [Hand(hole + table).evaluate_poker() for hole in holes]
+
+        result = showdown(table, holes)
+        assert sorted(p for tier in result for p in tier) == list(range(len(holes))), "Every player should be in exactly one tier."
+        for tier, next_tier in zip(result, result[1:]):
+            assert hands[tier[0]] > hands[next_tier[0]], "Tiers are not ordered best first."
+        for tier in result:
+            for p in tier:
+                assert hands[p] == hands[tier[0]], f"[{hands[p]}] and [{hands[tier[0]]}] share a tier but are not equal."
+
+    print("Showdown Test Passed")
+
 def straight_flush():
     """Ensure straight flush is detectable."""
     c = get_card_dict()
@@ -155,6 +245,10 @@ if __name__ == "__main__":
     try:
         # straight_flush()
         test_cases()
+        strength_sorting()
+        incremental_state()
+        showdown_test()
+        evaluator_cross_check()
         interactive_test()
     except EndTest:
         pass
\ No newline at end of file
@@ -0,0 +1,90 @@
+"""Test functions for the preflop equity tables."""
+
+import os
+import tempfile
+
+from Card import get_card_dict
+import Preflop
+from Preflop import CLASSES, DEFAULT_TRIALS, HEADER, PreflopTables, build_tables, class_index, standard_error
+
+
+def test_sequence():
+    class_lookup()
+    built_tables()
+
+
+def class_lookup():
+    assert len(CLASSES) == len(set(CLASSES)) == 169, "There should be 169 distinct classes."
+    assert class_index("AKs") == class_index("kas") == class_index("KAs"), "Class names should be normalized."
+    c = get_card_dict()
+    assert class_index((c['S2'], c['H2'])) == class_index("22"), "Cards did not map to their class."
+    assert class_index((c['DJack'], c['D10'])) == class_index("JTs"), "Cards did not map to their class."
+    for bad in ("AK", "AAs", "A1o", "AKx", ""):
+        try:
+            class_index(bad)
+        except ValueError:
+            pass
+        else:
+            assert False, f"{bad!r} should raise ValueError."
+
+    print("Class Lookup Test Passed")
+
+def built_tables():
+    tables = build_tables(trials=60, max_opponents=3, seed=17)
+    n = len(CLASSES)
+    for i in range(0, n, 7):
+        for j in range(0, n, 11):
+            total = tables.heads_up[i * n + j] + tables.heads_up[j * n + i]
+            assert abs(total - 1) < 1e-5, f"{CLASSES[i]} vs {CLASSES[j]} equities do not sum to 1."
+    assert abs(tables.equity("AA", "KK") - 0.82) < 0.1, f"AA vs KK equity {tables.equity('AA', 'KK')} is far from 0.82."
+    assert tables.equity("AA", "72o") > 0.75, "AA should crush 72o."
+    assert standard_error(DEFAULT_TRIALS) < 0.012 and standard_error(DEFAULT_TRIALS, heads_up=True) < 0.008, "The default tables are less accurate than documented."
+    assert tables.equity_vs_random("AA", 1) > tables.equity_vs_random("AA", 3), "Equity should fall with more opponents."
+    try:
+        tables.equity_vs_random("AA", 4)
+    except ValueError:
+        pass
+    else:
+        assert False, "Opponents past max_opponents should raise ValueError."
+
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "preflop.bin")
+        tables.save(path)
+        Preflop.set_path(path)
+        c = get_card_dict()
+        assert Preflop.equity((c['SAce'], c['HAce']), "KK") == tables.equity("AA", "KK"), "Loaded tables differ."
+        assert Preflop.equity_vs_random("72o", 2) == tables.equity_vs_random("72o", 2), "Loaded tables differ."
+        assert Preflop.tables().trials == 60, "Trials were not stored."
+
+        with open(path, 'r+b') as file:
+            file.write(HEADER.pack(b'PCPF', 99, 3, 169, 60))
+        try:
+            PreflopTables.load(path)
+        except ValueError:
+            pass
+        else:
+            assert False, "An unknown version should raise ValueError."
+        with open(path, 'r+b') as file:
+            file.write(HEADER.pack(b'PCPF', 1, 3, 168, 60))
+        try:
+            PreflopTables.load(path)
+        except ValueError as error:
+            assert "168" in str(error) and "version" not in str(error), f"Wrong error for a class count mismatch: {error}"
+        else:
+            assert False, "A class count mismatch should raise ValueError."
+
+        Preflop.set_path(os.path.join(directory, "missing.bin"))
+        try:
+            Preflop.equity("AA", "KK")
+        except FileNotFoundError:
+            pass
+        else:
+            assert False, "Missing tables should raise FileNotFoundError instead of being built."
+        assert not os.path.exists(os.path.join(directory, "missing.bin")), "Missing tables were built."
+    Preflop.set_path(Preflop.DEFAULT_PATH)
+
+    print("Built Tables Test Passed")
+
+
+if __name__ == "__main__":
+    test_sequence()
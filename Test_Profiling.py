@@ -0,0 +1,49 @@
+"""Test functions for the profiling counters."""
+
+from Deck import Deck
+from Hand import Hand
+import Profiling
+
+
+def test_sequence():
+    profiling_counters()
+
+
+def profiling_counters():
+    original = Hand.evaluate_poker
+    with Profiling.profiling():
+        assert Profiling.enabled(), "Profiling was not enabled."
+        deck = Deck(seed=3)
+        for i in range(10):
+            Hand(deck.deal(5)).evaluate_poker()
+        Hand(deck.deal(2)).evaluate_poker_histogram()
+    assert Hand.evaluate_poker is original, "Disabling did not restore Hand.evaluate_poker."
+
+    snap = Profiling.snapshot()
+    assert not snap["enabled"], "Snapshot says profiling is still enabled."
+    assert (n := snap["stages"]["Hand.evaluate_poker"]["calls"]) == 10, f"Counted {n} evaluate_poker calls instead of 10."
+    assert snap["stages"]["Hand.make_histograms"]["calls"] == 1, "make_histograms was not counted once."
+    assert sum(snap["categories"].values()) == 11, "Not every evaluation's category was counted."
+    assert snap["deck"]["Deck.deal"] == 11, f"Counted {snap['deck']['Deck.deal']} deals instead of 11."
+    assert snap["deck"]["Deck.draw"] == 0, "The draws made by deal were counted."
+
+    # Nothing is counted while disabled
+    Hand(Deck().deal(5)).evaluate_poker()
+    assert Profiling.snapshot()["stages"]["Hand.evaluate_poker"]["calls"] == 10, "A call was counted while disabled."
+    Profiling.reset()
+    assert Profiling.snapshot()["stages"]["Hand.evaluate_poker"]["calls"] == 0, "Reset did not zero the counters."
+
+    # A deal draws its cards, but only the deal is counted
+    with Profiling.profiling():
+        deck = Deck(shuffle=False)
+        deck.deal(3)
+        deck.draw()
+        deck.draw(2)
+    deck_calls = Profiling.snapshot()["deck"]
+    assert (deck_calls["Deck.deal"], deck_calls["Deck.draw"], deck_calls["Deck.shuffle"]) == (1, 2, 0), f"Wrong deck counts: {deck_calls}"
+
+    print("Profiling Counters Test Passed")
+
+
+if __name__ == "__main__":
+    test_sequence()
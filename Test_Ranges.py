@@ -0,0 +1,73 @@
+"""Test functions for Ranges parsing and combo expansion."""
+
+from Card import get_card_dict
+from Ranges import Range, class_combos, hand_class
+
+
+def test_sequence():
+    class_tables()
+    range_parsing()
+    dead_cards()
+    bad_ranges()
+
+
+def class_tables():
+    assert len(class_combos) == 169, f"There are {len(class_combos)} classes instead of 169."
+    assert sum(len(masks) for masks in class_combos.values()) == 1326, "Classes do not cover all 1326 combos."
+    for name, count in (("AA", 6), ("AKs", 4), ("72o", 12)):
+        assert len(class_combos[name]) == count, f"{name} has {len(class_combos[name])} combos instead of {count}."
+
+    c = get_card_dict()
+    assert hand_class(c['S10'], c['SAce']) == "ATs", "Suited class name is wrong."
+    assert hand_class(c['H7'], c['D2']) == "72o", "Offsuit class name is wrong."
+
+    print("Class Table Test Passed")
+
+def range_parsing():
+    samples = {
+        "QQ+": (18, ["QQ", "KK", "AA"]),
+        "A5s-A2s": (16, ["A2s", "A3s", "A4s", "A5s"]),
+        "ATs+": (16, ["ATs", "AJs", "AQs", "AKs"]),
+        "99-77": (18, ["77", "88", "99"]),
+        "AK": (16, ["AKs", "AKo"]),
+        "KQo, AsKh": (13, ["AKo", "KQo"]),
+        "QQ+, AKs, A5s-A2s, KQo": (50, ["QQ", "KK", "AA", "AKs", "A2s", "A3s", "A4s", "A5s", "KQo"])
+    }
+    for text, (count, classes) in samples.items():
+        result = Range(text)
+        assert len(result) == count, f'"{text}" expanded to {len(result)} combos instead of {count}.'
+        assert sorted(result.classes()) == sorted(classes), f'"{text}" covers {result.classes()}.'
+
+    weighted = Range("AKs, AKo:0.25, AKs:0.5")
+    weights = sorted(weight for a, b, weight in weighted.combo_ids())
+    assert weights == [0.25] * 12 + [0.5] * 4, "Weights were not applied or overridden correctly."
+
+    print("Range Parsing Test Passed")
+
+def dead_cards():
+    c = get_card_dict()
+    hands = Range("QQ+, AKs")
+    board = [c['SAce'], c['HQueen'], c['D2']]
+    live = hands.combos(board)
+    # AA loses 3 combos, QQ loses 3, AKs loses the spade combo
+    assert len(live) == 22 - 3 - 3 - 1, f"{len(live)} combos survived the board instead of 15."
+    for (first, second), weight in live:
+        assert not any(first is card or second is card for card in board), f"{first}, {second} uses a board card."
+    assert (c['SAce'], c['SKing']) in hands, "AsKs should be in the range."
+
+    print("Dead Card Test Passed")
+
+def bad_ranges():
+    for text in ("AAs", "XY", "AsAs", "AKs-KQs", "QQ-AK", "AK+-AQ"):
+        try:
+            Range(text)
+        except ValueError:
+            pass
+        else:
+            assert False, f'"{text}" should raise ValueError.'
+
+    print("Bad Range Test Passed")
+
+
+if __name__ == "__main__":
+    test_sequence()
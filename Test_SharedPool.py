@@ -0,0 +1,57 @@
+"""Test functions for the shared memory evaluation pool."""
+
+import numpy as np
+
+import Batch
+from Deck import Deck
+from Evaluator import evaluate
+from SharedPool import MIN_TASK_ROWS, SharedBatchPool
+
+
+def test_sequence():
+    pool_matches_batch()
+    in_place()
+
+
+def random_ids(rows: int, k: int, seed: int):
+    rng = np.random.default_rng(seed)
+    return np.argsort(rng.random((rows, 52)), axis=1)[:, :k]
+
+def pool_matches_batch():
+    ids = random_ids(3 * MIN_TASK_ROWS + 5, 7, seed=4)
+    expected, categories = Batch.evaluate_batch(ids)
+    for processes in (1, 2):
+        # A capacity smaller than the batch makes evaluate go round more than once
+        with SharedBatchPool(processes, capacity=2 * MIN_TASK_ROWS) as pool:
+            strengths, pool_categories = pool.evaluate(ids)
+            assert (strengths == expected).all(), f"Strengths differ from Batch with {processes} processes."
+            assert (pool_categories == categories).all(), "Categories differ from Batch."
+            strengths, _ = pool.evaluate(ids[:100, :5])
+            assert (strengths == Batch.evaluate_batch(ids[:100, :5])[0]).all(), "5 card hands after 7 card hands differ."
+
+    hands = [Deck(seed=i).deal(5 + i % 3) for i in range(200)]
+    with SharedBatchPool(1, capacity=64) as pool:
+        strengths, _ = pool.evaluate_hands(hands)
+        assert strengths.tolist() == [evaluate(hand) for hand in hands], "Mixed size hands were evaluated wrongly."
+        try:
+            pool.evaluate(ids[:, :4])
+        except ValueError:
+            pass
+        else:
+            assert False, "4 card hands should raise ValueError."
+
+    print("Pool Matches Batch Test Passed")
+
+def in_place():
+    ids = random_ids(2 * MIN_TASK_ROWS, 6, seed=9)
+    with SharedBatchPool(2, capacity=len(ids), width=6) as pool:
+        pool.ids[:] = ids
+        strengths = pool.evaluate_in_place(len(ids))
+        assert (strengths == Batch.evaluate_batch(ids)[0]).all(), "In place strengths differ from Batch."
+        del strengths
+
+    print("In Place Test Passed")
+
+
+if __name__ == "__main__":
+    test_sequence()
@@ -0,0 +1,74 @@
+"""Test functions for the asyncio table simulator."""
+
+import asyncio
+
+from Simulator import FOLD, Simulator, Table, always_stay, random_folder, simulate
+
+
+def test_sequence():
+    table_hands()
+    folding()
+    simulation_run()
+
+
+def table_hands():
+    table = Table(0, [always_stay] * 4, seed=7)
+    for i in range(50):
+        result = asyncio.run(table.play_hand())
+        cards = [card for hole in result.holes for card in hole] + result.board
+        assert len(result.board) == 5, "Board was not fully dealt with no folds."
+        assert len(set(card.id for card in cards)) == len(cards) == 13, "A card was dealt twice."
+        seats = sorted(seat for tier in result.tiers for seat in tier)
+        assert seats == [0, 1, 2, 3], f"Tiers {result.tiers} do not cover every seat."
+    assert table.hands_played == 50, f"Table counted {table.hands_played} hands instead of 50."
+
+    print("Table Hand Test Passed")
+
+def folding():
+    views = []
+
+    async def watcher(view):
+        views.append(view)
+        return FOLD
+
+    # Seat 0 folds preflop, so seat 1 wins without a showdown and is never asked
+    result = asyncio.run(Table(0, [watcher, watcher], seed=1).play_hand())
+    assert result.folded == [0], f"Folded seats were {result.folded}."
+    assert result.tiers == [[1]], f"Tiers were {result.tiers} instead of [[1]]."
+    assert result.board == [], "The board was dealt after everyone else folded."
+    assert len(views) == 1 and views[0].street == 'preflop', "The last player left was asked to act."
+
+    result = asyncio.run(Table(0, [random_folder(0.5, seed=3)] * 6, seed=2).play_hand())
+    assert len(result.folded) + sum(len(tier) for tier in result.tiers) == 6, "Seats went missing."
+
+    print("Folding Test Passed")
+
+def simulation_run():
+    results = []
+    stats = simulate(tables=20, players=6, hands=10, seed=5, on_result=results.append)
+    assert stats.hands == 200 == len(results), f"{stats.hands} hands played instead of 200."
+    assert stats.hands_per_sec() > 0 and stats.summary()["lag_samples"] >= 0, "Stats were not recorded."
+
+    again = []
+    simulate(tables=20, players=6, hands=10, seed=5, on_result=again.append)
+    # Compare card ids, since Cards of the same value compare equal whatever their suits
+    def deal(result):
+        return (result.table, result.hand_number, [card.id for card in result.board],
+                [[card.id for card in hole] for hole in result.holes], result.folded, result.tiers)
+    assert sorted(map(deal, results)) == sorted(map(deal, again)), "Seeded simulations differ."
+    other = []
+    simulate(tables=20, players=6, hands=10, seed=6, on_result=other.append)
+    assert sorted(map(deal, results)) != sorted(map(deal, other)), "Different seeds dealt the same cards."
+
+    async def stop_early():
+        simulator = Simulator(tables=5, players=3, policy=[always_stay] * 3)
+        asyncio.get_running_loop().call_later(0.05, simulator.stop)
+        return await simulator.run(duration=60)
+    stats = asyncio.run(stop_early())
+    assert stats.elapsed < 5, "stop() did not end the run."
+
+    print("Simulation Run Test Passed")
+
+
+if __name__ == "__main__":
+    test_sequence()
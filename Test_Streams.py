@@ -0,0 +1,43 @@
+"""Test functions for the random number streams."""
+
+import pickle
+
+from Deck import Deck
+from Streams import Stream
+
+
+def test_sequence():
+    rng_streams()
+
+
+def rng_streams():
+    master = Stream(42)
+    first = [master.spawn("table", i).random() for i in range(3)]
+    again = [Stream(42, ("table", i)).random() for i in reversed(range(3))][::-1]
+    assert first == again, "Streams depend on creation order."
+    assert len(set(first)) == 3, "Sibling streams gave the same numbers."
+    assert Stream(42).spawn(1).spawn(2).random() == Stream(42, (1, 2)).random(), "Spawning twice differs from the full path."
+    assert Stream(42, (1,)).random() != Stream(42, ("1",)).random(), "Int and string keys collide."
+
+    stream = Stream(7, ("worker", 3))
+    stream.random()
+    copy = pickle.loads(pickle.dumps(stream))
+    assert copy.path == stream.path and copy.random() == stream.random(), "Pickling lost the stream's position."
+    stream.restart()
+    assert stream.random() == Stream(7, ("worker", 3)).random(), "restart did not rewind the stream."
+
+    a = Deck(rng=Stream(9).spawn("deck")).deal(52)
+    b = Deck(rng=Stream(9).spawn("deck")).deal(52)
+    assert all(x is y for x, y in zip(a, b)), "Decks with the same stream were shuffled differently."
+    try:
+        Stream(1.5)
+    except TypeError:
+        pass
+    else:
+        assert False, "A float seed should raise TypeError."
+
+    print("RNG Streams Test Passed")
+
+
+if __name__ == "__main__":
+    test_sequence()